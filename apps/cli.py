@@ -4,11 +4,24 @@
 from __future__ import annotations
 
 import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
 
-from fm_toolkit.curves import ZeroCurve
-from fm_toolkit.fx_forwards import forward_rate, price_fx_forward
-from fm_toolkit.report import build_demo_report
-from fm_toolkit.swaps import VanillaSwap, par_swap_rate, swap_pv, swap_pv01
+# fm_toolkit modules are imported inside each command so that a command only
+# pays for the dependencies it uses (e.g. fx-forward never loads pandas).
+
+_STARTUP_TARGETS = {
+    "package": "import fm_toolkit",
+    "fx-forward": "from fm_toolkit.fx_forwards import forward_rate, price_fx_forward",
+    "swap": "from fm_toolkit.swaps import par_swap_rate, swap_pv, swap_pv01",
+    "marketdata": "from fm_toolkit.marketdata import TwelveDataProvider",
+    "demo": "from fm_toolkit.report import build_demo_report",
+}
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -32,10 +45,65 @@ def build_parser() -> argparse.ArgumentParser:
     swap_parser.add_argument("--payments-per-year", type=int, default=2)
     swap_parser.add_argument("--pay-fixed", action="store_true")
 
+    batch_parser = subparsers.add_parser(
+        "batch", help="Price a CSV/Parquet file of FX forwards in chunks"
+    )
+    batch_parser.add_argument("input", help="Trade file (.csv or .parquet)")
+    batch_parser.add_argument("output", help="Result file (.csv or .parquet)")
+    batch_parser.add_argument("--chunk-size", type=int, default=100_000)
+    batch_parser.add_argument("--workers", type=int, default=1)
+    batch_parser.add_argument(
+        "--keep-inputs",
+        action="store_true",
+        help="Copy every input column to the output, not just ids and results",
+    )
+    batch_parser.add_argument(
+        "--spot", type=float, help="Spot for files without a spot column"
+    )
+    batch_parser.add_argument(
+        "--domestic-rate", type=float, help="Rate for files without the column"
+    )
+    batch_parser.add_argument(
+        "--foreign-rate", type=float, help="Rate for files without the column"
+    )
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="Run the pricing benchmark suite and print JSON"
+    )
+    bench_parser.add_argument("--book-size", type=int, default=1_000)
+    bench_parser.add_argument("--pillars", type=int, default=10)
+    bench_parser.add_argument("--scenarios", type=int, default=100)
+    bench_parser.add_argument("--repeat", type=int, default=20)
+    bench_parser.add_argument("--seed", type=int, default=0)
+    bench_parser.add_argument(
+        "--only", nargs="+", metavar="NAME", help="Run only these benchmarks"
+    )
+    bench_parser.add_argument("--output", help="Also write the JSON report here")
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Run a local HTTP/JSON pricing server"
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8765)
+    serve_parser.add_argument(
+        "--warm", nargs="+", default=[], metavar="PAIR", help="Spots to prefetch"
+    )
+    serve_parser.add_argument("--quiet", action="store_true")
+
+    startup_parser = subparsers.add_parser(
+        "startup", help="Measure import time of the package and each command"
+    )
+    startup_parser.add_argument("--repeat", type=int, default=5)
+    startup_parser.add_argument(
+        "--json", action="store_true", help="Print results as JSON for tracking"
+    )
+
     return parser
 
 
 def run_fx_forward(args: argparse.Namespace) -> None:
+    from fm_toolkit.fx_forwards import forward_rate, price_fx_forward
+
     fair = forward_rate(
         spot=args.spot,
         domestic_rate=args.domestic_rate,
@@ -55,6 +123,9 @@ def run_fx_forward(args: argparse.Namespace) -> None:
 
 
 def run_swap(args: argparse.Namespace) -> None:
+    from fm_toolkit.curves import ZeroCurve
+    from fm_toolkit.swaps import VanillaSwap, par_swap_rate, swap_pv, swap_pv01
+
     curve = ZeroCurve(
         times=[1, 2, 3, 5, 10], zero_rates=[0.02, 0.022, 0.024, 0.026, 0.028]
     )
@@ -77,11 +148,101 @@ def run_swap(args: argparse.Namespace) -> None:
     print(f"Swap PV01 (+1bp): {pv01:,.2f}")
 
 
+def run_batch(args: argparse.Namespace) -> None:
+    from fm_toolkit.batch import price_fx_forward_file
+
+    defaults = {
+        name: value
+        for name, value in (
+            ("spot", args.spot),
+            ("domestic_rate", args.domestic_rate),
+            ("foreign_rate", args.foreign_rate),
+        )
+        if value is not None
+    }
+    stats = price_fx_forward_file(
+        args.input,
+        args.output,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        defaults=defaults,
+        keep_inputs=args.keep_inputs,
+    )
+    print(stats.summary())
+
+
+def run_bench(args: argparse.Namespace) -> None:
+    from fm_toolkit.bench import BenchConfig, benchmark_report, run_benchmarks
+
+    config = BenchConfig(
+        book_size=args.book_size,
+        pillars=args.pillars,
+        scenarios=args.scenarios,
+        repeat=args.repeat,
+        seed=args.seed,
+    )
+    report = json.dumps(
+        benchmark_report(run_benchmarks(config, only=args.only), config), indent=2
+    )
+    if args.output:
+        Path(args.output).write_text(report + "\n")
+    print(report)
+
+
+def run_serve(args: argparse.Namespace) -> None:
+    from fm_toolkit.server import serve
+
+    serve(host=args.host, port=args.port, warm_pairs=args.warm, verbose=not args.quiet)
+
+
+def _time_python(statement: str, repeat: int, env: dict[str, str]) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True, env=env)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def measure_startup(repeat: int = 5) -> dict[str, float]:
+    """Median import cost in ms per target, net of bare interpreter start-up.
+
+    Each sample runs in a fresh interpreter so nothing is already cached in
+    ``sys.modules``.
+    """
+
+    if repeat <= 0:
+        raise ValueError("repeat must be positive")
+
+    import fm_toolkit
+
+    env = dict(os.environ)
+    src = str(Path(fm_toolkit.__file__).resolve().parents[1])
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+
+    baseline = _time_python("pass", repeat, env)
+    return {
+        name: max(0.0, (_time_python(statement, repeat, env) - baseline) * 1e3)
+        for name, statement in _STARTUP_TARGETS.items()
+    }
+
+
+def run_startup(args: argparse.Namespace) -> None:
+    results = measure_startup(repeat=args.repeat)
+    if args.json:
+        print(json.dumps({name: round(ms, 2) for name, ms in results.items()}))
+        return
+    for name, ms in results.items():
+        print(f"{name:<12} {ms:8.1f} ms")
+
+
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
     if args.command in (None, "demo"):
+        from fm_toolkit.report import build_demo_report
+
         print(build_demo_report())
         return
 
@@ -93,6 +254,22 @@ def main() -> None:
         run_swap(args)
         return
 
+    if args.command == "batch":
+        run_batch(args)
+        return
+
+    if args.command == "bench":
+        run_bench(args)
+        return
+
+    if args.command == "serve":
+        run_serve(args)
+        return
+
+    if args.command == "startup":
+        run_startup(args)
+        return
+
     parser.error(f"Unknown command: {args.command}")
 
 
@@ -7,10 +7,16 @@ import streamlit as st
 
 from fm_toolkit.curves import ZeroCurve
 from fm_toolkit.fx_forwards import forward_rate, price_fx_forward
-from fm_toolkit.marketdata import get_live_spot, parse_pair
+from fm_toolkit.marketdata import CachedSpotProvider, TwelveDataProvider, parse_pair
 from fm_toolkit.report import build_fx_forward_client_note
 from fm_toolkit.scenarios import fx_forward_scenarios
-from fm_toolkit.swaps import VanillaSwap, par_swap_rate, swap_pv, swap_pv01
+from fm_toolkit.swaps import (
+    VanillaSwap,
+    par_rate_surface,
+    par_swap_rate,
+    swap_pv,
+    swap_pv01,
+)
 
 _COMMON_PAIRS = ["EUR/USD", "GBP/USD", "USD/JPY", "EUR/GBP", "AUD/USD"]
 
@@ -37,10 +43,15 @@ def _build_curve_from_table(table: pd.DataFrame, curve_name: str) -> ZeroCurve:
     return ZeroCurve.from_tenors(tenors=tenors, zero_rates=zero_rates)
 
 
-@st.cache_data(ttl=60)
+@st.cache_resource
+def _spot_provider() -> CachedSpotProvider:
+    # One provider per server process, shared by every session.
+    return CachedSpotProvider(TwelveDataProvider(), ttl=60.0)
+
+
 def _fetch_cached_spot(pair: str) -> tuple[float, str, str]:
     base, quote = parse_pair(pair)
-    return get_live_spot(base=base, quote=quote)
+    return _spot_provider().get_spot(base=base, quote=quote)
 
 
 st.set_page_config(page_title="FX & Rates Pricing Demo", layout="wide")
@@ -199,7 +210,12 @@ with swap_tab:
     notional_swap = s4.number_input("Notional", value=10_000_000.0, step=100_000.0)
     pay_fixed = st.checkbox("Pay Fixed", value=True)
 
-    par = par_swap_rate(curve, maturity_years, payments_per_year)
+    # The surface is cached per curve, so reruns quote the par rate by lookup.
+    surface = par_rate_surface(curve)
+    try:
+        par = surface.quote(maturity_years, payments_per_year)
+    except ValueError:
+        par = par_swap_rate(curve, maturity_years, payments_per_year)
     swap = VanillaSwap(
         notional=notional_swap,
         fixed_rate=fixed_rate,
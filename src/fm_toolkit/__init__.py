@@ -1,32 +1,118 @@
 """FX & Rates pricing demo package."""
 
-from .curves import ZeroCurve, parse_tenor
-from .fx_forwards import forward_rate, price_fx_forward
-from .marketdata import (
-    FrankfurterProvider,
-    SpotProvider,
-    TwelveDataProvider,
-    get_live_spot,
-    parse_pair,
-)
-from .report import build_fx_forward_client_note
-from .scenarios import fx_forward_scenarios
-from .swaps import VanillaSwap, par_swap_rate, swap_pv, swap_pv01
-
-__all__ = [
-    "ZeroCurve",
-    "parse_tenor",
-    "parse_pair",
-    "forward_rate",
-    "price_fx_forward",
-    "SpotProvider",
-    "FrankfurterProvider",
-    "TwelveDataProvider",
-    "get_live_spot",
-    "build_fx_forward_client_note",
-    "fx_forward_scenarios",
-    "VanillaSwap",
-    "par_swap_rate",
-    "swap_pv",
-    "swap_pv01",
-]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .curves import DiscountCurve, ShiftedCurve, ZeroCurve, parse_tenor
+    from .fx_forwards import (
+        FxMarket,
+        forward_rate,
+        forward_rates,
+        price_fx_forward,
+        price_fx_forwards,
+        price_fx_forwards_by_pair,
+    )
+    from .greeks import FxForwardGreeks, fx_forward_greeks
+    from .marketdata import (
+        CachedSpotProvider,
+        CacheStats,
+        FrankfurterProvider,
+        HedgedSpotProvider,
+        SpotProvider,
+        SpotSnapshot,
+        TokenBucket,
+        TwelveDataProvider,
+        build_session,
+        fetch_live_spots,
+        get_live_spot,
+        get_live_spots,
+        parse_pair,
+        spot_priority,
+    )
+    from .portfolio import FxForwardSlice, Portfolio, SwapSlice
+    from .report import build_fx_forward_client_note
+    from .repricing import FxSpotRepricer
+    from .scenarios import fx_forward_scenarios
+    from .schedules import Schedule, build_schedule, year_fraction
+    from .swaps import (
+        ParRateSurface,
+        SwapBookValues,
+        VanillaSwap,
+        par_rate_surface,
+        par_swap_rate,
+        price_swaps,
+        scheduled_swap_pv,
+        swap_pv,
+        swap_pv01,
+    )
+    from .tickstore import RecordingSpotProvider, ReplaySpotProvider, TickStore
+
+# Public names are resolved on first access so that `import fm_toolkit` does
+# not pull in numpy, requests or pandas until a feature needs them.
+_EXPORTS = {
+    "DiscountCurve": "curves",
+    "ShiftedCurve": "curves",
+    "ZeroCurve": "curves",
+    "parse_tenor": "curves",
+    "parse_pair": "marketdata",
+    "spot_priority": "marketdata",
+    "forward_rate": "fx_forwards",
+    "forward_rates": "fx_forwards",
+    "price_fx_forward": "fx_forwards",
+    "price_fx_forwards": "fx_forwards",
+    "price_fx_forwards_by_pair": "fx_forwards",
+    "FxMarket": "fx_forwards",
+    "FxForwardGreeks": "greeks",
+    "fx_forward_greeks": "greeks",
+    "SpotProvider": "marketdata",
+    "CachedSpotProvider": "marketdata",
+    "HedgedSpotProvider": "marketdata",
+    "TokenBucket": "marketdata",
+    "TickStore": "tickstore",
+    "RecordingSpotProvider": "tickstore",
+    "ReplaySpotProvider": "tickstore",
+    "CacheStats": "marketdata",
+    "SpotSnapshot": "marketdata",
+    "FrankfurterProvider": "marketdata",
+    "TwelveDataProvider": "marketdata",
+    "build_session": "marketdata",
+    "get_live_spot": "marketdata",
+    "get_live_spots": "marketdata",
+    "fetch_live_spots": "marketdata",
+    "Portfolio": "portfolio",
+    "FxForwardSlice": "portfolio",
+    "SwapSlice": "portfolio",
+    "FxSpotRepricer": "repricing",
+    "build_fx_forward_client_note": "report",
+    "fx_forward_scenarios": "scenarios",
+    "VanillaSwap": "swaps",
+    "par_swap_rate": "swaps",
+    "swap_pv": "swaps",
+    "swap_pv01": "swaps",
+    "price_swaps": "swaps",
+    "SwapBookValues": "swaps",
+    "par_rate_surface": "swaps",
+    "ParRateSurface": "swaps",
+    "scheduled_swap_pv": "swaps",
+    "Schedule": "schedules",
+    "build_schedule": "schedules",
+    "year_fraction": "schedules",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> object:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
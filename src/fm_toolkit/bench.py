@@ -0,0 +1,268 @@
+"""Reproducible micro-benchmarks for the pricing kernels."""
+
+from __future__ import annotations
+
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Callable, Iterable
+
+import numpy as np
+
+from .curves import ZeroCurve
+from .fx_forwards import price_fx_forward, price_fx_forwards
+from .swaps import VanillaSwap, price_swaps, swap_pv, swap_pv01
+
+
+@dataclass(frozen=True)
+class BenchConfig:
+    """Problem sizes and sampling for one benchmark run.
+
+    ``book_size`` is the number of trades priced per call, ``pillars`` the
+    number of curve nodes and ``scenarios`` the scenario-grid size. Each case
+    is timed ``repeat`` times after ``warmup`` untimed calls; inputs are
+    drawn from ``seed`` so runs are comparable.
+    """
+
+    book_size: int = 1_000
+    pillars: int = 10
+    scenarios: int = 100
+    repeat: int = 20
+    warmup: int = 2
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        for name in ("book_size", "pillars", "scenarios", "repeat"):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be positive")
+        if self.warmup < 0:
+            raise ValueError("warmup must be non-negative")
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """Timing for one case; an op is one trade (or trade-scenario) priced."""
+
+    name: str
+    ops_per_call: int
+    ops_per_second: float
+    p50_ms: float
+    p99_ms: float
+    peak_memory_bytes: int
+
+
+@dataclass(frozen=True)
+class _Case:
+    name: str
+    ops_per_call: int
+    run: Callable[[], object]
+
+
+def _build_cases(config: BenchConfig) -> list[_Case]:
+    rng = np.random.default_rng(config.seed)
+    n = config.book_size
+
+    times = np.linspace(0.25, 30.0, config.pillars)
+    domestic = ZeroCurve(times=times, zero_rates=0.03 + 0.01 * np.log1p(times) / 4)
+    foreign = ZeroCurve(times=times, zero_rates=0.015 + 0.01 * np.log1p(times) / 4)
+
+    notional = rng.uniform(1e5, 1e7, n)
+    strike = rng.uniform(1.0, 1.2, n)
+    maturity = rng.uniform(0.1, 10.0, n)
+    spot = 1.10
+    swaps = [
+        VanillaSwap(
+            notional=float(notional[i]),
+            fixed_rate=float(rng.uniform(0.01, 0.05)),
+            maturity_years=float(rng.integers(1, 31)),
+            payments_per_year=int(rng.choice([1, 2, 4])),
+            pay_fixed=bool(i % 2),
+        )
+        for i in range(n)
+    ]
+
+    swap_columns = {
+        name: np.array([getattr(swap, name) for swap in swaps])
+        for name in (
+            "notional",
+            "fixed_rate",
+            "maturity_years",
+            "payments_per_year",
+            "pay_fixed",
+        )
+    }
+
+    def curve_df() -> None:
+        for t in maturity.tolist():
+            domestic.df(t)
+
+    def fx_scalar() -> None:
+        for args in zip(notional.tolist(), strike.tolist(), maturity.tolist()):
+            price_fx_forward(
+                args[0],
+                args[1],
+                spot,
+                maturity_years=args[2],
+                domestic_curve=domestic,
+                foreign_curve=foreign,
+            )
+
+    def swaps_pv() -> None:
+        for swap in swaps:
+            swap_pv(swap, domestic)
+
+    def swaps_pv01() -> None:
+        for swap in swaps:
+            swap_pv01(swap, domestic)
+
+    def swaps_risk() -> None:
+        from .risk import swap_risk
+
+        swap_risk(swaps, domestic)
+
+    def scenario_grid() -> None:
+        from .scenarios import fx_forward_scenario_grid
+
+        shocks = np.linspace(-5.0, 5.0, config.scenarios)
+        bumps = np.linspace(-100.0, 100.0, config.scenarios)
+        fx_forward_scenario_grid(
+            notional_base=notional,
+            strike=strike,
+            spot=spot,
+            maturity_years=maturity,
+            domestic_curve=domestic,
+            foreign_curve=foreign,
+            spot_shocks_pct=shocks,
+            domestic_bumps_bps=bumps,
+            foreign_bumps_bps=-bumps,
+            cartesian=False,
+        )
+
+    def named_scenarios() -> None:
+        from .scenarios import fx_forward_scenarios
+
+        fx_forward_scenarios(
+            notional_base=1e6,
+            strike=1.12,
+            spot=spot,
+            maturity_years=1.0,
+            domestic_curve=domestic,
+            foreign_curve=foreign,
+        )
+
+    def client_note() -> None:
+        from .report import build_fx_forward_client_note
+
+        build_fx_forward_client_note(
+            pair="EUR/USD",
+            notional_base=1e6,
+            maturity_years=1.0,
+            strike=1.12,
+            spot=spot,
+            domestic_curve=domestic,
+            foreign_curve=foreign,
+        )
+
+    return [
+        _Case("curve_df", n, curve_df),
+        _Case("curve_dfs", n, lambda: domestic.dfs(maturity)),
+        _Case("price_fx_forward", n, fx_scalar),
+        _Case(
+            "price_fx_forwards",
+            n,
+            lambda: price_fx_forwards(
+                notional,
+                strike,
+                spot,
+                maturity_years=maturity,
+                domestic_curve=domestic,
+                foreign_curve=foreign,
+            ),
+        ),
+        _Case("swap_pv", n, swaps_pv),
+        _Case("swap_pv01", n, swaps_pv01),
+        _Case(
+            "price_swaps",
+            n,
+            lambda: price_swaps(
+                swap_columns["notional"],
+                swap_columns["fixed_rate"],
+                swap_columns["maturity_years"],
+                swap_columns["payments_per_year"],
+                swap_columns["pay_fixed"],
+                curve=domestic,
+            ),
+        ),
+        _Case("swap_risk", n, swaps_risk),
+        _Case("fx_forward_scenario_grid", n * config.scenarios, scenario_grid),
+        _Case("fx_forward_scenarios", 1, named_scenarios),
+        _Case("build_fx_forward_client_note", 1, client_note),
+    ]
+
+
+def bench_names() -> list[str]:
+    return [case.name for case in _build_cases(BenchConfig(book_size=1, pillars=2))]
+
+
+def _measure(case: _Case, config: BenchConfig) -> BenchResult:
+    for _ in range(config.warmup):
+        case.run()
+
+    samples = np.empty(config.repeat)
+    for i in range(config.repeat):
+        start = time.perf_counter()
+        case.run()
+        samples[i] = time.perf_counter() - start
+
+    # Peak allocation is taken on a separate call: tracemalloc slows the
+    # interpreter down too much to leave it on while timing.
+    tracemalloc.start()
+    try:
+        case.run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    p50, p99 = np.percentile(samples, [50, 99])
+    return BenchResult(
+        name=case.name,
+        ops_per_call=case.ops_per_call,
+        ops_per_second=case.ops_per_call / p50 if p50 > 0 else float("inf"),
+        p50_ms=float(p50 * 1e3),
+        p99_ms=float(p99 * 1e3),
+        peak_memory_bytes=int(peak),
+    )
+
+
+def run_benchmarks(
+    config: BenchConfig | None = None, only: Iterable[str] | None = None
+) -> list[BenchResult]:
+    """Time every benchmark case (or just those named in ``only``)."""
+
+    config = config or BenchConfig()
+    cases = _build_cases(config)
+    if only is not None:
+        wanted = set(only)
+        unknown = wanted - {case.name for case in cases}
+        if unknown:
+            raise ValueError(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+        cases = [case for case in cases if case.name in wanted]
+    return [_measure(case, config) for case in cases]
+
+
+def benchmark_report(
+    results: Iterable[BenchResult], config: BenchConfig
+) -> dict[str, object]:
+    """JSON-ready report with run metadata, for comparing between releases."""
+
+    return {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "config": asdict(config),
+        "results": [asdict(result) for result in results],
+    }
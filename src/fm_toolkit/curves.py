@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from dataclasses import InitVar, dataclass, field
 from math import exp
-from typing import Sequence
+from typing import Sequence, overload
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 
 _TENOR_PATTERN = re.compile(r"^\s*(\d+)\s*([DWMYdwmy])\s*$")
 
@@ -36,28 +41,257 @@ def parse_tenor(tenor: str) -> float:
     raise ValueError(f"unsupported tenor unit: {unit}")
 
 
-@dataclass
-class ZeroCurve:
-    """Continuously-compounded zero curve with linear interpolation."""
+def _readonly_array(values: ArrayLike) -> NDArray[np.float64]:
+    array = np.ascontiguousarray(values, dtype=np.float64).view()
+    array.flags.writeable = False
+    return array
+
+
+def _segment_slopes(
+    times: NDArray[np.float64], values: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    return _readonly_array(np.diff(values) / np.diff(times))
+
+
+def _interpolate(
+    times: NDArray[np.float64],
+    values: NDArray[np.float64],
+    slopes: NDArray[np.float64],
+    t: float,
+) -> float:
+    """Linear interpolation with flat extrapolation at a single point."""
+
+    if t <= times[0]:
+        return float(values[0])
+    if t >= times[-1]:
+        return float(values[-1])
+
+    idx = bisect_left(times, t) - 1
+    return float(values[idx] + (t - times[idx]) * slopes[idx])
+
+
+def _interpolate_array(
+    times: NDArray[np.float64],
+    values: NDArray[np.float64],
+    slopes: NDArray[np.float64],
+    ts: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """Vectorized counterpart of _interpolate with the same segment choice."""
+
+    if times.size == 1:
+        return np.full(ts.shape, values[0])
+
+    idx = np.clip(np.searchsorted(times, ts, side="left"), 1, times.size - 1) - 1
+    out = values[idx] + (ts - times[idx]) * slopes[idx]
+    out = np.where(ts <= times[0], values[0], out)
+    return np.where(ts >= times[-1], values[-1], out)
+
+
+def _slope_array(
+    times: NDArray[np.float64],
+    slopes: NDArray[np.float64],
+    ts: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """d/dt of _interpolate_array: the segment slope, zero where flat."""
+
+    if times.size == 1:
+        return np.zeros(ts.shape)
+
+    idx = np.clip(np.searchsorted(times, ts, side="left"), 1, times.size - 1) - 1
+    return np.where((ts <= times[0]) | (ts >= times[-1]), 0.0, slopes[idx])
+
+
+def _check_times(ts: NDArray[np.float64]) -> NDArray[np.float64]:
+    ts = ts.astype(np.float64, copy=False)
+    if np.any(ts <= 0):
+        raise ValueError("t must be positive")
+    return ts
+
+
+class DiscountCurve(ABC):
+    """Common interface for zero curves and lazily shifted curve views.
+
+    Subclasses provide interpolated zero rates; discounting, the array entry
+    points and bumping are shared.
+    """
+
+    __slots__ = ()
+
+    times: NDArray[np.float64]
+
+    @abstractmethod
+    def _rate(self, t: float) -> float:
+        """Zero rate at a single positive maturity."""
+
+    @abstractmethod
+    def _rates(self, ts: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Zero rates at an array of positive maturities."""
 
-    times: Sequence[float]
-    zero_rates: Sequence[float]
+    @abstractmethod
+    def _rate_slopes(self, ts: NDArray[np.float64]) -> NDArray[np.float64]:
+        """d zero_rate / dt at an array of positive maturities."""
+
+    @property
+    @abstractmethod
+    def zero_rates(self) -> NDArray[np.float64]:
+        """Zero rates at the curve pillars."""
+
+    @overload
+    def zero_rate(self, t: float) -> float: ...
+
+    @overload
+    def zero_rate(self, t: NDArray[np.float64]) -> NDArray[np.float64]: ...
+
+    def zero_rate(self, t):
+        """Interpolated zero rate for maturity t (in years).
+
+        Accepts a scalar or an array of maturities; arrays are interpolated in
+        one vectorized pass and return an array of the same shape.
+        """
+
+        if isinstance(t, np.ndarray):
+            return self._rates(_check_times(t))
+
+        t = float(t)
+        if t <= 0:
+            raise ValueError("t must be positive")
+        return self._rate(t)
+
+    @overload
+    def df(self, t: float) -> float: ...
+
+    @overload
+    def df(self, t: NDArray[np.float64]) -> NDArray[np.float64]: ...
+
+    def df(self, t):
+        """Discount factor under continuous compounding."""
+
+        if isinstance(t, np.ndarray):
+            return self.dfs(t)
+
+        rate = self.zero_rate(t)
+        return exp(-rate * t)
+
+    def zero_rates_at(self, ts: ArrayLike) -> NDArray[np.float64]:
+        """Vectorized zero rates for an array of maturities."""
+
+        return self._rates(_check_times(np.asarray(ts, dtype=np.float64)))
+
+    def dfs(self, ts: ArrayLike) -> NDArray[np.float64]:
+        """Vectorized discount factors for an array of maturities."""
+
+        ts = _check_times(np.asarray(ts, dtype=np.float64))
+        return np.exp(-self._rates(ts) * ts)
+
+    def discount_factor(self, t: float) -> float:
+        """Backward-compatible alias for df()."""
+
+        return self.df(t)
+
+    def instantaneous_forwards(self, ts: ArrayLike) -> NDArray[np.float64]:
+        """Instantaneous forward rates f(t) = r(t) + t * r'(t).
+
+        This is -d ln df(t) / dt. Within a segment the slope of that segment
+        is used, pillars take the slope of the segment ending there, and the
+        flat extrapolation regions have zero slope.
+        """
+
+        ts = _check_times(np.asarray(ts, dtype=np.float64))
+        return self._rates(ts) + ts * self._rate_slopes(ts)
+
+    def pillar_weights(self, ts: ArrayLike) -> NDArray[np.float64]:
+        """Interpolation weight of every pillar at each maturity.
+
+        Row i holds d zero_rate(ts[i]) / d pillar rate, so the matrix has shape
+        (len(ts), number of pillars) and each row sums to one.
+        """
+
+        ts = _check_times(np.atleast_1d(np.asarray(ts, dtype=np.float64)))
+        times = self.times
+        weights = np.zeros((ts.size, times.size))
+        rows = np.arange(ts.size)
+        if times.size == 1:
+            weights[:, 0] = 1.0
+            return weights
+
+        idx = np.clip(np.searchsorted(times, ts, side="left"), 1, times.size - 1) - 1
+        upper = np.clip((ts - times[idx]) / (times[idx + 1] - times[idx]), 0.0, 1.0)
+        weights[rows, idx] = 1.0 - upper
+        weights[rows, idx + 1] += upper
+        return weights
+
+    @abstractmethod
+    def shifted(self, bump_bp: float | ArrayLike) -> "ShiftedCurve":
+        """Shift in basis points, parallel (scalar) or per pillar (array)."""
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class ZeroCurve(DiscountCurve):
+    """Continuously-compounded zero curve with linear interpolation.
+
+    Pillars and rates are stored as read-only float64 arrays and the slope of
+    every interpolation segment is computed once at construction. Curves are
+    immutable and hash/compare by content.
+    """
+
+    times: NDArray[np.float64]
+    zero_rates: NDArray[np.float64]
+    _slopes: NDArray[np.float64] = field(init=False, repr=False)
+    _hash: int = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        self.times = tuple(float(t) for t in self.times)
-        self.zero_rates = tuple(float(r) for r in self.zero_rates)
+        times = np.array(self.times, dtype=np.float64).ravel()
+        rates = np.array(self.zero_rates, dtype=np.float64).ravel()
 
-        if len(self.times) != len(self.zero_rates):
+        if times.size != rates.size:
             raise ValueError("times and zero_rates must have the same length")
-        if len(self.times) < 1:
+        if times.size < 1:
             raise ValueError("curve requires at least one pillar")
-        if any(t <= 0 for t in self.times):
+        if np.any(times <= 0):
             raise ValueError("all times must be positive")
-        if list(self.times) != sorted(self.times):
+        gaps = np.diff(times)
+        if np.any(gaps < 0):
             raise ValueError("times must be sorted ascending")
-        if len(set(self.times)) != len(self.times):
+        if np.any(gaps == 0):
             raise ValueError("times must be unique")
 
+        self._set_arrays(times, rates)
+
+    def _set_arrays(self, times: ArrayLike, rates: ArrayLike) -> None:
+        times = _readonly_array(times)
+        rates = _readonly_array(rates)
+        # -0.0 and 0.0 compare equal, so normalise before hashing the bytes.
+        content_hash = hash(((times + 0.0).tobytes(), (rates + 0.0).tobytes()))
+
+        object.__setattr__(self, "times", times)
+        object.__setattr__(self, "zero_rates", rates)
+        object.__setattr__(self, "_slopes", _segment_slopes(times, rates))
+        object.__setattr__(self, "_hash", content_hash)
+
+    @classmethod
+    def from_arrays(cls, times: ArrayLike, zero_rates: ArrayLike) -> "ZeroCurve":
+        """Build a curve from already-validated pillar and rate arrays.
+
+        Skips the sortedness/uniqueness checks and does not copy contiguous
+        float64 input, so callers must pass positive, strictly increasing
+        times of the same length as zero_rates and must not mutate them
+        afterwards.
+        """
+
+        curve = cls.__new__(cls)
+        curve._set_arrays(times, zero_rates)
+        return curve
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ZeroCurve):
+            return NotImplemented
+        return np.array_equal(self.times, other.times) and np.array_equal(
+            self.zero_rates, other.zero_rates
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
     @classmethod
     def flat(cls, rate: float, max_years: int = 10) -> "ZeroCurve":
         """Build a flat curve on annual pillars."""
@@ -84,43 +318,111 @@ class ZeroCurve:
             zero_rates=[float(rate) for _, rate in pairs],
         )
 
-    def zero_rate(self, t: float) -> float:
-        """Interpolated zero rate for maturity t (in years)."""
+    def _rate(self, t: float) -> float:
+        return _interpolate(self.times, self.zero_rates, self._slopes, t)
 
-        t = float(t)
-        if t <= 0:
-            raise ValueError("t must be positive")
+    def _rates(self, ts: NDArray[np.float64]) -> NDArray[np.float64]:
+        return _interpolate_array(self.times, self.zero_rates, self._slopes, ts)
 
-        if t <= self.times[0]:
-            return self.zero_rates[0]
-        if t >= self.times[-1]:
-            return self.zero_rates[-1]
+    def _rate_slopes(self, ts: NDArray[np.float64]) -> NDArray[np.float64]:
+        return _slope_array(self.times, self._slopes, ts)
 
-        for idx in range(1, len(self.times)):
-            if t <= self.times[idx]:
-                t0, t1 = self.times[idx - 1], self.times[idx]
-                r0, r1 = self.zero_rates[idx - 1], self.zero_rates[idx]
-                weight = (t - t0) / (t1 - t0)
-                return r0 + weight * (r1 - r0)
+    def shifted(self, bump_bp: float | ArrayLike) -> "ShiftedCurve":
+        """Shift in basis points as a lazy view over this curve.
 
-        return self.zero_rates[-1]
+        A scalar applies a parallel shift; an array with one entry per pillar
+        shifts each pillar and is interpolated like the rates themselves.
+        """
 
-    def df(self, t: float) -> float:
-        """Discount factor under continuous compounding."""
+        return ShiftedCurve(self, bump_bp)
 
-        rate = self.zero_rate(t)
-        return exp(-rate * t)
 
-    def discount_factor(self, t: float) -> float:
-        """Backward-compatible alias for df()."""
+@dataclass(frozen=True, slots=True, eq=False)
+class ShiftedCurve(DiscountCurve):
+    """Zero-copy view of a ZeroCurve with a parallel and/or pillar-wise shift.
 
-        return self.df(t)
+    The base curve's arrays are shared and never revalidated, so bumping is
+    O(number of pillars) at most and O(1) for a parallel shift. Rates are
+    ``base.zero_rate(t) + shift(t)``, which is the same curve as shifting
+    every pillar rate and rebuilding.
+    """
 
-    def shifted(self, bump_bp: float) -> "ZeroCurve":
-        """Parallel shift in basis points."""
+    base: ZeroCurve
+    bump_bp: InitVar[float | ArrayLike] = 0.0
+    parallel_shift: float = field(init=False)
+    pillar_shifts: NDArray[np.float64] | None = field(init=False)
+    _shift_slopes: NDArray[np.float64] | None = field(init=False, repr=False)
 
-        shift = bump_bp * 1e-4
-        return ZeroCurve(
-            times=self.times,
-            zero_rates=[r + shift for r in self.zero_rates],
-        )
+    def __post_init__(self, bump_bp: float | ArrayLike) -> None:
+        if np.ndim(bump_bp) == 0:
+            self._set_shifts(float(bump_bp) * 1e-4, None)
+            return
+
+        pillar_shifts = np.asarray(bump_bp, dtype=np.float64) * 1e-4
+        if pillar_shifts.shape != self.base.times.shape:
+            raise ValueError("pillar bumps must have one entry per curve pillar")
+        self._set_shifts(0.0, pillar_shifts)
+
+    def _set_shifts(
+        self, parallel_shift: float, pillar_shifts: NDArray[np.float64] | None
+    ) -> None:
+        slopes = None
+        if pillar_shifts is not None:
+            pillar_shifts = _readonly_array(pillar_shifts)
+            slopes = _segment_slopes(self.base.times, pillar_shifts)
+
+        object.__setattr__(self, "parallel_shift", parallel_shift)
+        object.__setattr__(self, "pillar_shifts", pillar_shifts)
+        object.__setattr__(self, "_shift_slopes", slopes)
+
+    @property
+    def times(self) -> NDArray[np.float64]:
+        return self.base.times
+
+    @property
+    def zero_rates(self) -> NDArray[np.float64]:
+        rates = self.base.zero_rates + self.parallel_shift
+        if self.pillar_shifts is not None:
+            rates = rates + self.pillar_shifts
+        return rates
+
+    def _rate(self, t: float) -> float:
+        rate = self.base._rate(t) + self.parallel_shift
+        if self.pillar_shifts is not None:
+            rate += _interpolate(
+                self.base.times, self.pillar_shifts, self._shift_slopes, t
+            )
+        return rate
+
+    def _rates(self, ts: NDArray[np.float64]) -> NDArray[np.float64]:
+        rates = self.base._rates(ts) + self.parallel_shift
+        if self.pillar_shifts is not None:
+            rates += _interpolate_array(
+                self.base.times, self.pillar_shifts, self._shift_slopes, ts
+            )
+        return rates
+
+    def _rate_slopes(self, ts: NDArray[np.float64]) -> NDArray[np.float64]:
+        slopes = self.base._rate_slopes(ts)
+        if self.pillar_shifts is not None:
+            slopes = slopes + _slope_array(self.base.times, self._shift_slopes, ts)
+        return slopes
+
+    def shifted(self, bump_bp: float | ArrayLike) -> "ShiftedCurve":
+        """Stack a further shift; the result is still a view on the base."""
+
+        view = ShiftedCurve(self.base, bump_bp)
+        pillar_shifts = self.pillar_shifts
+        if view.pillar_shifts is not None:
+            pillar_shifts = (
+                view.pillar_shifts
+                if pillar_shifts is None
+                else pillar_shifts + view.pillar_shifts
+            )
+        view._set_shifts(self.parallel_shift + view.parallel_shift, pillar_shifts)
+        return view
+
+    def materialize(self) -> ZeroCurve:
+        """Concrete ZeroCurve with the shifted pillar rates."""
+
+        return ZeroCurve.from_arrays(self.times, self.zero_rates)
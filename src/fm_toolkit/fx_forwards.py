@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from .curves import ZeroCurve
+from dataclasses import dataclass
+from typing import Mapping
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .curves import DiscountCurve, ZeroCurve
 
 
 def _flat_curve_from_rate(
@@ -10,15 +16,15 @@ def _flat_curve_from_rate(
 ) -> ZeroCurve:
     if rate is None:
         raise ValueError(f"{rate_name} is required when {curve_name} is not provided")
-    return ZeroCurve(times=[1.0], zero_rates=[float(rate)])
+    return ZeroCurve.from_arrays([1.0], [float(rate)])
 
 
 def _resolve_curves(
-    domestic_curve: ZeroCurve | None,
-    foreign_curve: ZeroCurve | None,
+    domestic_curve: DiscountCurve | None,
+    foreign_curve: DiscountCurve | None,
     domestic_rate: float | None,
     foreign_rate: float | None,
-) -> tuple[ZeroCurve, ZeroCurve]:
+) -> tuple[DiscountCurve, DiscountCurve]:
     if domestic_curve is None:
         domestic_curve = _flat_curve_from_rate(
             domestic_rate, "domestic_rate", "domestic_curve"
@@ -36,8 +42,8 @@ def forward_rate(
     foreign_rate: float | None = None,
     maturity_years: float | None = None,
     *,
-    domestic_curve: ZeroCurve | None = None,
-    foreign_curve: ZeroCurve | None = None,
+    domestic_curve: DiscountCurve | None = None,
+    foreign_curve: DiscountCurve | None = None,
 ) -> float:
     """FX forward under discount-curve parity.
 
@@ -68,8 +74,8 @@ def price_fx_forward(
     foreign_rate: float | None = None,
     maturity_years: float | None = None,
     *,
-    domestic_curve: ZeroCurve | None = None,
-    foreign_curve: ZeroCurve | None = None,
+    domestic_curve: DiscountCurve | None = None,
+    foreign_curve: DiscountCurve | None = None,
 ) -> float:
     """Present value in domestic currency for a long-base FX forward.
 
@@ -90,11 +96,129 @@ def price_fx_forward(
         foreign_rate=foreign_rate,
     )
 
-    fair_fwd = forward_rate(
-        spot=spot,
+    if spot <= 0:
+        raise ValueError("spot must be positive")
+
+    discount = domestic_curve.df(maturity_years)
+    fair_fwd = spot * foreign_curve.df(maturity_years) / discount
+    return notional_base * (fair_fwd - strike) * discount
+
+
+@dataclass(frozen=True)
+class FxMarket:
+    """Spot and discount curves for one currency pair."""
+
+    spot: float
+    domestic_curve: DiscountCurve
+    foreign_curve: DiscountCurve
+
+
+def _as_positive_array(values: ArrayLike, name: str) -> NDArray[np.float64]:
+    array = np.asarray(values, dtype=np.float64)
+    if np.any(~(array > 0)):
+        raise ValueError(f"{name} must be positive")
+    return array
+
+
+def forward_rates(
+    spot: ArrayLike,
+    domestic_rate: float | None = None,
+    foreign_rate: float | None = None,
+    maturity_years: ArrayLike | None = None,
+    *,
+    domestic_curve: DiscountCurve | None = None,
+    foreign_curve: DiscountCurve | None = None,
+) -> NDArray[np.float64]:
+    """Vectorized forward_rate() over arrays of maturities (and spots)."""
+
+    if maturity_years is None:
+        raise ValueError("maturity_years must be positive")
+    maturity_years = _as_positive_array(maturity_years, "maturity_years")
+    spot = _as_positive_array(spot, "spot")
+
+    domestic_curve, foreign_curve = _resolve_curves(
         domestic_curve=domestic_curve,
         foreign_curve=foreign_curve,
-        maturity_years=maturity_years,
+        domestic_rate=domestic_rate,
+        foreign_rate=foreign_rate,
     )
-    discount = domestic_curve.df(maturity_years)
-    return notional_base * (fair_fwd - strike) * discount
+    return spot * foreign_curve.dfs(maturity_years) / domestic_curve.dfs(maturity_years)
+
+
+def price_fx_forwards(
+    notional_base: ArrayLike,
+    strike: ArrayLike,
+    spot: ArrayLike,
+    domestic_rate: float | None = None,
+    foreign_rate: float | None = None,
+    maturity_years: ArrayLike | None = None,
+    *,
+    domestic_curve: DiscountCurve | None = None,
+    foreign_curve: DiscountCurve | None = None,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Vectorized price_fx_forward() over columnar trade arrays.
+
+    Inputs broadcast against each other; spot may be a scalar or one value per
+    trade. Returns (fair forwards, PVs in domestic currency) and evaluates each
+    curve once for the whole batch.
+    """
+
+    notional_base = _as_positive_array(notional_base, "notional_base")
+    strike = _as_positive_array(strike, "strike")
+    if maturity_years is None:
+        raise ValueError("maturity_years must be positive")
+    maturity_years = _as_positive_array(maturity_years, "maturity_years")
+    spot = _as_positive_array(spot, "spot")
+
+    domestic_curve, foreign_curve = _resolve_curves(
+        domestic_curve=domestic_curve,
+        foreign_curve=foreign_curve,
+        domestic_rate=domestic_rate,
+        foreign_rate=foreign_rate,
+    )
+
+    discount = domestic_curve.dfs(maturity_years)
+    fair_fwd = spot * foreign_curve.dfs(maturity_years) / discount
+    return fair_fwd, notional_base * (fair_fwd - strike) * discount
+
+
+def price_fx_forwards_by_pair(
+    pairs: ArrayLike,
+    notional_base: ArrayLike,
+    strike: ArrayLike,
+    maturity_years: ArrayLike,
+    *,
+    markets: Mapping[str, FxMarket],
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Batch-price forwards across currency pairs.
+
+    ``pairs`` labels each trade (e.g. "EUR/USD") and ``markets`` supplies the
+    spot and curve pair for every label. Trades are priced one pair-slice at a
+    time and results come back in input order.
+    """
+
+    labels, inverse = np.unique(np.asarray(pairs), return_inverse=True)
+    inverse = inverse.ravel()
+    notional_base = np.asarray(notional_base, dtype=np.float64)
+    strike = np.asarray(strike, dtype=np.float64)
+    maturity_years = np.asarray(maturity_years, dtype=np.float64)
+
+    order = np.argsort(inverse, kind="stable")
+    bounds = np.cumsum(np.bincount(inverse, minlength=labels.size))
+
+    fair_fwd = np.empty(inverse.size)
+    pv = np.empty(inverse.size)
+    for label, rows in zip(labels, np.split(order, bounds[:-1])):
+        market = markets.get(str(label))
+        if market is None:
+            raise ValueError(f"no market data supplied for pair {label}")
+
+        fair_fwd[rows], pv[rows] = price_fx_forwards(
+            notional_base[rows],
+            strike[rows],
+            market.spot,
+            maturity_years=maturity_years[rows],
+            domestic_curve=market.domestic_curve,
+            foreign_curve=market.foreign_curve,
+        )
+    return fair_fwd, pv
@@ -2,22 +2,112 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-
-import requests
-
-try:
-    from dotenv import load_dotenv
-except ImportError:  # pragma: no cover - optional dependency
-    load_dotenv = None
-
-if load_dotenv is not None:
+from functools import cache
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    import asyncio
+
+    import numpy as np
+    import requests
+
+# requests, numpy, asyncio and python-dotenv are imported where they are first
+# needed so that importing this module (e.g. for parse_pair) stays cheap.
+
+
+@cache
+def _load_dotenv() -> None:
+    """Load a .env file once, the first time credentials are looked up."""
+
+    try:
+        from dotenv import load_dotenv
+    except ImportError:  # pragma: no cover - optional dependency
+        return
     load_dotenv()
 
 
+_T = TypeVar("_T")
+
 _DEFAULT_TIMEOUT: tuple[float, float] = (3.05, 10.0)
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_default_session: requests.Session | None = None
+_default_session_lock = threading.Lock()
+
+
+def build_session(
+    pool_size: int = 10,
+    retries: int = 1,
+    backoff_factor: float = 0.2,
+    read_retries: int = 0,
+) -> requests.Session:
+    """Create a keep-alive session with a bounded connection pool.
+
+    Connections are reused across requests (and across providers sharing the
+    session), so repeat lookups skip the TCP/TLS handshake. Idempotent GETs
+    are retried up to ``retries`` times on connection errors and 429/5xx
+    responses, which fail fast. Read timeouts are not retried by default
+    (``read_retries=0``): a retry would double the worst-case wait before a
+    provider falls back.
+    """
+
+    if pool_size <= 0:
+        raise ValueError("pool_size must be positive")
+    if retries < 0 or read_retries < 0:
+        raise ValueError("retries must be non-negative")
+
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=read_retries,
+        status=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def default_session() -> requests.Session:
+    """Process-wide pooled session used when a provider is not given one."""
+
+    global _default_session
+    if _default_session is None:
+        with _default_session_lock:
+            if _default_session is None:
+                _default_session = build_session()
+    return _default_session
 
 
 def parse_pair(pair: str) -> tuple[str, str]:
@@ -52,13 +142,76 @@ class SpotProvider(ABC):
         """Return (spot, timestamp, source)."""
 
 
+@dataclass(frozen=True)
+class SpotSnapshot:
+    """Quotes for many currencies against one base, taken in one request.
+
+    ``rates[c]`` is the price of one unit of ``base`` in currency ``c``. Any
+    pair between quoted currencies (direct, inverse or cross) is derived
+    from these without further network calls.
+    """
+
+    base: str
+    rates: Mapping[str, float]
+    timestamp: str
+    source: str = "Frankfurter"
+    _units: dict[str, float] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        units = {self.base: 1.0}
+        for currency, rate in self.rates.items():
+            if rate <= 0:
+                raise ValueError(f"non-positive rate for {self.base}/{currency}")
+            units[currency] = float(rate)
+        object.__setattr__(self, "_units", units)
+
+    @property
+    def currencies(self) -> list[str]:
+        return list(self._units)
+
+    def cross_rates(self) -> tuple[list[str], np.ndarray]:
+        """Full cross-rate matrix: entry (i, j) is the spot of currency i in j."""
+
+        import numpy as np
+
+        currencies = self.currencies
+        units = np.array([self._units[c] for c in currencies])
+        return currencies, units[None, :] / units[:, None]
+
+    def get_spot(self, base: str, quote: str) -> tuple[float, str, str]:
+        """Derive (spot, timestamp, source) for any pair in the snapshot."""
+
+        base, quote = parse_pair(f"{base}/{quote}")
+        missing = [c for c in (base, quote) if c not in self._units]
+        if missing:
+            raise RuntimeError(
+                f"{self.source} snapshot for {self.base} has no rate for "
+                f"{', '.join(missing)}"
+            )
+
+        spot = self._units[quote] / self._units[base]
+        if base == self.base:
+            return spot, self.timestamp, self.source
+        if quote == self.base:
+            return spot, self.timestamp, f"{self.source} (inverted)"
+        return spot, self.timestamp, f"{self.source} (cross via {self.base})"
+
+
 class FrankfurterProvider(SpotProvider):
     """Spot provider backed by the Frankfurter API."""
 
     endpoint = "https://api.frankfurter.dev/v1/latest"
 
-    def __init__(self, timeout: tuple[float, float] = _DEFAULT_TIMEOUT) -> None:
+    def __init__(
+        self,
+        timeout: tuple[float, float] = _DEFAULT_TIMEOUT,
+        session: requests.Session | None = None,
+        endpoint: str | None = None,
+    ) -> None:
         self.timeout = timeout
+        self.session = session if session is not None else default_session()
+        if endpoint is not None:
+            self.endpoint = endpoint
 
     def get_spot(self, base: str, quote: str) -> tuple[float, str, str]:
         base, quote = parse_pair(f"{base}/{quote}")
@@ -90,12 +243,78 @@ class FrankfurterProvider(SpotProvider):
         ts = str(inverse_payload.get("date") or datetime.now(timezone.utc).isoformat())
         return spot, ts, "Frankfurter (inverted)"
 
-    def _request_latest(self, base: str, quote: str) -> dict[str, object]:
-        pair = f"{base}/{quote}"
-        params = {"base": base, "symbols": quote}
+    def get_snapshot(
+        self, base: str = "EUR", symbols: Iterable[str] | None = None
+    ) -> SpotSnapshot:
+        """Fetch quotes for many symbols against ``base`` in a single request.
+
+        With ``symbols=None`` every currency Frankfurter publishes is returned.
+        """
+
+        base = base.strip().upper()
+        wanted = sorted({s.strip().upper() for s in symbols or ()} - {base})
+        payload = self._request_latest(base, ",".join(wanted) or None)
+
+        raw_rates = payload.get("rates")
+        if not isinstance(raw_rates, dict):
+            raise RuntimeError(f"Frankfurter response missing rates for base {base}")
+        rates: dict[str, float] = {}
+        for currency in raw_rates:
+            rate, _ = self._extract_rate(payload, currency, f"{base}/{currency}")
+            if rate is not None:
+                rates[str(currency)] = rate
+
+        ts = str(payload.get("date") or datetime.now(timezone.utc).isoformat())
+        return SpotSnapshot(base=base, rates=rates, timestamp=ts)
+
+    def get_spots(
+        self, pairs: Iterable[str], base: str | None = None
+    ) -> dict[str, tuple[float, str, str] | Exception]:
+        """Resolve many pairs from one snapshot request.
+
+        The snapshot base defaults to EUR when any pair involves it (it is
+        Frankfurter's reference currency), otherwise to the most common
+        currency among the pairs. Pairs that cannot be derived map to the
+        exception raised for them.
+        """
+
+        results: dict[str, tuple[float, str, str] | Exception] = {}
+        parsed: dict[str, tuple[str, str]] = {}
+        for pair in pairs:
+            try:
+                parsed[pair] = parse_pair(pair)
+            except ValueError as exc:
+                results[pair] = exc
+        if not parsed:
+            return results
+
+        counts = Counter(c for legs in parsed.values() for c in legs)
+        if base is None:
+            base = "EUR" if "EUR" in counts else counts.most_common(1)[0][0]
+        try:
+            snapshot = self.get_snapshot(base, counts)
+        except RuntimeError as exc:
+            return {**results, **{pair: exc for pair in parsed}}
+
+        for pair, (pair_base, pair_quote) in parsed.items():
+            try:
+                results[pair] = snapshot.get_spot(pair_base, pair_quote)
+            except RuntimeError as exc:
+                results[pair] = exc
+        return results
+
+    def _request_latest(self, base: str, quote: str | None) -> dict[str, object]:
+        import requests
+
+        pair = f"{base}/{quote}" if quote else f"{base}/*"
+        params = {"base": base}
+        if quote:
+            params["symbols"] = quote
 
         try:
-            response = requests.get(self.endpoint, params=params, timeout=self.timeout)
+            response = self.session.get(
+                self.endpoint, params=params, timeout=self.timeout
+            )
             response.raise_for_status()
             payload = response.json()
         except requests.RequestException as exc:
@@ -128,8 +347,162 @@ class FrankfurterProvider(SpotProvider):
         return rate, ""
 
 
+class _SingleFlight:
+    """Collapse concurrent calls with the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight block on the same future and share its result or exception.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], _T]) -> tuple[_T, bool]:
+        """Return ``(result, shared)``; ``shared`` is True for followers."""
+
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result(), True
+
+        try:
+            future.set_result(fn())
+        except BaseException as exc:
+            future.set_exception(exc)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return future.result(), False
+
+
+_call_priority: ContextVar[int | None] = ContextVar("spot_priority", default=None)
+
+
+@contextmanager
+def spot_priority(priority: int) -> Iterator[None]:
+    """Run the enclosed spot lookups at ``priority`` on shared rate limiters.
+
+    Overrides the provider's own ``priority`` for calls made in this context
+    (thread or task), so one provider instance can serve interactive and
+    background work at different priorities without losing coalescing.
+    """
+
+    token = _call_priority.set(priority)
+    try:
+        yield
+    finally:
+        _call_priority.reset(token)
+
+
+class RateLimitExceeded(RuntimeError):
+    """Raised when a rate limiter denies a request within its wait budget."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket with priority-ordered waiting.
+
+    Holds up to ``capacity`` tokens, refilled continuously at
+    ``refill_per_second``. Callers that have to wait queue by priority
+    (higher first, then arrival order), so background refreshes never
+    starve interactive requests sharing the same bucket.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if refill_per_second <= 0:
+            raise ValueError("refill_per_second must be positive")
+
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._cond = threading.Condition()
+        self._waiters: list[tuple[int, int]] = []
+        self._sequence = itertools.count()
+
+    @classmethod
+    def per_minute(cls, credits: float) -> TokenBucket:
+        """Bucket allowing ``credits`` calls per minute, bursting up to that."""
+
+        return cls(capacity=credits, refill_per_second=credits / 60.0)
+
+    @property
+    def available(self) -> float:
+        with self._cond:
+            self._refill()
+            return self._tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        return self.acquire(tokens, timeout=0.0)
+
+    def acquire(
+        self, tokens: float = 1.0, timeout: float | None = None, priority: int = 0
+    ) -> bool:
+        """Take ``tokens``, waiting up to ``timeout`` seconds (None = forever).
+
+        Returns False if the tokens could not be obtained in time. The
+        timeout is measured on the bucket's clock, like the refill.
+        """
+
+        if not 0 < tokens <= self.capacity:
+            raise ValueError("tokens must be positive and at most capacity")
+        deadline = None if timeout is None else self._clock() + timeout
+
+        with self._cond:
+            ticket = (-priority, next(self._sequence))
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    self._refill()
+                    at_head = self._waiters[0] == ticket
+                    if at_head and self._tokens >= tokens:
+                        self._tokens -= tokens
+                        return True
+
+                    remaining = None if deadline is None else deadline - self._clock()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    delay = remaining
+                    if at_head:
+                        refill = (tokens - self._tokens) / self.refill_per_second
+                        delay = refill if delay is None else min(delay, refill)
+                    self._cond.wait(delay)
+            finally:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(
+            self.capacity, self._tokens + elapsed * self.refill_per_second
+        )
+        self._updated = now
+
+
 class TwelveDataProvider(SpotProvider):
-    """Spot provider backed by Twelve Data with Frankfurter fallback."""
+    """Spot provider backed by Twelve Data with Frankfurter fallback.
+
+    Pass a shared ``rate_limiter`` to stay inside the Twelve Data credit
+    quota: every HTTP call (including inverse lookups) takes one token,
+    waiting at most ``rate_limit_wait`` seconds at the given ``priority``
+    (or the one set by spot_priority() for the call) before the request
+    spills to the fallback provider. Concurrent calls for the same pair share
+    one upstream lookup, made at the first caller's priority.
+    """
 
     endpoint = "https://api.twelvedata.com/exchange_rate"
 
@@ -138,17 +511,35 @@ class TwelveDataProvider(SpotProvider):
         api_key: str | None = None,
         timeout: tuple[float, float] = _DEFAULT_TIMEOUT,
         fallback_provider: SpotProvider | None = None,
+        session: requests.Session | None = None,
+        endpoint: str | None = None,
+        rate_limiter: TokenBucket | None = None,
+        rate_limit_wait: float = 0.0,
+        priority: int = 0,
     ) -> None:
-        self.api_key = (
-            api_key if api_key is not None else os.getenv("TWELVEDATA_API_KEY")
-        )
+        if api_key is None:
+            _load_dotenv()
+            api_key = os.getenv("TWELVEDATA_API_KEY")
+        self.api_key = api_key
         self.timeout = timeout
+        self.session = session if session is not None else default_session()
+        if endpoint is not None:
+            self.endpoint = endpoint
         self.fallback_provider = fallback_provider or FrankfurterProvider(
-            timeout=timeout
+            timeout=timeout, session=self.session
         )
+        self.rate_limiter = rate_limiter
+        self.rate_limit_wait = rate_limit_wait
+        self.priority = priority
+        self._flight = _SingleFlight()
 
     def get_spot(self, base: str, quote: str) -> tuple[float, str, str]:
         base, quote = parse_pair(f"{base}/{quote}")
+        return self._flight.do((base, quote), lambda: self._get_spot(base, quote))[0]
+
+    def _get_spot(self, base: str, quote: str) -> tuple[float, str, str]:
+        import requests
+
         pair = f"{base}/{quote}"
 
         if not self.api_key:
@@ -156,6 +547,8 @@ class TwelveDataProvider(SpotProvider):
 
         try:
             payload = self._request_exchange_rate(pair)
+        except RateLimitExceeded as exc:
+            return self._fallback(base, quote, str(exc))
         except requests.RequestException as exc:
             return self._fallback(
                 base, quote, f"Twelve Data request failed for {pair}: {exc}"
@@ -173,7 +566,7 @@ class TwelveDataProvider(SpotProvider):
         inverse_pair = f"{quote}/{base}"
         try:
             inverse_payload = self._request_exchange_rate(inverse_pair)
-        except requests.RequestException as exc:
+        except (RateLimitExceeded, requests.RequestException) as exc:
             return self._fallback(
                 base,
                 quote,
@@ -215,8 +608,15 @@ class TwelveDataProvider(SpotProvider):
             ) from exc
 
     def _request_exchange_rate(self, pair: str) -> dict[str, object]:
+        priority = _call_priority.get()
+        if priority is None:
+            priority = self.priority
+        if self.rate_limiter is not None and not self.rate_limiter.acquire(
+            timeout=self.rate_limit_wait, priority=priority
+        ):
+            raise RateLimitExceeded(f"Twelve Data rate limit reached for {pair}")
         params = {"symbol": pair, "apikey": self.api_key}
-        response = requests.get(self.endpoint, params=params, timeout=self.timeout)
+        response = self.session.get(self.endpoint, params=params, timeout=self.timeout)
         response.raise_for_status()
         payload = response.json()
         if not isinstance(payload, dict):
@@ -255,8 +655,355 @@ class TwelveDataProvider(SpotProvider):
         return datetime.now(timezone.utc).isoformat()
 
 
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters reported by CachedSpotProvider.stats()."""
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    refreshes: int = 0
+    errors: int = 0
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    value: tuple[float, str, str]
+    fetched_at: float
+
+
+class CachedSpotProvider(SpotProvider):
+    """Thread-safe TTL cache in front of any SpotProvider.
+
+    Quotes younger than ``ttl`` seconds are served from memory. Between
+    ``ttl`` and ``ttl + stale_ttl`` the cached quote is still returned while
+    one background refresh runs; older entries are fetched synchronously.
+    Concurrent misses for the same pair share a single upstream call.
+    Background refreshes run at ``refresh_priority`` (see spot_priority()),
+    below the default of 0, so on a shared rate limiter they queue behind
+    interactive lookups and spill to the fallback first.
+    """
+
+    def __init__(
+        self,
+        provider: SpotProvider,
+        ttl: float = 60.0,
+        stale_ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+        refresh_priority: int = -1,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if stale_ttl < 0:
+            raise ValueError("stale_ttl must be non-negative")
+
+        self.provider = provider
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.refresh_priority = refresh_priority
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], _CacheEntry] = {}
+        self._counts = Counter()
+        self._flight = _SingleFlight()
+        self._refreshing: set[tuple[str, str]] = set()
+
+    def get_spot(self, base: str, quote: str) -> tuple[float, str, str]:
+        key = parse_pair(f"{base}/{quote}")
+        with self._lock:
+            entry = self._entries.get(key)
+            age = None if entry is None else self._clock() - entry.fetched_at
+            if age is not None and age < self.ttl:
+                self._counts["hits"] += 1
+                return entry.value
+            if age is not None and age < self.ttl + self.stale_ttl:
+                self._counts["stale_hits"] += 1
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    threading.Thread(
+                        target=self._refresh_quietly, args=(key,), daemon=True
+                    ).start()
+                return entry.value
+            self._counts["misses"] += 1
+
+        value, shared = self._flight.do(key, lambda: self._fetch(key))
+        if shared:
+            with self._lock:
+                self._counts["coalesced"] += 1
+        return value
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**self._counts)
+
+    def invalidate(self, pair: str | None = None) -> None:
+        """Drop one pair, or every pair when ``pair`` is None."""
+
+        with self._lock:
+            if pair is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(parse_pair(pair), None)
+
+    def _fetch(self, key: tuple[str, str]) -> tuple[float, str, str]:
+        try:
+            value = self.provider.get_spot(*key)
+        except Exception:
+            with self._lock:
+                self._counts["errors"] += 1
+            raise
+        with self._lock:
+            self._counts["refreshes"] += 1
+            self._entries[key] = _CacheEntry(value, self._clock())
+        return value
+
+    def _refresh_quietly(self, key: tuple[str, str]) -> None:
+        # A failed background refresh keeps serving the stale quote until it
+        # ages out; the error is still counted in stats().
+        try:
+            with spot_priority(self.refresh_priority):
+                self._flight.do(key, lambda: self._fetch(key))
+        except Exception:
+            pass
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+
+class HedgedSpotProvider(SpotProvider):
+    """Race a fallback provider against a slow primary.
+
+    The primary is queried first; if it has not produced a valid quote
+    within ``hedge_delay`` seconds (or fails sooner) the fallback is
+    launched too, and the first valid quote wins. ``hedge_delay=0`` races
+    both from the start. A win by the fallback is reported by appending
+    " (hedged)" to its source. The losing call is cancelled if it has not
+    started; a request already on the wire is left to finish in the
+    background and its result is discarded. Primaries and hedges run on
+    separate pools of ``max_workers`` threads each, so hedges never queue
+    behind the stalled primaries they are racing.
+    """
+
+    def __init__(
+        self,
+        primary: SpotProvider,
+        fallback: SpotProvider,
+        hedge_delay: float = 0.5,
+        max_workers: int = 8,
+    ) -> None:
+        if hedge_delay < 0:
+            raise ValueError("hedge_delay must be non-negative")
+        if max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+
+        self.primary = primary
+        self.fallback = fallback
+        self.hedge_delay = hedge_delay
+        self._primary_executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hedged-spot-primary"
+        )
+        self._hedge_executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hedged-spot-hedge"
+        )
+
+    def get_spot(self, base: str, quote: str) -> tuple[float, str, str]:
+        base, quote = parse_pair(f"{base}/{quote}")
+        pair = f"{base}/{quote}"
+
+        primary = self._primary_executor.submit(self.primary.get_spot, base, quote)
+        if self.hedge_delay > 0:
+            wait([primary], timeout=self.hedge_delay)
+            if primary.done() and _valid_quote(primary):
+                return primary.result()
+        hedge = self._hedge_executor.submit(self.fallback.get_spot, base, quote)
+
+        pending = {primary, hedge}
+        errors: list[str] = []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if _valid_quote(future):
+                    for loser in pending:
+                        loser.cancel()
+                    spot, ts, source = future.result()
+                    if future is hedge:
+                        source = f"{source} (hedged)"
+                    return spot, ts, source
+                errors.append(_describe_failure(future))
+
+        raise RuntimeError(f"All providers failed for {pair}: {'; '.join(errors)}")
+
+    def close(self) -> None:
+        self._primary_executor.shutdown(wait=False, cancel_futures=True)
+        self._hedge_executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _valid_quote(future: Future) -> bool:
+    if future.exception() is not None:
+        return False
+    spot = future.result()[0]
+    return isinstance(spot, (int, float)) and 0 < spot < float("inf")
+
+
+def _describe_failure(future: Future) -> str:
+    exc = future.exception()
+    if exc is None:
+        return f"invalid spot {future.result()[0]!r}"
+    return str(exc) or type(exc).__name__
+
+
 def get_live_spot(base: str, quote: str) -> tuple[float, str, str]:
     """Get spot with Twelve Data first and Frankfurter fallback."""
 
     provider = TwelveDataProvider()
     return provider.get_spot(base=base, quote=quote)
+
+
+SpotResult = tuple[float, str, str]
+
+
+def _run_in_thread(
+    loop: asyncio.AbstractEventLoop,
+    fn: Callable[..., _T],
+    *args: object,
+    on_exit: Callable[[], object] | None = None,
+) -> asyncio.Future[_T]:
+    """Run ``fn`` on a new daemon thread and expose it as an asyncio future.
+
+    ``on_exit`` is called on the loop once the thread finishes, even if the
+    future was abandoned by then.
+    """
+
+    future = loop.create_future()
+
+    def settle(result: object, exc: BaseException | None) -> None:
+        if future.done():  # timed out or cancelled meanwhile
+            return
+        if exc is None:
+            future.set_result(result)
+        else:
+            future.set_exception(exc)
+
+    def run() -> None:
+        try:
+            outcome: tuple[object, BaseException | None] = (fn(*args), None)
+        except BaseException as exc:  # noqa: BLE001 - handed to the awaiting task
+            outcome = (None, exc)
+        try:
+            loop.call_soon_threadsafe(settle, *outcome)
+            if on_exit is not None:
+                loop.call_soon_threadsafe(on_exit)
+        except RuntimeError:  # loop already closed; nobody is waiting
+            pass
+
+    threading.Thread(target=run, name="fm-spot", daemon=True).start()
+    return future
+
+
+async def fetch_live_spots(
+    pairs: Iterable[str],
+    *,
+    provider: SpotProvider | None = None,
+    fallback_provider: SpotProvider | None = None,
+    max_workers: int = 8,
+    timeout: float = 15.0,
+) -> dict[str, SpotResult | Exception]:
+    """Fetch many pairs concurrently; async counterpart of get_live_spots."""
+
+    import asyncio
+
+    if max_workers <= 0:
+        raise ValueError("max_workers must be positive")
+    if provider is None:
+        provider = TwelveDataProvider()
+
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(max_workers)
+    # A call that timed out cannot be interrupted, so it keeps its provider's
+    # slot until its thread exits: each provider has at most max_workers
+    # requests in flight, abandoned ones included. Waiting for a slot is
+    # bounded by ``timeout`` too, so hung primaries push pairs to the fallback
+    # rather than queueing them behind the hung calls.
+    in_flight = {
+        id(source): asyncio.Semaphore(max_workers)
+        for source in (provider, fallback_provider)
+        if source is not None
+    }
+
+    async def call(source: SpotProvider, base: str, quote: str) -> SpotResult:
+        name = type(source).__name__
+        slots = in_flight[id(source)]
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout)
+        except asyncio.TimeoutError as exc:
+            raise TimeoutError(
+                f"{name} had no free slot within {timeout:g}s for {base}/{quote}: "
+                f"{max_workers} earlier calls are still running"
+            ) from exc
+        future = _run_in_thread(
+            loop, source.get_spot, base, quote, on_exit=slots.release
+        )
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError as exc:
+            raise TimeoutError(
+                f"{name} timed out after {timeout:g}s for {base}/{quote}"
+            ) from exc
+
+    async def fetch(pair: str) -> SpotResult:
+        base, quote = parse_pair(pair)
+        async with limit:
+            try:
+                return await call(provider, base, quote)
+            except Exception as exc:  # noqa: BLE001
+                if fallback_provider is None:
+                    raise
+                reason = exc
+            try:
+                spot, ts, source = await call(fallback_provider, base, quote)
+            except Exception as exc:  # noqa: BLE001
+                raise RuntimeError(
+                    f"{reason}. Fallback provider failed for {base}/{quote}: {exc}"
+                ) from exc
+            return spot, ts, f"{source} (fallback)"
+
+    requested = list(dict.fromkeys(pairs))
+    outcomes = await asyncio.gather(
+        *(fetch(pair) for pair in requested), return_exceptions=True
+    )
+    return dict(zip(requested, outcomes))
+
+
+def get_live_spots(
+    pairs: Iterable[str],
+    *,
+    provider: SpotProvider | None = None,
+    fallback_provider: SpotProvider | None = None,
+    max_workers: int = 8,
+    timeout: float = 15.0,
+) -> dict[str, SpotResult | Exception]:
+    """Fetch spots for many pairs concurrently.
+
+    At most ``max_workers`` pairs are fetched at once and each provider has at
+    most ``max_workers`` requests in flight, counting calls that timed out and
+    are still running on their threads; keep it within the session's
+    ``pool_size``. Each attempt gets ``timeout`` seconds to find a free slot
+    and ``timeout`` seconds from when its call starts. If the provider fails
+    and ``fallback_provider`` is given, that pair is retried on the fallback.
+    Returns ``{pair: (spot, timestamp, source)}`` with the exception in place
+    of the tuple for pairs that could not be fetched. Call fetch_live_spots()
+    instead from inside a running event loop.
+    """
+
+    import asyncio
+
+    return asyncio.run(
+        fetch_live_spots(
+            pairs,
+            provider=provider,
+            fallback_provider=fallback_provider,
+            max_workers=max_workers,
+            timeout=timeout,
+        )
+    )
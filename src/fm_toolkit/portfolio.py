@@ -0,0 +1,373 @@
+"""Columnar trade store for FX forward and swap books."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Hashable, Iterable, Mapping, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike, NDArray
+
+from .swaps import VanillaSwap
+
+_INITIAL_CAPACITY = 1024
+
+
+class _ColumnStore:
+    """Growable struct-of-arrays keyed by trade id.
+
+    Columns live in preallocated NumPy arrays that double when full, so
+    appends are amortized O(1). Removal moves the last row into the freed
+    slot, which keeps the live rows contiguous at the cost of row order.
+    """
+
+    def __init__(self, dtypes: Mapping[str, DTypeLike]) -> None:
+        self._columns = {
+            name: np.empty(_INITIAL_CAPACITY, dtype=dtype)
+            for name, dtype in dtypes.items()
+        }
+        self._ids: list[Hashable] = []
+        self._rows: dict[Hashable, int] = {}
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, trade_id: object) -> bool:
+        return trade_id in self._rows
+
+    @property
+    def ids(self) -> list[Hashable]:
+        return self._ids
+
+    def column(self, name: str) -> NDArray:
+        """Live rows of one column as a view (no copy)."""
+
+        return self._columns[name][: len(self._ids)]
+
+    def nbytes(self) -> int:
+        return sum(self.column(name).nbytes for name in self._columns)
+
+    def extend(
+        self, trade_ids: Sequence[Hashable], columns: Mapping[str, ArrayLike]
+    ) -> None:
+        start = len(self._ids)
+        count = len(trade_ids)
+        new_rows = {trade_id: start + i for i, trade_id in enumerate(trade_ids)}
+        if len(new_rows) != count:
+            raise ValueError("trade ids must be unique")
+        duplicates = new_rows.keys() & self._rows.keys()
+        if duplicates:
+            raise ValueError(f"trade id already present: {next(iter(duplicates))!r}")
+
+        self._reserve(start + count)
+        for name, values in columns.items():
+            self._columns[name][start : start + count] = values
+        self._ids.extend(trade_ids)
+        self._rows.update(new_rows)
+        self.version += 1
+
+    def remove(self, trade_id: Hashable) -> None:
+        row = self._rows.pop(trade_id)
+        last = len(self._ids) - 1
+        if row != last:
+            moved_id = self._ids[last]
+            for array in self._columns.values():
+                array[row] = array[last]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+        self._ids.pop()
+        self.version += 1
+
+    def _reserve(self, size: int) -> None:
+        capacity = next(iter(self._columns.values())).size
+        if size <= capacity:
+            return
+        while capacity < size:
+            capacity *= 2
+        for name, array in self._columns.items():
+            grown = np.empty(capacity, dtype=array.dtype)
+            grown[: len(self._ids)] = array[: len(self._ids)]
+            self._columns[name] = grown
+
+
+class _Labels:
+    """Small label <-> integer code registry for categorical columns."""
+
+    def __init__(self) -> None:
+        self.labels: list[str] = []
+        self._codes: dict[str, int] = {}
+
+    def encode(self, labels: Iterable[str]) -> NDArray[np.int32]:
+        codes = []
+        for label in labels:
+            code = self._codes.get(label)
+            if code is None:
+                code = self._codes[label] = len(self.labels)
+                self.labels.append(label)
+            codes.append(code)
+        return np.asarray(codes, dtype=np.int32)
+
+
+def _group_rows(codes: NDArray[np.int32]) -> list[tuple[int, NDArray[np.intp]]]:
+    if codes.size == 0:
+        return []
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    return [
+        (int(sorted_codes[start]), rows)
+        for start, rows in zip(starts, np.split(order, starts[1:]))
+    ]
+
+
+def _positive_columns(count: int, **columns: ArrayLike) -> dict[str, NDArray]:
+    arrays = {}
+    for name, values in columns.items():
+        array = np.asarray(values, dtype=np.float64)
+        if array.shape != (count,):
+            raise ValueError(f"{name} must have one value per trade")
+        if np.any(~(array > 0)):
+            raise ValueError(f"{name} must be positive")
+        arrays[name] = array
+    return arrays
+
+
+@dataclass(frozen=True)
+class FxForwardSlice:
+    """All FX forwards on one currency pair, as parallel arrays."""
+
+    pair: str
+    trade_ids: list[Hashable]
+    notional_base: NDArray[np.floating]
+    strike: NDArray[np.floating]
+    maturity_years: NDArray[np.floating]
+
+
+@dataclass(frozen=True)
+class SwapSlice:
+    """All swaps discounted on one curve, as parallel arrays."""
+
+    curve: str
+    trade_ids: list[Hashable]
+    notional: NDArray[np.floating]
+    fixed_rate: NDArray[np.floating]
+    maturity_years: NDArray[np.floating]
+    payments_per_year: NDArray[np.int16]
+    pay_fixed: NDArray[np.bool_]
+
+    def to_swaps(self) -> list[VanillaSwap]:
+        """Rebuild VanillaSwap objects for the scalar pricing API."""
+
+        return [
+            VanillaSwap(
+                notional=float(notional),
+                fixed_rate=float(fixed_rate),
+                maturity_years=float(maturity),
+                payments_per_year=int(frequency),
+                pay_fixed=bool(pay_fixed),
+            )
+            for notional, fixed_rate, maturity, frequency, pay_fixed in zip(
+                self.notional,
+                self.fixed_rate,
+                self.maturity_years,
+                self.payments_per_year,
+                self.pay_fixed,
+            )
+        ]
+
+
+class Portfolio:
+    """Book of FX forwards and swaps held in columnar form.
+
+    Each trade type is stored as a struct of arrays with one row per trade,
+    and trades are grouped by currency pair (FX forwards) or discount curve
+    (swaps) on demand so pricing and risk can run on whole slices. Pass
+    ``dtype=np.float32`` to halve the memory of the numeric columns; values
+    are upcast to float64 by the pricing functions. Swap maturities always
+    stay float64, since ``maturity_years * payments_per_year`` must round-trip
+    to an exact period count (7/12 is not representable in float32).
+    """
+
+    def __init__(self, dtype: DTypeLike = np.float64) -> None:
+        dtype = np.dtype(dtype)
+        if dtype not in (np.float32, np.float64):
+            raise ValueError("dtype must be float32 or float64")
+
+        self._pairs = _Labels()
+        self._curves = _Labels()
+        self._fx = _ColumnStore(
+            {
+                "pair": np.int32,
+                "notional_base": dtype,
+                "strike": dtype,
+                "maturity_years": dtype,
+            }
+        )
+        self._swaps = _ColumnStore(
+            {
+                "curve": np.int32,
+                "notional": dtype,
+                "fixed_rate": dtype,
+                "maturity_years": np.float64,
+                "payments_per_year": np.int16,
+                "pay_fixed": np.bool_,
+            }
+        )
+        self._fx_slices: tuple[int, dict[str, FxForwardSlice]] | None = None
+        self._swap_slices: tuple[int, dict[str, SwapSlice]] | None = None
+
+    def __len__(self) -> int:
+        return len(self._fx) + len(self._swaps)
+
+    def __contains__(self, trade_id: object) -> bool:
+        return trade_id in self._fx or trade_id in self._swaps
+
+    @property
+    def fx_forward_count(self) -> int:
+        return len(self._fx)
+
+    @property
+    def swap_count(self) -> int:
+        return len(self._swaps)
+
+    def add_fx_forward(
+        self,
+        trade_id: Hashable,
+        pair: str,
+        notional_base: float,
+        strike: float,
+        maturity_years: float,
+    ) -> None:
+        """Add a single long-base FX forward."""
+
+        self.add_fx_forwards(
+            [trade_id], [pair], [notional_base], [strike], [maturity_years]
+        )
+
+    def add_fx_forwards(
+        self,
+        trade_ids: Sequence[Hashable],
+        pairs: Sequence[str],
+        notional_base: ArrayLike,
+        strike: ArrayLike,
+        maturity_years: ArrayLike,
+    ) -> None:
+        """Bulk-add FX forwards from parallel columns."""
+
+        if len(pairs) != len(trade_ids):
+            raise ValueError("trade_ids and pairs must have the same length")
+        self._check_new_ids(trade_ids, self._swaps)
+        columns = _positive_columns(
+            len(trade_ids),
+            notional_base=notional_base,
+            strike=strike,
+            maturity_years=maturity_years,
+        )
+        columns["pair"] = self._pairs.encode(pairs)
+        self._fx.extend(trade_ids, columns)
+
+    def add_swap(
+        self, trade_id: Hashable, swap: VanillaSwap, curve: str = "default"
+    ) -> None:
+        """Add a swap discounted on the named curve."""
+
+        self.add_swaps([trade_id], [swap], curve=curve)
+
+    def add_swaps(
+        self,
+        trade_ids: Sequence[Hashable],
+        swaps: Sequence[VanillaSwap],
+        curve: str = "default",
+    ) -> None:
+        """Bulk-add swaps that share a discount curve."""
+
+        if len(trade_ids) != len(swaps):
+            raise ValueError("trade_ids and swaps must have the same length")
+        self._check_new_ids(trade_ids, self._fx)
+        self._swaps.extend(
+            trade_ids,
+            {
+                "curve": self._curves.encode([curve] * len(swaps)),
+                "notional": [swap.notional for swap in swaps],
+                "fixed_rate": [swap.fixed_rate for swap in swaps],
+                "maturity_years": [swap.maturity_years for swap in swaps],
+                "payments_per_year": [swap.payments_per_year for swap in swaps],
+                "pay_fixed": [swap.pay_fixed for swap in swaps],
+            },
+        )
+
+    def remove(self, trade_id: Hashable) -> None:
+        """Remove a trade by id in O(1)."""
+
+        if trade_id in self._fx:
+            self._fx.remove(trade_id)
+        elif trade_id in self._swaps:
+            self._swaps.remove(trade_id)
+        else:
+            raise KeyError(f"unknown trade id: {trade_id!r}")
+
+    def fx_forward_slices(self) -> dict[str, FxForwardSlice]:
+        """FX forwards grouped by currency pair, cached until the book changes."""
+
+        if self._fx_slices is not None and self._fx_slices[0] == self._fx.version:
+            return self._fx_slices[1]
+
+        ids = self._fx.ids
+        notional = self._fx.column("notional_base")
+        strike = self._fx.column("strike")
+        maturity = self._fx.column("maturity_years")
+        slices = {
+            self._pairs.labels[code]: FxForwardSlice(
+                pair=self._pairs.labels[code],
+                trade_ids=[ids[row] for row in rows],
+                notional_base=notional[rows],
+                strike=strike[rows],
+                maturity_years=maturity[rows],
+            )
+            for code, rows in _group_rows(self._fx.column("pair"))
+        }
+        self._fx_slices = (self._fx.version, slices)
+        return slices
+
+    def swap_slices(self) -> dict[str, SwapSlice]:
+        """Swaps grouped by discount curve, cached until the book changes."""
+
+        if (
+            self._swap_slices is not None
+            and self._swap_slices[0] == self._swaps.version
+        ):
+            return self._swap_slices[1]
+
+        ids = self._swaps.ids
+        columns = {
+            name: self._swaps.column(name)
+            for name in (
+                "notional",
+                "fixed_rate",
+                "maturity_years",
+                "payments_per_year",
+                "pay_fixed",
+            )
+        }
+        slices = {
+            self._curves.labels[code]: SwapSlice(
+                curve=self._curves.labels[code],
+                trade_ids=[ids[row] for row in rows],
+                **{name: values[rows] for name, values in columns.items()},
+            )
+            for code, rows in _group_rows(self._swaps.column("curve"))
+        }
+        self._swap_slices = (self._swaps.version, slices)
+        return slices
+
+    def nbytes(self) -> int:
+        """Bytes held by the live rows of all numeric columns."""
+
+        return self._fx.nbytes() + self._swaps.nbytes()
+
+    @staticmethod
+    def _check_new_ids(trade_ids: Sequence[Hashable], other: _ColumnStore) -> None:
+        for trade_id in trade_ids:
+            if trade_id in other:
+                raise ValueError(f"trade id already present: {trade_id!r}")
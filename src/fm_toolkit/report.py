@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
-import pandas as pd
+from typing import TYPE_CHECKING
 
-from .curves import ZeroCurve
+from .curves import DiscountCurve, ZeroCurve
 from .fx_forwards import forward_rate, price_fx_forward
 from .scenarios import fx_forward_scenarios
 from .swaps import VanillaSwap, par_swap_rate, swap_pv, swap_pv01
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 def _markdown_table(headers: list[str], rows: list[list[str]]) -> str:
     header_line = "| " + " | ".join(headers) + " |"
@@ -17,7 +20,7 @@ def _markdown_table(headers: list[str], rows: list[list[str]]) -> str:
     return "\n".join([header_line, divider_line, *body_lines])
 
 
-def _curve_points_table(curve: ZeroCurve, max_points: int = 5) -> str:
+def _curve_points_table(curve: DiscountCurve, max_points: int = 5) -> str:
     rows: list[list[str]] = []
     for t, r in list(zip(curve.times, curve.zero_rates))[:max_points]:
         rows.append([f"{t:.4f}", f"{r:.4%}"])
@@ -72,8 +75,8 @@ def build_fx_forward_client_note(
     maturity_years: float,
     strike: float,
     spot: float,
-    domestic_curve: ZeroCurve,
-    foreign_curve: ZeroCurve,
+    domestic_curve: DiscountCurve,
+    foreign_curve: DiscountCurve,
     fair_forward: float | None = None,
     pv: float | None = None,
     scenario_df: pd.DataFrame | None = None,
@@ -0,0 +1,180 @@
+"""Incremental FX forward repricing on spot ticks."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Hashable, Mapping, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .curves import DiscountCurve
+from .fx_forwards import FxMarket
+from .portfolio import Portfolio
+
+
+@dataclass
+class _PairBook:
+    trade_ids: list[Hashable]
+    notional_base: NDArray[np.float64]
+    strike: NDArray[np.float64]
+    maturity_years: NDArray[np.float64]
+    domestic_curve: DiscountCurve | None = None
+    foreign_curve: DiscountCurve | None = None
+    spot: float | None = None
+    # Per-trade PV = spot * spot_coeff - fixed_coeff, i.e. N*S*DFf - N*K*DFd.
+    spot_coeff: NDArray[np.float64] | None = field(default=None, repr=False)
+    fixed_coeff: NDArray[np.float64] | None = field(default=None, repr=False)
+    spot_coeff_sum: float = 0.0
+    fixed_coeff_sum: float = 0.0
+
+    @property
+    def ready(self) -> bool:
+        return self.spot is not None and self.spot_coeff is not None
+
+    def pv(self) -> float:
+        if not self.ready:
+            raise RuntimeError("spot and curves must be set before pricing")
+        return self.spot * self.spot_coeff_sum - self.fixed_coeff_sum
+
+
+class FxSpotRepricer:
+    """Live PV for an FX forward book driven by spot ticks.
+
+    For fixed curves the PV of a long-base forward is linear in spot,
+    ``N * (S * DFf(T) - K * DFd(T))``. The discount-factor coefficients are
+    cached per trade when curves change, so a spot tick only rescales the
+    per-pair sums: O(1) per tick for the pair PV and O(pairs) for the book.
+    """
+
+    def __init__(self, portfolio: Portfolio | None = None) -> None:
+        self._pairs: dict[str, _PairBook] = {}
+        if portfolio is not None:
+            for pair, trades in portfolio.fx_forward_slices().items():
+                self.set_trades(
+                    pair,
+                    trades.trade_ids,
+                    trades.notional_base,
+                    trades.strike,
+                    trades.maturity_years,
+                )
+
+    @property
+    def pairs(self) -> list[str]:
+        return list(self._pairs)
+
+    def set_trades(
+        self,
+        pair: str,
+        trade_ids: Sequence[Hashable],
+        notional_base: ArrayLike,
+        strike: ArrayLike,
+        maturity_years: ArrayLike,
+    ) -> None:
+        """Replace the trades held for one pair, keeping its market data."""
+
+        previous = self._pairs.get(pair)
+        book = _PairBook(
+            trade_ids=list(trade_ids),
+            notional_base=np.asarray(notional_base, dtype=np.float64),
+            strike=np.asarray(strike, dtype=np.float64),
+            maturity_years=np.asarray(maturity_years, dtype=np.float64),
+        )
+        self._pairs[pair] = book
+        if previous is not None:
+            book.spot = previous.spot
+            if previous.domestic_curve is not None:
+                self.update_curves(
+                    pair,
+                    domestic_curve=previous.domestic_curve,
+                    foreign_curve=previous.foreign_curve,
+                )
+
+    def update_curves(
+        self,
+        pair: str,
+        *,
+        domestic_curve: DiscountCurve | None = None,
+        foreign_curve: DiscountCurve | None = None,
+    ) -> None:
+        """Recompute cached coefficients for the curves that changed.
+
+        Only this pair's trades are touched, and a leg is skipped when its
+        curve equals the one already cached.
+        """
+
+        book = self._book(pair)
+        if (book.fixed_coeff is None and domestic_curve is None) or (
+            book.spot_coeff is None and foreign_curve is None
+        ):
+            raise ValueError(
+                f"both domestic and foreign curves are required for {pair}"
+            )
+
+        if domestic_curve is not None and (
+            book.fixed_coeff is None or domestic_curve != book.domestic_curve
+        ):
+            book.domestic_curve = domestic_curve
+            book.fixed_coeff = (
+                book.notional_base
+                * book.strike
+                * domestic_curve.dfs(book.maturity_years)
+            )
+            book.fixed_coeff_sum = float(book.fixed_coeff.sum())
+        if foreign_curve is not None and (
+            book.spot_coeff is None or foreign_curve != book.foreign_curve
+        ):
+            book.foreign_curve = foreign_curve
+            book.spot_coeff = book.notional_base * foreign_curve.dfs(
+                book.maturity_years
+            )
+            book.spot_coeff_sum = float(book.spot_coeff.sum())
+
+    def update_markets(self, markets: Mapping[str, FxMarket]) -> None:
+        """Apply spot and curves for several pairs at once."""
+
+        for pair, market in markets.items():
+            if pair not in self._pairs:
+                continue
+            self.update_curves(
+                pair,
+                domestic_curve=market.domestic_curve,
+                foreign_curve=market.foreign_curve,
+            )
+            self.on_spot(pair, market.spot)
+
+    def on_spot(self, pair: str, spot: float) -> float:
+        """Apply a spot tick and return the pair's new PV."""
+
+        if spot <= 0:
+            raise ValueError("spot must be positive")
+        book = self._book(pair)
+        book.spot = float(spot)
+        return book.pv()
+
+    def pair_pv(self, pair: str) -> float:
+        return self._book(pair).pv()
+
+    def pair_pvs(self) -> dict[str, float]:
+        """PV per pair for every pair with spot and curves set."""
+
+        return {pair: book.pv() for pair, book in self._pairs.items() if book.ready}
+
+    def book_pv(self) -> float:
+        """Total PV over all priced pairs."""
+
+        return sum(self.pair_pvs().values())
+
+    def trade_pvs(self, pair: str) -> NDArray[np.float64]:
+        """Per-trade PVs for one pair in a single vectorized multiply."""
+
+        book = self._book(pair)
+        if not book.ready:
+            raise RuntimeError("spot and curves must be set before pricing")
+        return book.spot * book.spot_coeff - book.fixed_coeff
+
+    def _book(self, pair: str) -> _PairBook:
+        try:
+            return self._pairs[pair]
+        except KeyError:
+            raise KeyError(f"no trades loaded for pair {pair}") from None
@@ -2,42 +2,157 @@
 
 from __future__ import annotations
 
-from .curves import ZeroCurve
-from .fx_forwards import price_fx_forward
-from .swaps import VanillaSwap, swap_pv01
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .curves import DiscountCurve
+from .greeks import fx_forward_greeks
+from .swaps import VanillaSwap, swap_cashflows, swap_pv01
+
+
+def _key_rate_pv_changes(
+    curve: DiscountCurve,
+    times: NDArray[np.float64],
+    amounts: NDArray[np.float64],
+    bump_bp: float,
+    present_values: NDArray[np.float64] | None = None,
+) -> NDArray[np.float64]:
+    """PV change of each cash flow for a bump of each pillar in turn.
+
+    Bumping pillar j by s moves the zero rate at t by s * w_j(t), so the
+    bumped discount factor is df(t) * exp(-s * w_j(t) * t). This is the exact
+    bump-and-reprice result, computed for every pillar at once. Pass
+    ``present_values`` (``amounts * df(times)``) if already computed.
+    """
+
+    weights = curve.pillar_weights(times)
+    if present_values is None:
+        present_values = amounts * curve.dfs(times)
+    return present_values[:, None] * np.expm1(
+        -bump_bp * 1e-4 * weights * times[:, None]
+    )
 
 
 def fx_forward_spot_delta(
     notional_base: float,
     strike: float,
     spot: float,
-    domestic_rate: float,
-    foreign_rate: float,
-    maturity_years: float,
+    domestic_rate: float | None = None,
+    foreign_rate: float | None = None,
+    maturity_years: float | None = None,
     rel_bump: float = 1e-4,
+    *,
+    domestic_curve: DiscountCurve | None = None,
+    foreign_curve: DiscountCurve | None = None,
 ) -> float:
-    """Finite-difference spot delta (PV change per +1.0 spot unit)."""
+    """Spot delta (PV change per +1.0 spot unit), N * DFf(T).
 
-    base_pv = price_fx_forward(
+    Computed in closed form; ``rel_bump`` is accepted for backward
+    compatibility with the old finite-difference version and is unused.
+    """
+
+    greeks = fx_forward_greeks(
         notional_base,
         strike,
         spot,
         domestic_rate,
         foreign_rate,
         maturity_years,
+        domestic_curve=domestic_curve,
+        foreign_curve=foreign_curve,
     )
-    bumped_pv = price_fx_forward(
-        notional_base,
-        strike,
-        spot * (1.0 + rel_bump),
-        domestic_rate,
-        foreign_rate,
-        maturity_years,
-    )
-    return (bumped_pv - base_pv) / (spot * rel_bump)
+    return float(greeks.spot_delta[0])
 
 
-def swap_parallel_dv01(swap: VanillaSwap, curve: ZeroCurve) -> float:
+def swap_parallel_dv01(swap: VanillaSwap, curve: DiscountCurve) -> float:
     """Dollar value change for a +1bp parallel shift."""
 
     return swap_pv01(swap=swap, curve=curve, bump_bp=1.0)
+
+
+@dataclass(frozen=True)
+class SwapRisk:
+    """Rate sensitivities of a swap book for a bump of ``bump_bp``.
+
+    ``pv01[i]`` is the PV change of swap i for a parallel bump and
+    ``key_rate_dv01s[i, j]`` its PV change when only pillar j is bumped.
+    """
+
+    pv01: NDArray[np.float64]
+    key_rate_dv01s: NDArray[np.float64]
+
+
+def swap_risk(
+    swaps: Sequence[VanillaSwap], curve: DiscountCurve, bump_bp: float = 1.0
+) -> SwapRisk:
+    """Parallel PV01 and key-rate DV01s for a book from one pass over its flows.
+
+    Both are the exact bump-and-reprice results in closed form (a parallel
+    bump s scales df(t) by exp(-s * t)), so no shifted curve is built and no
+    swap is repriced; the discounted cash flows are shared by both measures.
+    """
+
+    if len(swaps) == 0:
+        return SwapRisk(
+            pv01=np.zeros(0), key_rate_dv01s=np.zeros((0, curve.times.size))
+        )
+
+    offsets, times, amounts = swap_cashflows(swaps)
+    present_values = amounts * curve.dfs(times)
+    parallel = present_values * np.expm1(-bump_bp * 1e-4 * times)
+    key_rates = _key_rate_pv_changes(curve, times, amounts, bump_bp, present_values)
+    return SwapRisk(
+        pv01=np.add.reduceat(parallel, offsets[:-1]),
+        key_rate_dv01s=np.add.reduceat(key_rates, offsets[:-1], axis=0),
+    )
+
+
+def swap_key_rate_dv01s(
+    swaps: Sequence[VanillaSwap], curve: DiscountCurve, bump_bp: float = 1.0
+) -> NDArray[np.float64]:
+    """Key-rate DV01s for a book of swaps, shape (len(swaps), curve pillars).
+
+    Entry (i, j) is the PV change of swap i when only pillar j is bumped by
+    ``bump_bp``, evaluated for the whole book in one vectorized pass.
+    """
+
+    if len(swaps) == 0:
+        return np.zeros((0, curve.times.size))
+
+    offsets, times, amounts = swap_cashflows(swaps)
+    changes = _key_rate_pv_changes(curve, times, amounts, bump_bp)
+    return np.add.reduceat(changes, offsets[:-1], axis=0)
+
+
+def fx_forward_key_rate_dv01s(
+    notional_base: ArrayLike,
+    strike: ArrayLike,
+    spot: ArrayLike,
+    maturity_years: ArrayLike,
+    *,
+    domestic_curve: DiscountCurve,
+    foreign_curve: DiscountCurve,
+    bump_bp: float = 1.0,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Key-rate DV01s for FX forwards on the domestic and foreign curves.
+
+    Returns (domestic, foreign) matrices of shape (trades, pillars of the
+    respective curve). PV is ``N * (S * DFf(T) - K * DFd(T))`` so each leg is a
+    single discounted cash flow per trade.
+    """
+
+    notional_base = np.atleast_1d(np.asarray(notional_base, dtype=np.float64))
+    strike = np.atleast_1d(np.asarray(strike, dtype=np.float64))
+    maturity_years = np.atleast_1d(np.asarray(maturity_years, dtype=np.float64))
+    spot = np.asarray(spot, dtype=np.float64)
+
+    domestic = _key_rate_pv_changes(
+        domestic_curve, maturity_years, -notional_base * strike, bump_bp
+    )
+    foreign = _key_rate_pv_changes(
+        foreign_curve, maturity_years, notional_base * spot, bump_bp
+    )
+    return domestic, foreign
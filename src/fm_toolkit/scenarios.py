@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Sequence
 
-import pandas as pd
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 
-from .curves import ZeroCurve
-from .fx_forwards import price_fx_forward
+from .curves import DiscountCurve
+from .fx_forwards import _as_positive_array
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass
@@ -17,7 +22,9 @@ class MarketScenario:
     fx_spot_shock_pct: float = 0.0
 
 
-def apply_curve_scenario(curve: ZeroCurve, scenario: MarketScenario) -> ZeroCurve:
+def apply_curve_scenario(
+    curve: DiscountCurve, scenario: MarketScenario
+) -> DiscountCurve:
     return curve.shifted(scenario.parallel_rate_bump_bp)
 
 
@@ -31,8 +38,8 @@ def fx_forward_scenarios(
     strike: float,
     spot: float,
     maturity_years: float,
-    domestic_curve: ZeroCurve,
-    foreign_curve: ZeroCurve,
+    domestic_curve: DiscountCurve,
+    foreign_curve: DiscountCurve,
     spot_shock_pct: float = 1.0,
     rate_shock_bps: float = 25.0,
 ) -> pd.DataFrame:
@@ -46,15 +53,6 @@ def fx_forward_scenarios(
         Parallel curve bump in basis points.
     """
 
-    base_pv = price_fx_forward(
-        notional_base=notional_base,
-        strike=strike,
-        spot=spot,
-        maturity_years=maturity_years,
-        domestic_curve=domestic_curve,
-        foreign_curve=foreign_curve,
-    )
-
     scenario_defs = [
         (f"Spot -{spot_shock_pct:g}%", -spot_shock_pct, 0.0, 0.0),
         (f"Spot +{spot_shock_pct:g}%", spot_shock_pct, 0.0, 0.0),
@@ -75,30 +73,126 @@ def fx_forward_scenarios(
             0.0,
         ),
     ]
+    names, spot_shocks, domestic_bumps, foreign_bumps = zip(*scenario_defs)
 
-    rows: list[dict[str, float | str]] = []
-    for name, spot_shock_pct_value, domestic_bps, foreign_bps in scenario_defs:
-        shocked_spot = spot * (1.0 + spot_shock_pct_value / 100.0)
-        shocked_domestic_curve = domestic_curve.shifted(domestic_bps)
-        shocked_foreign_curve = foreign_curve.shifted(foreign_bps)
-
-        pv = price_fx_forward(
-            notional_base=notional_base,
-            strike=strike,
-            spot=shocked_spot,
-            maturity_years=maturity_years,
-            domestic_curve=shocked_domestic_curve,
-            foreign_curve=shocked_foreign_curve,
-        )
-        rows.append(
-            {
-                "Scenario name": name,
-                "Spot shock (pct)": spot_shock_pct_value,
-                "Domestic curve shock (bps)": domestic_bps,
-                "Foreign curve shock (bps)": foreign_bps,
-                "PV (domestic)": pv,
-                "PnL vs base": pv - base_pv,
-            }
+    return fx_forward_scenario_grid(
+        notional_base=notional_base,
+        strike=strike,
+        spot=spot,
+        maturity_years=maturity_years,
+        domestic_curve=domestic_curve,
+        foreign_curve=foreign_curve,
+        spot_shocks_pct=spot_shocks,
+        domestic_bumps_bps=domestic_bumps,
+        foreign_bumps_bps=foreign_bumps,
+        cartesian=False,
+        names=names,
+    )
+
+
+def _discounted_leg_by_bump(
+    curve: DiscountCurve,
+    maturity_years: NDArray[np.float64],
+    amounts: NDArray[np.float64],
+    bumps_bps: NDArray[np.float64],
+) -> NDArray[np.float64]:
+    """Sum of amounts * df(T) under each parallel bump, one value per bump.
+
+    A parallel shift s scales df(T) by exp(-s * T), so every bump reuses the
+    base discount factors.
+    """
+
+    present_values = amounts * curve.dfs(maturity_years)
+    return np.exp(-1e-4 * np.outer(bumps_bps, maturity_years)) @ present_values
+
+
+def fx_forward_scenario_grid(
+    *,
+    notional_base: ArrayLike,
+    strike: ArrayLike,
+    spot: float,
+    maturity_years: ArrayLike,
+    domestic_curve: DiscountCurve,
+    foreign_curve: DiscountCurve,
+    spot_shocks_pct: ArrayLike = (0.0,),
+    domestic_bumps_bps: ArrayLike = (0.0,),
+    foreign_bumps_bps: ArrayLike = (0.0,),
+    cartesian: bool = True,
+    names: Sequence[str] | None = None,
+) -> pd.DataFrame:
+    """Book PV/PnL for FX forwards over many spot and curve scenarios.
+
+    Parameters
+    ----------
+    notional_base, strike, maturity_years:
+        One value or one array entry per trade; the PV column is the book
+        total across trades.
+    spot_shocks_pct, domestic_bumps_bps, foreign_bumps_bps:
+        Shock vectors. With ``cartesian=True`` every combination is evaluated
+        (spot varies slowest); otherwise the vectors are aligned row by row.
+    names:
+        Optional scenario labels, one per scenario row, added as the first
+        column.
+
+    Each distinct curve bump is applied to the trades once, and the grid is
+    then filled by broadcasting, so a 50x50x50 grid costs 100 curve passes
+    rather than 125,000 repricings.
+    """
+
+    notional_base = _as_positive_array(notional_base, "notional_base")
+    strike = _as_positive_array(strike, "strike")
+    maturity_years = np.atleast_1d(_as_positive_array(maturity_years, "maturity_years"))
+    if spot <= 0:
+        raise ValueError("spot must be positive")
+    notional_base, strike, maturity_years = np.broadcast_arrays(
+        notional_base, strike, maturity_years
+    )
+
+    spot_shocks = np.asarray(spot_shocks_pct, dtype=np.float64).ravel()
+    domestic_bumps = np.asarray(domestic_bumps_bps, dtype=np.float64).ravel()
+    foreign_bumps = np.asarray(foreign_bumps_bps, dtype=np.float64).ravel()
+    if cartesian:
+        spot_shocks, domestic_bumps, foreign_bumps = (
+            axis.ravel()
+            for axis in np.meshgrid(
+                spot_shocks, domestic_bumps, foreign_bumps, indexing="ij"
+            )
         )
+    elif not spot_shocks.size == domestic_bumps.size == foreign_bumps.size:
+        raise ValueError("scenario vectors must have the same length")
+
+    domestic_values, domestic_index = np.unique(
+        np.r_[0.0, domestic_bumps], return_inverse=True
+    )
+    foreign_values, foreign_index = np.unique(
+        np.r_[0.0, foreign_bumps], return_inverse=True
+    )
+    domestic_leg = _discounted_leg_by_bump(
+        domestic_curve, maturity_years, notional_base * strike, domestic_values
+    )
+    foreign_leg = _discounted_leg_by_bump(
+        foreign_curve, maturity_years, notional_base, foreign_values
+    )
+
+    base_pv = spot * foreign_leg[foreign_index[0]] - domestic_leg[domestic_index[0]]
+    pv = (
+        spot * (1.0 + spot_shocks / 100.0) * foreign_leg[foreign_index[1:]]
+        - domestic_leg[domestic_index[1:]]
+    )
 
-    return pd.DataFrame(rows)
+    columns = {
+        "Spot shock (pct)": spot_shocks,
+        "Domestic curve shock (bps)": domestic_bumps,
+        "Foreign curve shock (bps)": foreign_bumps,
+        "PV (domestic)": pv,
+        "PnL vs base": pv - base_pv,
+    }
+    if names is not None:
+        if len(names) != pv.size:
+            raise ValueError("names must have one entry per scenario")
+        columns = {"Scenario name": list(names), **columns}
+
+    # pandas is only needed for the result table; keep it off the import path.
+    import pandas as pd
+
+    return pd.DataFrame(columns)
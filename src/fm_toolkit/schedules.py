@@ -0,0 +1,197 @@
+"""Payment schedules: dated periods, roll conventions and year fractions."""
+
+from __future__ import annotations
+
+import calendar
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+
+import numpy as np
+from numpy.typing import NDArray
+
+DAY_COUNTS = ("ACT/360", "ACT/365F", "30/360")
+ROLL_CONVENTIONS = ("unadjusted", "following", "modified_following", "preceding")
+
+
+def _readonly(values: list[float] | NDArray[np.float64]) -> NDArray[np.float64]:
+    array = np.asarray(values, dtype=np.float64)
+    array.flags.writeable = False
+    return array
+
+
+def _as_date(value: date | str) -> date:
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    return value
+
+
+def year_fraction(start: date, end: date, day_count: str = "ACT/365F") -> float:
+    """Accrual fraction between two dates under ``day_count``.
+
+    30/360 is the US bond basis: day 31 counts as 30, and an end date on the
+    31st counts as 30 only when the start date is also day 30 or 31.
+    """
+
+    if day_count == "ACT/360":
+        return (end - start).days / 360.0
+    if day_count == "ACT/365F":
+        return (end - start).days / 365.0
+    if day_count == "30/360":
+        d1 = min(start.day, 30)
+        d2 = min(end.day, 30) if d1 == 30 else end.day
+        days = 360 * (end.year - start.year) + 30 * (end.month - start.month)
+        return (days + d2 - d1) / 360.0
+    raise ValueError(f"day_count must be one of {', '.join(DAY_COUNTS)}")
+
+
+def adjust(day: date, roll: str = "modified_following") -> date:
+    """Move a date off the weekend under a business-day roll convention.
+
+    Only Saturdays and Sundays are treated as holidays.
+    """
+
+    if roll not in ROLL_CONVENTIONS:
+        raise ValueError(f"roll must be one of {', '.join(ROLL_CONVENTIONS)}")
+    if roll == "unadjusted" or day.weekday() < 5:
+        return day
+    preceding = day - timedelta(days=day.weekday() - 4)
+    following = day + timedelta(days=7 - day.weekday())
+    if roll == "preceding":
+        return preceding
+    if roll == "modified_following" and following.month != day.month:
+        return preceding
+    return following
+
+
+def _add_months(day: date, months: int) -> date:
+    month_index = day.month - 1 + months
+    year = day.year + month_index // 12
+    month = month_index % 12 + 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+@dataclass(frozen=True, eq=False)
+class Schedule:
+    """Dated payment schedule with precomputed year-fraction arrays.
+
+    ``accruals[i]`` is the day-count fraction of period i and ``times[i]``
+    the ACT/365F time from the effective date to payment i, i.e. the time
+    axis the discount curves use. Both arrays are read-only so a schedule can
+    be shared by every trade with the same terms. Schedules compare and hash
+    by their terms, from which the dates and arrays are derived.
+    """
+
+    effective: date
+    maturity: date
+    payments_per_year: int
+    roll: str
+    day_count: str
+    payment_dates: tuple[date, ...]
+    accruals: NDArray[np.float64]
+    times: NDArray[np.float64]
+
+    def __len__(self) -> int:
+        return len(self.payment_dates)
+
+    def _terms(self) -> tuple[date, date, int, str, str]:
+        return (
+            self.effective,
+            self.maturity,
+            self.payments_per_year,
+            self.roll,
+            self.day_count,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Schedule):
+            return NotImplemented
+        return self._terms() == other._terms()
+
+    def __hash__(self) -> int:
+        return hash(self._terms())
+
+    @property
+    def maturity_years(self) -> float:
+        return float(self.times[-1])
+
+
+def build_schedule(
+    effective: date | str,
+    maturity: date | str,
+    payments_per_year: int = 1,
+    roll: str = "modified_following",
+    day_count: str = "ACT/360",
+) -> Schedule:
+    """Generate (or reuse) the payment schedule for a set of terms.
+
+    Periods roll forward from ``effective`` every ``12 / payments_per_year``
+    months, clamped to month end, with a short final stub if the maturity is
+    not on the roll cycle. Payment dates are adjusted under ``roll`` and
+    accruals run between adjusted dates. Schedules are memoized, so a book of
+    trades with identical terms builds each schedule once.
+    """
+
+    effective = _as_date(effective)
+    maturity = _as_date(maturity)
+    if maturity <= effective:
+        raise ValueError("maturity must be after effective date")
+    if (
+        isinstance(payments_per_year, bool)
+        or not isinstance(payments_per_year, (int, np.integer))
+        or payments_per_year <= 0
+        or 12 % payments_per_year
+    ):
+        raise ValueError("payments_per_year must be one of 1, 2, 3, 4, 6, 12")
+    if roll not in ROLL_CONVENTIONS:
+        raise ValueError(f"roll must be one of {', '.join(ROLL_CONVENTIONS)}")
+    if day_count not in DAY_COUNTS:
+        raise ValueError(f"day_count must be one of {', '.join(DAY_COUNTS)}")
+    return _build_schedule(effective, maturity, int(payments_per_year), roll, day_count)
+
+
+@lru_cache(maxsize=1024)
+def _build_schedule(
+    effective: date, maturity: date, payments_per_year: int, roll: str, day_count: str
+) -> Schedule:
+    step = 12 // payments_per_year
+    unadjusted = []
+    k = 1
+    while (day := _add_months(effective, k * step)) < maturity:
+        unadjusted.append(day)
+        k += 1
+    unadjusted.append(maturity)
+
+    start = adjust(effective, roll)
+    payment_dates = tuple(adjust(day, roll) for day in unadjusted)
+    starts = (start, *payment_dates[:-1])
+    return Schedule(
+        effective=effective,
+        maturity=maturity,
+        payments_per_year=payments_per_year,
+        roll=roll,
+        day_count=day_count,
+        payment_dates=payment_dates,
+        accruals=_readonly(
+            [year_fraction(a, b, day_count) for a, b in zip(starts, payment_dates)]
+        ),
+        times=_readonly([(day - effective).days / 365.0 for day in payment_dates]),
+    )
+
+
+def period_times(maturity_years: float, payments_per_year: int) -> NDArray[np.float64]:
+    """Read-only payment times ``k / payments_per_year`` up to ``maturity_years``.
+
+    This is the undated year-fraction schedule VanillaSwap uses; arrays are
+    memoized per term so they are built once per (maturity, frequency).
+    """
+
+    periods = round(maturity_years * payments_per_year)
+    if abs(periods - maturity_years * payments_per_year) > 1e-9:
+        raise ValueError("maturity_years * payments_per_year must be an integer")
+    return _period_times(periods, payments_per_year)
+
+
+@lru_cache(maxsize=1024)
+def _period_times(periods: int, payments_per_year: int) -> NDArray[np.float64]:
+    return _readonly(np.arange(1, periods + 1) / payments_per_year)
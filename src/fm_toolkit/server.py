@@ -0,0 +1,376 @@
+"""Local HTTP/JSON pricing service with warm curves and spots."""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterable, Mapping
+
+import numpy as np
+
+from .curves import DiscountCurve, ZeroCurve
+from .fx_forwards import _flat_curve_from_rate, price_fx_forwards
+from .marketdata import CachedSpotProvider, SpotProvider, parse_pair
+from .swaps import price_swaps
+
+DEFAULT_CURVES = {
+    "default": ZeroCurve(
+        times=[1, 2, 3, 5, 10], zero_rates=[0.02, 0.022, 0.024, 0.026, 0.028]
+    ),
+}
+
+_MAX_BODY_BYTES = 16 * 1024 * 1024
+
+
+class PricingService:
+    """Pricing state shared by every request the server handles.
+
+    Curves are kept in memory by name and replaced atomically, and spots for
+    requests that name a pair without a spot are served through a
+    CachedSpotProvider, so repeat calls skip both curve construction and
+    network lookups.
+    """
+
+    def __init__(
+        self,
+        curves: Mapping[str, DiscountCurve] | None = None,
+        spot_provider: SpotProvider | None = None,
+        spot_ttl: float = 60.0,
+    ) -> None:
+        self._curves: dict[str, DiscountCurve] = dict(
+            DEFAULT_CURVES if curves is None else curves
+        )
+        self._lock = threading.Lock()
+        self._spot_provider = spot_provider
+        self._spot_ttl = spot_ttl
+        self.started = time.monotonic()
+        self.requests_served = 0
+
+    @property
+    def spot_provider(self) -> SpotProvider:
+        with self._lock:
+            if self._spot_provider is None:
+                from .marketdata import TwelveDataProvider
+
+                self._spot_provider = TwelveDataProvider()
+            if not isinstance(self._spot_provider, CachedSpotProvider):
+                self._spot_provider = CachedSpotProvider(
+                    self._spot_provider, ttl=self._spot_ttl
+                )
+            return self._spot_provider
+
+    def warm_spots(self, pairs: Iterable[str]) -> dict[str, str]:
+        """Prefetch spots into the cache; returns errors by pair."""
+
+        from .marketdata import get_live_spots
+
+        results = get_live_spots(pairs, provider=self.spot_provider)
+        return {
+            pair: str(result)
+            for pair, result in results.items()
+            if isinstance(result, Exception)
+        }
+
+    def curve_names(self) -> list[str]:
+        with self._lock:
+            return sorted(self._curves)
+
+    def curve(self, name: str) -> DiscountCurve:
+        with self._lock:
+            try:
+                return self._curves[name]
+            except KeyError:
+                raise ValueError(f"unknown curve: {name}") from None
+
+    def set_curve(self, name: str, curve: DiscountCurve) -> None:
+        with self._lock:
+            self._curves[name] = curve
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests_served += 1
+
+    def health(self) -> dict[str, Any]:
+        return {
+            "status": "ok",
+            "uptime_seconds": round(time.monotonic() - self.started, 3),
+            "requests_served": self.requests_served,
+            "curves": self.curve_names(),
+        }
+
+    def curves(self) -> dict[str, Any]:
+        with self._lock:
+            curves = dict(self._curves)
+        return {
+            name: {
+                "times": curve.times.tolist(),
+                "zero_rates": curve.zero_rates.tolist(),
+            }
+            for name, curve in sorted(curves.items())
+        }
+
+    def put_curve(self, name: str, payload: Mapping[str, Any]) -> dict[str, Any]:
+        curve = ZeroCurve(
+            times=_field(payload, "times"), zero_rates=_field(payload, "zero_rates")
+        )
+        self.set_curve(name, curve)
+        return {"name": name, "pillars": len(curve.times)}
+
+    def fx_forward(self, payload: Mapping[str, Any]) -> dict[str, Any]:
+        """Price one forward, or a ``trades`` list sharing spot and curves."""
+
+        domestic_curve = self._resolve_curve(payload, "domestic")
+        foreign_curve = self._resolve_curve(payload, "foreign")
+        spot = self._resolve_spot(payload)
+
+        trades = payload.get("trades")
+        rows = [payload] if trades is None else list(trades)
+        fair, pv = price_fx_forwards(
+            [_field(row, "notional_base") for row in rows],
+            [_field(row, "strike") for row in rows],
+            spot,
+            maturity_years=[_field(row, "maturity_years") for row in rows],
+            domestic_curve=domestic_curve,
+            foreign_curve=foreign_curve,
+        )
+        results = [{"fair_forward": float(f), "pv": float(p)} for f, p in zip(fair, pv)]
+        if trades is None:
+            return {"spot": spot, **results[0]}
+        return {"spot": spot, "results": results}
+
+    def swap(self, payload: Mapping[str, Any]) -> dict[str, Any]:
+        """Price one swap, or a ``swaps`` list sharing one curve."""
+
+        curve = self.curve(str(payload.get("curve", "default")))
+        swaps = payload.get("swaps")
+        rows = [payload] if swaps is None else list(swaps)
+
+        values = price_swaps(
+            [_field(row, "notional") for row in rows],
+            [_field(row, "fixed_rate") for row in rows],
+            [_field(row, "maturity_years") for row in rows],
+            [row.get("payments_per_year", 1) for row in rows],
+            [_flag(row, "pay_fixed", True) for row in rows],
+            curve=curve,
+        )
+        results = [
+            {"pv": float(pv), "pv01": float(pv01), "par_rate": float(par)}
+            for pv, pv01, par in zip(values.pv, values.pv01, values.par_rate)
+        ]
+        return results[0] if swaps is None else {"results": results}
+
+    def scenarios(self, payload: Mapping[str, Any]) -> dict[str, Any]:
+        """Scenario grid for a set of forwards; see fx_forward_scenario_grid."""
+
+        from .scenarios import fx_forward_scenario_grid
+
+        trades = payload.get("trades") or [payload]
+        table = fx_forward_scenario_grid(
+            notional_base=[_field(row, "notional_base") for row in trades],
+            strike=[_field(row, "strike") for row in trades],
+            maturity_years=[_field(row, "maturity_years") for row in trades],
+            spot=self._resolve_spot(payload),
+            domestic_curve=self._resolve_curve(payload, "domestic"),
+            foreign_curve=self._resolve_curve(payload, "foreign"),
+            spot_shocks_pct=payload.get("spot_shocks_pct", (0.0,)),
+            domestic_bumps_bps=payload.get("domestic_bumps_bps", (0.0,)),
+            foreign_bumps_bps=payload.get("foreign_bumps_bps", (0.0,)),
+            cartesian=_flag(payload, "cartesian", True),
+        )
+        return {"columns": list(table.columns), "rows": table.to_numpy().tolist()}
+
+    def _resolve_curve(self, payload: Mapping[str, Any], leg: str) -> DiscountCurve:
+        name = payload.get(f"{leg}_curve")
+        if name is not None:
+            return self.curve(str(name))
+        rate = payload.get(f"{leg}_rate")
+        if rate is not None:
+            rate = _finite(rate, f"{leg}_rate")
+        return _flat_curve_from_rate(rate, f"{leg}_rate", f"{leg}_curve")
+
+    def _resolve_spot(self, payload: Mapping[str, Any]) -> float:
+        if payload.get("spot") is not None:
+            return _finite(payload["spot"], "spot")
+        if payload.get("pair") is None:
+            raise ValueError("spot or pair is required")
+        base, quote = parse_pair(str(payload["pair"]))
+        return self.spot_provider.get_spot(base, quote)[0]
+
+
+def _flag(payload: Mapping[str, Any], name: str, default: bool) -> bool:
+    # bool("false") is True, so only real JSON booleans are accepted.
+    value = payload.get(name, default)
+    if not isinstance(value, bool):
+        raise ValueError(f"{name} must be a JSON boolean (true or false)")
+    return value
+
+
+def _finite(value: Any, name: str) -> float:
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f"{name} must be finite")
+    return number
+
+
+def _field(payload: Mapping[str, Any], name: str) -> Any:
+    try:
+        return payload[name]
+    except (KeyError, TypeError):
+        raise ValueError(f"missing field: {name}") from None
+
+
+class _PricingHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps client connections open between requests.
+    protocol_version = "HTTP/1.1"
+    server: _PricingServer
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        service = self.server.service
+        routes: dict[str, Callable[[], dict[str, Any]]] = {
+            "/health": service.health,
+            "/curves": service.curves,
+        }
+        route = routes.get(self.path.split("?", 1)[0])
+        if route is None:
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"no route for {self.path}"})
+            return
+        self._dispatch(lambda _: route())
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server API
+        service = self.server.service
+        path = self.path.split("?", 1)[0]
+        routes: dict[str, Callable[[Any], dict[str, Any]]] = {
+            "/fx-forward": service.fx_forward,
+            "/swap": service.swap,
+            "/scenarios": service.scenarios,
+        }
+        if path.startswith("/curves/") and len(path) > len("/curves/"):
+            name = path[len("/curves/") :]
+            self._dispatch(lambda body: service.put_curve(name, body))
+            return
+        route = routes.get(path)
+        if route is None:
+            self._send(HTTPStatus.NOT_FOUND, {"error": f"no route for {self.path}"})
+            return
+        self._dispatch(route)
+
+    do_PUT = do_POST
+
+    def _dispatch(self, handler: Callable[[Any], dict[str, Any]]) -> None:
+        try:
+            result = _encode(handler(self._read_json()))
+        except (ValueError, TypeError) as exc:
+            self._send(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+        except RuntimeError as exc:
+            self._send(HTTPStatus.BAD_GATEWAY, {"error": str(exc)})
+        except Exception as exc:  # noqa: BLE001 - reply rather than drop the socket
+            self._send(
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                {"error": f"internal error: {type(exc).__name__}: {exc}"},
+            )
+        else:
+            self.server.service.record_request()
+            self._send_body(HTTPStatus.OK, result)
+
+    def _read_json(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length < 0:
+            raise ValueError("invalid Content-Length")
+        if length > _MAX_BODY_BYTES:
+            raise ValueError("request body too large")
+        if length == 0:
+            return {}
+        try:
+            payload = json.loads(self.rfile.read(length))
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"invalid JSON: {exc}") from exc
+        if not isinstance(payload, dict):
+            raise ValueError("request body must be a JSON object")
+        return payload
+
+    def _send(self, status: HTTPStatus, payload: Mapping[str, Any]) -> None:
+        self._send_body(status, _encode(payload))
+
+    def _send_body(self, status: HTTPStatus, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status >= 400:
+            # The request body may not have been read (unknown route, body too
+            # large), so end the connection rather than parse leftover bytes
+            # as the next request.
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def _encode(payload: Mapping[str, Any]) -> bytes:
+    try:
+        return json.dumps(payload, default=_json_default, allow_nan=False).encode()
+    except ValueError:
+        # Bare NaN/Infinity is not valid JSON; report it as a bad input.
+        raise ValueError("inputs produced a non-finite result") from None
+
+
+def _json_default(value: object) -> object:
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"cannot serialize {type(value).__name__}")
+
+
+class _PricingServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self, address: tuple[str, int], service: PricingService, verbose: bool
+    ) -> None:
+        super().__init__(address, _PricingHandler)
+        self.service = service
+        self.verbose = verbose
+
+
+def make_server(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    service: PricingService | None = None,
+    verbose: bool = False,
+) -> ThreadingHTTPServer:
+    """Create (but do not start) a threaded pricing server.
+
+    Each connection is handled on its own thread against one shared
+    PricingService. Use port 0 to bind any free port (see ``server_port``).
+    """
+
+    return _PricingServer((host, port), service or PricingService(), verbose)
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    warm_pairs: Iterable[str] = (),
+    verbose: bool = True,
+) -> None:
+    """Run the pricing server until interrupted, prefetching ``warm_pairs``."""
+
+    service = PricingService()
+    warm_pairs = list(warm_pairs)
+    if warm_pairs:
+        for pair, error in service.warm_spots(warm_pairs).items():
+            print(f"Could not prefetch spot for {pair}: {error}")
+    server = make_server(host, port, service=service, verbose=verbose)
+    print(f"Serving fm_toolkit pricing on http://{host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -3,8 +3,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Sequence
 
-from .curves import ZeroCurve
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from .curves import DiscountCurve
+from .schedules import Schedule, period_times
 
 
 @dataclass
@@ -29,46 +36,144 @@ class VanillaSwap:
 
 
 def payment_times(maturity_years: float, payments_per_year: int) -> list[float]:
-    periods = round(maturity_years * payments_per_year)
-    if abs(periods - maturity_years * payments_per_year) > 1e-9:
-        raise ValueError("maturity_years * payments_per_year must be an integer")
-    return [i / payments_per_year for i in range(1, periods + 1)]
+    return period_times(maturity_years, payments_per_year).tolist()
+
+
+def swap_cashflows(
+    swaps: Sequence[VanillaSwap],
+) -> tuple[NDArray[np.intp], NDArray[np.float64], NDArray[np.float64]]:
+    """Rate-sensitive cash flows of a book of swaps as flat arrays.
+
+    Returns (offsets, times, amounts) where the flows of swap i are
+    ``times[offsets[i]:offsets[i + 1]]``, and each swap's PV is a constant plus
+    ``sum(amounts * df(times))`` over its slice. Fixed coupons and the floating
+    leg's maturity discount factor share the final payment date.
+    """
+
+    notionals = np.array([swap.notional for swap in swaps], dtype=np.float64)
+    fixed_rates = np.array([swap.fixed_rate for swap in swaps], dtype=np.float64)
+    frequencies = np.array([swap.payments_per_year for swap in swaps], dtype=np.int64)
+    signs = np.array([1.0 if swap.pay_fixed else -1.0 for swap in swaps])
+    # Swaps with the same terms share one memoized schedule array.
+    schedules = [
+        period_times(swap.maturity_years, swap.payments_per_year) for swap in swaps
+    ]
+
+    offsets = np.zeros(len(swaps) + 1, dtype=np.intp)
+    np.cumsum([times.size for times in schedules], out=offsets[1:])
+    times = np.concatenate(schedules) if schedules else np.zeros(0)
+    amounts = np.repeat(
+        -signs * notionals * fixed_rates / frequencies, np.diff(offsets)
+    )
+    amounts[offsets[1:] - 1] -= signs * notionals
+    return offsets, times, amounts
 
 
 def par_swap_rate(
-    curve: ZeroCurve,
+    curve: DiscountCurve,
     maturity_years: float,
     payments_per_year: int = 1,
 ) -> float:
     """Par fixed rate for a spot-start swap."""
 
-    times = payment_times(maturity_years, payments_per_year)
-    accrual = 1.0 / payments_per_year
-    annuity = sum(accrual * curve.discount_factor(t) for t in times)
+    times = period_times(maturity_years, payments_per_year)
+    annuity = float(np.sum(curve.dfs(times))) / payments_per_year
     return (1.0 - curve.discount_factor(maturity_years)) / annuity
 
 
+@dataclass(frozen=True)
+class ParRateSurface:
+    """Par swap rates for every maturity ``k / f`` up to ``max_years``.
+
+    ``rates[f][k - 1]`` is par_swap_rate(curve, k / f, f) for each payment
+    frequency f, so any grid point is quoted by index. Surfaces are shared
+    through a cache, so ``rates`` is a read-only mapping of read-only arrays.
+    """
+
+    max_years: int
+    rates: Mapping[int, NDArray[np.float64]]
+
+    @property
+    def frequencies(self) -> tuple[int, ...]:
+        return tuple(self.rates)
+
+    def quote(self, maturity_years: float, payments_per_year: int = 1) -> float:
+        """Par rate for one grid point; raises ValueError off the grid."""
+
+        rates = self.rates.get(payments_per_year)
+        if rates is None:
+            raise ValueError(f"payments_per_year {payments_per_year} not on surface")
+        periods = round(maturity_years * payments_per_year)
+        if abs(periods - maturity_years * payments_per_year) > 1e-9:
+            raise ValueError("maturity_years * payments_per_year must be an integer")
+        if not 1 <= periods <= rates.size:
+            raise ValueError(f"maturity_years must be within (0, {self.max_years}]")
+        return float(rates[periods - 1])
+
+
+def par_rate_surface(
+    curve: DiscountCurve,
+    max_years: int = 50,
+    frequencies: Sequence[int] = (1, 2, 4, 12),
+) -> ParRateSurface:
+    """Par rates on the whole maturity grid for each payment frequency.
+
+    Each frequency evaluates the curve once on ``k / f`` and takes every
+    annuity from a running sum, so the surface costs one pass per frequency
+    instead of one annuity sum per maturity. Surfaces are cached per curve:
+    a ZeroCurve hashes by content, so equal curves share one surface, while
+    ShiftedCurve views hash by identity and are cached per view object.
+    """
+
+    if not _is_positive_int(max_years):
+        raise ValueError("max_years must be a positive integer")
+    if not all(_is_positive_int(frequency) for frequency in frequencies):
+        raise ValueError("payments_per_year must be a positive integer")
+    return _par_rate_surface(curve, int(max_years), tuple(map(int, frequencies)))
+
+
+def _is_positive_int(value: object) -> bool:
+    return (
+        isinstance(value, (int, np.integer))
+        and not isinstance(value, bool)
+        and value > 0
+    )
+
+
+@lru_cache(maxsize=32)
+def _par_rate_surface(
+    curve: DiscountCurve, max_years: int, frequencies: tuple[int, ...]
+) -> ParRateSurface:
+    rates: dict[int, NDArray[np.float64]] = {}
+    for frequency in frequencies:
+        grid = np.arange(1, max_years * frequency + 1) / frequency
+        dfs = curve.dfs(grid)
+        par = (1.0 - dfs) / (np.cumsum(dfs) / frequency)
+        par.flags.writeable = False
+        rates[frequency] = par
+    return ParRateSurface(max_years=max_years, rates=MappingProxyType(rates))
+
+
 def fixed_leg_pv(
     notional: float,
     fixed_rate: float,
-    curve: ZeroCurve,
+    curve: DiscountCurve,
     maturity_years: float,
     payments_per_year: int,
 ) -> float:
-    times = payment_times(maturity_years, payments_per_year)
-    accrual = 1.0 / payments_per_year
-    return (
-        notional * fixed_rate * sum(accrual * curve.discount_factor(t) for t in times)
-    )
+    times = period_times(maturity_years, payments_per_year)
+    return notional * fixed_rate * float(np.sum(curve.dfs(times))) / payments_per_year
 
 
-def floating_leg_pv(notional: float, curve: ZeroCurve, maturity_years: float) -> float:
+def floating_leg_pv(
+    notional: float, curve: DiscountCurve, maturity_years: float
+) -> float:
     """Floating leg PV approximation for spot-start par floater."""
 
     return notional * (1.0 - curve.discount_factor(maturity_years))
 
 
-def swap_pv(swap: VanillaSwap, curve: ZeroCurve) -> float:
+def swap_pv(swap: VanillaSwap, curve: DiscountCurve) -> float:
     """PV of the swap from the perspective of the swap holder."""
 
     fixed = fixed_leg_pv(
@@ -89,8 +194,107 @@ def swap_pv(swap: VanillaSwap, curve: ZeroCurve) -> float:
     return fixed - floating
 
 
-def swap_pv01(swap: VanillaSwap, curve: ZeroCurve, bump_bp: float = 1.0) -> float:
-    """PV change for a parallel bump in curve rates."""
+def scheduled_swap_pv(
+    notional: float,
+    fixed_rate: float,
+    schedule: Schedule,
+    curve: DiscountCurve,
+    pay_fixed: bool = True,
+) -> float:
+    """PV of a spot-start swap on a dated schedule.
+
+    Fixed coupons accrue by the schedule's day count and are discounted at
+    its precomputed payment times; the floating leg is a par floater to the
+    last payment date.
+    """
+
+    dfs = curve.dfs(schedule.times)
+    fixed = notional * fixed_rate * float(np.dot(schedule.accruals, dfs))
+    floating = notional * (1.0 - float(dfs[-1]))
+    return floating - fixed if pay_fixed else fixed - floating
+
+
+def swap_pv01(swap: VanillaSwap, curve: DiscountCurve, bump_bp: float = 1.0) -> float:
+    """PV change for a parallel bump in curve rates.
+
+    A parallel bump s scales every discount factor by exp(-s * t), so the
+    change is ``sum(c_k * df(t_k) * expm1(-s * t_k))`` over the swap's cash
+    flows: the bump-and-reprice result, without a shifted curve or a second
+    pricing pass.
+    """
+
+    _, times, amounts = swap_cashflows([swap])
+    return float(np.sum(amounts * curve.dfs(times) * np.expm1(-bump_bp * 1e-4 * times)))
+
+
+@dataclass(frozen=True)
+class SwapBookValues:
+    """Per-swap results from price_swaps(), as parallel arrays."""
+
+    pv: NDArray[np.float64]
+    par_rate: NDArray[np.float64]
+    pv01: NDArray[np.float64]
+
+
+def price_swaps(
+    notional: ArrayLike,
+    fixed_rate: ArrayLike,
+    maturity_years: ArrayLike,
+    payments_per_year: ArrayLike = 1,
+    pay_fixed: ArrayLike = True,
+    *,
+    curve: DiscountCurve,
+    bump_bp: float = 1.0,
+) -> SwapBookValues:
+    """Vectorized swap_pv(), par_swap_rate() and swap_pv01() for a book.
+
+    For each payment frequency the curve is evaluated once on the grid
+    ``k / f`` up to the longest maturity, and running sums of that grid give
+    every swap's annuity by lookup. PV01 uses the same closed form as
+    swap_pv01(): running sums of ``df * expm1(-s * t)`` give the change in
+    each annuity directly, so there is no bumped-minus-base cancellation and
+    results agree with the scalar functions to rounding.
+    """
+
+    notional, fixed_rate, maturity_years, frequencies, pay_fixed = np.broadcast_arrays(
+        np.asarray(notional, dtype=np.float64),
+        np.asarray(fixed_rate, dtype=np.float64),
+        np.asarray(maturity_years, dtype=np.float64),
+        np.asarray(payments_per_year),
+        np.asarray(pay_fixed, dtype=bool),
+    )
+    if np.any(~(notional > 0)):
+        raise ValueError("notional must be positive")
+    if np.any(~(fixed_rate >= 0)):
+        raise ValueError("fixed_rate must be non-negative")
+    if np.any(~(maturity_years > 0)):
+        raise ValueError("maturity_years must be positive")
+    if np.any(frequencies <= 0) or np.any(frequencies != np.rint(frequencies)):
+        raise ValueError("payments_per_year must be a positive integer")
+    frequencies = frequencies.astype(np.int64)
+
+    raw_periods = maturity_years * frequencies
+    periods = np.rint(raw_periods).astype(np.intp)
+    if np.any(np.abs(periods - raw_periods) > 1e-9):
+        raise ValueError("maturity_years * payments_per_year must be an integer")
+
+    annuity = np.empty(notional.shape)
+    annuity_change = np.empty(notional.shape)
+    maturity_df = np.empty(notional.shape)
+    maturity_df_change = np.empty(notional.shape)
+    shift = bump_bp * 1e-4
+    for frequency in np.unique(frequencies):
+        members = frequencies == frequency
+        last = periods[members] - 1
+        grid = np.arange(1, periods[members].max() + 1) / frequency
+        dfs = curve.dfs(grid)
+        df_changes = dfs * np.expm1(-shift * grid)
+        annuity[members] = np.cumsum(dfs)[last] / frequency
+        annuity_change[members] = np.cumsum(df_changes)[last] / frequency
+        maturity_df[members] = dfs[last]
+        maturity_df_change[members] = df_changes[last]
 
-    bumped_curve = curve.shifted(bump_bp)
-    return swap_pv(swap, bumped_curve) - swap_pv(swap, curve)
+    sign = np.where(pay_fixed, 1.0, -1.0)
+    pv = sign * notional * (1.0 - maturity_df - fixed_rate * annuity)
+    pv01 = -sign * notional * (maturity_df_change + fixed_rate * annuity_change)
+    return SwapBookValues(pv=pv, par_rate=(1.0 - maturity_df) / annuity, pv01=pv01)
@@ -0,0 +1,399 @@
+"""Append-only on-disk store for recorded FX spot ticks."""
+
+from __future__ import annotations
+
+import csv
+import heapq
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .marketdata import SpotProvider, parse_pair
+
+TICK_DTYPE = np.dtype([("ts_ns", "<i8"), ("spot", "<f8"), ("source", "<u2")])
+"""Fixed-width tick record: epoch nanoseconds (UTC), spot, source code."""
+
+_SUFFIX = ".ticks"
+_SOURCES_FILE = "sources.json"
+_SOURCES_LOCK = "sources.lock"
+_READ_CHUNK = 65_536
+
+Timestamp = int | str | datetime
+
+
+def to_ns(timestamp: Timestamp) -> int:
+    """Convert epoch nanoseconds, an ISO string or a datetime to epoch ns.
+
+    Naive datetimes and date-only strings are taken as UTC.
+    """
+
+    if isinstance(timestamp, (int, np.integer)):
+        return int(timestamp)
+    if isinstance(timestamp, str):
+        timestamp = timestamp.strip()
+        if timestamp.lstrip("-").isdigit():
+            return int(timestamp)
+        if timestamp[-1:] in ("Z", "z"):
+            # datetime.fromisoformat only accepts a "Z" suffix from 3.11.
+            timestamp = f"{timestamp[:-1]}+00:00"
+        timestamp = datetime.fromisoformat(timestamp)
+    if not isinstance(timestamp, datetime):
+        raise TypeError(f"unsupported timestamp type: {type(timestamp).__name__}")
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    delta = timestamp - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + (
+        delta.microseconds * 1_000
+    )
+
+
+class TickStore:
+    """Directory of append-only tick files, one per currency pair.
+
+    Each pair is a flat file of ``TICK_DTYPE`` records in timestamp order,
+    and source labels are interned in a small ``sources.json`` sidecar.
+    Appends and new labels are made under file locks against what is on
+    disk, so several stores (or processes) on one root keep every file in
+    order and agree on every code. Reads memory-map the file and
+    binary-search the timestamp column, so a time-window query returns a
+    zero-copy view without scanning the file.
+    """
+
+    def __init__(self, root: str | os.PathLike[str]) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._sources: list[str] = []
+        self._source_codes: dict[str, int] = {}
+        self._reload_sources()
+
+    @property
+    def sources(self) -> list[str]:
+        """Source labels indexed by the ``source`` code stored in each tick."""
+
+        with self._lock:
+            self._reload_sources()
+            return list(self._sources)
+
+    def pairs(self) -> list[str]:
+        return sorted(
+            f"{path.stem[:3]}/{path.stem[3:]}" for path in self.root.glob(f"*{_SUFFIX}")
+        )
+
+    def append(self, pair: str, spot: float, timestamp: Timestamp, source: str) -> None:
+        """Append one tick; timestamps must not go backwards within a pair."""
+
+        self.append_many(pair, [to_ns(timestamp)], [spot], [source])
+
+    def append_many(
+        self,
+        pair: str,
+        ts_ns: NDArray[np.int64] | list[int],
+        spots: NDArray[np.float64] | list[float],
+        sources: list[str],
+    ) -> None:
+        """Append a batch of ticks for one pair in a single write."""
+
+        key = _pair_key(pair)
+        ts_ns = np.asarray(ts_ns, dtype=np.int64)
+        spots = np.asarray(spots, dtype=np.float64)
+        if not ts_ns.shape == spots.shape == (len(sources),):
+            raise ValueError("ts_ns, spots and sources must have the same length")
+        if np.any(~(spots > 0)):
+            raise ValueError("spot must be positive")
+        if np.any(np.diff(ts_ns) < 0):
+            raise ValueError("tick timestamps must be non-decreasing")
+
+        # The per-pair file lock makes check-then-append atomic across stores
+        # and processes sharing this root.
+        with self._lock, _file_lock(self.root / f"{key}.lock"):
+            last = self._last_timestamp(key)
+            if ts_ns.size and last is not None and ts_ns[0] < last:
+                raise ValueError(f"tick timestamps must be non-decreasing for {pair}")
+
+            records = np.empty(ts_ns.size, dtype=TICK_DTYPE)
+            records["ts_ns"] = ts_ns
+            records["spot"] = spots
+            records["source"] = [self._source_code(label) for label in sources]
+            with open(self._path(key), "ab") as handle:
+                handle.write(records.tobytes())
+
+    def last_timestamp(self, pair: str) -> int | None:
+        """Epoch ns of the newest tick for ``pair``, or None if empty."""
+
+        with self._lock:
+            return self._last_timestamp(_pair_key(pair))
+
+    def read(
+        self,
+        pair: str,
+        start: Timestamp | None = None,
+        end: Timestamp | None = None,
+    ) -> NDArray[np.void]:
+        """Ticks with ``start <= ts < end`` as a read-only memory-mapped view."""
+
+        ticks = self._memmap(_pair_key(pair))
+        lo = 0 if start is None else int(np.searchsorted(ticks["ts_ns"], to_ns(start)))
+        hi = (
+            ticks.size
+            if end is None
+            else int(np.searchsorted(ticks["ts_ns"], to_ns(end), side="left"))
+        )
+        return ticks[lo : max(lo, hi)]
+
+    def __len__(self) -> int:
+        return sum(self._memmap(_pair_key(pair)).size for pair in self.pairs())
+
+    def _memmap(self, key: str) -> NDArray[np.void]:
+        path = self._path(key)
+        size = path.stat().st_size if path.exists() else 0
+        count = size // TICK_DTYPE.itemsize
+        if count == 0:
+            return np.empty(0, dtype=TICK_DTYPE)
+        # Map only whole records so a concurrent partial append is not read.
+        return np.memmap(path, dtype=TICK_DTYPE, mode="r", shape=(count,))
+
+    def _last_timestamp(self, key: str) -> int | None:
+        # Read from disk every time: another store may have appended since.
+        path = self._path(key)
+        size = path.stat().st_size if path.exists() else 0
+        count = size // TICK_DTYPE.itemsize
+        if count == 0:
+            return None
+        with open(path, "rb") as handle:
+            handle.seek((count - 1) * TICK_DTYPE.itemsize)
+            record = np.frombuffer(handle.read(TICK_DTYPE.itemsize), TICK_DTYPE)
+        return int(record["ts_ns"][0])
+
+    def _reload_sources(self) -> None:
+        # The sidecar is append-only, so reloading only ever adds labels.
+        path = self.root / _SOURCES_FILE
+        if path.exists():
+            self._sources = json.loads(path.read_text())
+            self._source_codes = {label: i for i, label in enumerate(self._sources)}
+
+    def _source_code(self, label: str) -> int:
+        code = self._source_codes.get(label)
+        if code is not None:
+            return code
+        # Another store on this root may have interned labels since we last
+        # looked; merge its sidecar under the lock before assigning a code.
+        with _file_lock(self.root / _SOURCES_LOCK):
+            self._reload_sources()
+            code = self._source_codes.get(label)
+            if code is None:
+                code = self._source_codes[label] = len(self._sources)
+                self._sources.append(label)
+                tmp = self.root / f"{_SOURCES_FILE}.{os.getpid()}.tmp"
+                tmp.write_text(json.dumps(self._sources))
+                os.replace(tmp, self.root / _SOURCES_FILE)
+        return code
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}{_SUFFIX}"
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Exclusive inter-process lock held on ``path`` for the block."""
+
+    with open(path, "a+b") as handle:
+        if os.name == "nt":  # pragma: no cover - Windows
+            import msvcrt
+
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _pair_key(pair: str) -> str:
+    base, quote = parse_pair(pair)
+    return f"{base}{quote}"
+
+
+class RecordingSpotProvider(SpotProvider):
+    """Pass-through provider that appends every returned spot to a TickStore.
+
+    Ticks are stamped with the local receive time rather than the quote's
+    own timestamp, which may be coarse (Frankfurter publishes daily) or
+    differ between sources, so each pair's file stays in arrival order.
+    """
+
+    def __init__(self, provider: SpotProvider, store: TickStore) -> None:
+        self.provider = provider
+        self.store = store
+        self._lock = threading.Lock()
+
+    def get_spot(self, base: str, quote: str) -> tuple[float, str, str]:
+        spot, ts, source = self.provider.get_spot(base, quote)
+        pair = f"{base}/{quote}"
+        with self._lock:
+            received = time.time_ns()
+            last = self.store.last_timestamp(pair)
+            stamp = received if last is None else max(received, last)
+            self.store.append(pair, spot, stamp, source)
+        return spot, ts, source
+
+
+# (ts_ns, pair, spot, source) as yielded by the replay streams.
+ReplayTick = tuple[int, str, float, str]
+
+
+class ReplaySpotProvider(SpotProvider):
+    """Serve recorded ticks as live spots, with no network access.
+
+    The recording is replayed against ``clock``: the first tick maps to the
+    moment the provider is created and recorded time then advances
+    ``speed`` times faster than the clock (``speed=math.inf`` jumps straight
+    to the end). ``get_spot`` returns the latest tick at or before the
+    current replay time, inverting the opposite pair when needed. Ticks are
+    pulled lazily from a time-ordered stream, so recordings of any size are
+    replayed in constant memory.
+    """
+
+    def __init__(
+        self,
+        ticks: Iterable[ReplayTick],
+        speed: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not speed > 0:
+            raise ValueError("speed must be positive")
+
+        self.speed = speed
+        self._clock = clock
+        self._ticks = iter(ticks)
+        self._lock = threading.Lock()
+        self._latest: dict[tuple[str, str], tuple[int, float, str]] = {}
+        self._keys: dict[str, tuple[str, str]] = {}
+        self._pending = next(self._ticks, None)
+        self._origin_ns = None if self._pending is None else self._pending[0]
+        self._started = clock()
+
+    @classmethod
+    def from_store(
+        cls,
+        store: TickStore,
+        pairs: Iterable[str] | None = None,
+        start: Timestamp | None = None,
+        end: Timestamp | None = None,
+        speed: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> ReplaySpotProvider:
+        """Replay a TickStore window, merging pairs in timestamp order."""
+
+        pairs = store.pairs() if pairs is None else list(pairs)
+        labels = store.sources
+        streams = [_iter_store_ticks(store, pair, start, end, labels) for pair in pairs]
+        return cls(heapq.merge(*streams, key=lambda tick: tick[0]), speed, clock)
+
+    @classmethod
+    def from_csv(
+        cls,
+        path: str | os.PathLike[str],
+        speed: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> ReplaySpotProvider:
+        """Replay a time-ordered CSV with pair, spot, timestamp, source columns."""
+
+        return cls(_iter_csv_ticks(Path(path)), speed, clock)
+
+    @property
+    def replay_ns(self) -> int | float | None:
+        """Current position in recorded time (epoch ns)."""
+
+        if self._origin_ns is None:
+            return None
+        if math.isinf(self.speed):
+            return math.inf
+        elapsed = (self._clock() - self._started) * self.speed
+        return self._origin_ns + int(elapsed * 1e9)
+
+    @property
+    def finished(self) -> bool:
+        with self._lock:
+            return self._pending is None
+
+    def get_spot(self, base: str, quote: str) -> tuple[float, str, str]:
+        base, quote = parse_pair(f"{base}/{quote}")
+        with self._lock:
+            self._advance()
+            direct = self._latest.get((base, quote))
+            inverse = self._latest.get((quote, base))
+
+        if direct is None and inverse is None:
+            raise RuntimeError(f"No replayed tick yet for {base}/{quote}")
+        if direct is None or (inverse is not None and inverse[0] > direct[0]):
+            ts_ns, spot, source = inverse
+            return 1.0 / spot, _format_ns(ts_ns), f"Replay ({source}) (inverted)"
+        ts_ns, spot, source = direct
+        return spot, _format_ns(ts_ns), f"Replay ({source})"
+
+    def _advance(self) -> None:
+        now = self.replay_ns
+        while self._pending is not None and self._pending[0] <= now:
+            ts_ns, pair, spot, source = self._pending
+            key = self._keys.get(pair)
+            if key is None:
+                key = self._keys[pair] = parse_pair(pair)
+            self._latest[key] = (ts_ns, spot, source)
+            self._pending = next(self._ticks, None)
+
+
+def _iter_store_ticks(
+    store: TickStore,
+    pair: str,
+    start: Timestamp | None,
+    end: Timestamp | None,
+    labels: list[str],
+) -> Iterator[ReplayTick]:
+    ticks = store.read(pair, start, end)
+    for offset in range(0, ticks.size, _READ_CHUNK):
+        # Copy one chunk out of the memory map at a time to bound memory.
+        chunk = ticks[offset : offset + _READ_CHUNK]
+        for ts_ns, spot, code in zip(
+            chunk["ts_ns"].tolist(), chunk["spot"].tolist(), chunk["source"].tolist()
+        ):
+            yield ts_ns, pair, spot, labels[code]
+
+
+def _iter_csv_ticks(path: Path) -> Iterator[ReplayTick]:
+    with open(path, newline="") as handle:
+        last = None
+        for line, row in enumerate(csv.DictReader(handle), start=2):
+            try:
+                ts_ns = to_ns(row["timestamp"])
+                tick = (ts_ns, row["pair"], float(row["spot"]), row.get("source") or "")
+            except (KeyError, TypeError, ValueError) as exc:
+                raise ValueError(f"{path}:{line}: invalid tick row: {exc}") from exc
+            if last is not None and ts_ns < last:
+                raise ValueError(f"{path}:{line}: ticks must be in timestamp order")
+            last = ts_ns
+            yield tick
+
+
+def _format_ns(ts_ns: int) -> str:
+    seconds, nanos = divmod(ts_ns, 1_000_000_000)
+    stamp = datetime.fromtimestamp(seconds, tz=timezone.utc)
+    return stamp.replace(microsecond=nanos // 1_000).isoformat()
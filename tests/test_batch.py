@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fm_toolkit.batch import iter_priced_chunks, price_fx_forward_file
+from fm_toolkit.fx_forwards import forward_rate, price_fx_forward
+
+
+def _trade_frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    return pd.DataFrame(
+        {
+            "trade_id": [f"T{i}" for i in range(rows)],
+            "notional_base": rng.uniform(1e5, 1e7, rows),
+            "strike": rng.uniform(1.0, 1.3, rows),
+            "maturity_years": rng.uniform(0.1, 5.0, rows),
+            "domestic_rate": rng.uniform(-0.01, 0.05, rows),
+            "foreign_rate": rng.uniform(-0.01, 0.05, rows),
+        }
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_price_fx_forward_file_streams_chunks(tmp_path, workers: int) -> None:
+    trades = _trade_frame(1_000)
+    source = tmp_path / "trades.csv"
+    trades.to_csv(source, index=False)
+    target = tmp_path / "priced.csv"
+
+    stats = price_fx_forward_file(
+        source, target, chunk_size=128, workers=workers, defaults={"spot": 1.1}
+    )
+    priced = pd.read_csv(target)
+
+    assert stats.rows == 1_000
+    assert stats.chunks == 8
+    assert priced.columns.tolist() == ["trade_id", "fair_forward", "pv"]
+    assert priced["trade_id"].tolist() == trades["trade_id"].tolist()
+    assert stats.total_pv == pytest.approx(priced["pv"].sum())
+    for row in trades.sample(5, random_state=1).itertuples():
+        result = priced.loc[row.Index]
+        assert result["pv"] == pytest.approx(
+            price_fx_forward(
+                row.notional_base,
+                row.strike,
+                1.1,
+                row.domestic_rate,
+                row.foreign_rate,
+                row.maturity_years,
+            )
+        )
+        assert result["fair_forward"] == pytest.approx(
+            forward_rate(1.1, row.domestic_rate, row.foreign_rate, row.maturity_years)
+        )
+
+
+def test_price_fx_forward_file_can_keep_input_columns(tmp_path) -> None:
+    source = tmp_path / "trades.csv"
+    _trade_frame(10).assign(spot=1.1).to_csv(source, index=False)
+    target = tmp_path / "priced.csv"
+
+    price_fx_forward_file(source, target, keep_inputs=True)
+
+    assert pd.read_csv(target).columns.tolist()[-3:] == ["spot", "fair_forward", "pv"]
+
+
+def test_batch_pricing_reports_missing_columns() -> None:
+    chunk = _trade_frame(3).drop(columns=["foreign_rate"])
+
+    with pytest.raises(ValueError, match="spot, foreign_rate"):
+        list(iter_priced_chunks([chunk]))
+
+
+def test_batch_pricing_rejects_missing_rates(tmp_path) -> None:
+    source = tmp_path / "trades.csv"
+    trades = _trade_frame(5).assign(spot=1.1)
+    trades.loc[3, "domestic_rate"] = np.nan
+    trades.to_csv(source, index=False)
+
+    with pytest.raises(ValueError, match=r"domestic_rate must be finite \(row 3\)"):
+        price_fx_forward_file(source, tmp_path / "priced.csv")
+    with pytest.raises(ValueError, match="foreign_rate must be finite"):
+        list(
+            iter_priced_chunks(
+                [_trade_frame(2).drop(columns=["foreign_rate"])],
+                defaults={"spot": 1.1, "foreign_rate": float("nan")},
+            )
+        )
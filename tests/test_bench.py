@@ -0,0 +1,31 @@
+import json
+
+import pytest
+
+from fm_toolkit.bench import BenchConfig, bench_names, benchmark_report, run_benchmarks
+
+
+def test_benchmarks_run_and_report_json() -> None:
+    config = BenchConfig(book_size=20, pillars=4, scenarios=5, repeat=3, warmup=0)
+    results = run_benchmarks(config)
+
+    assert [result.name for result in results] == bench_names()
+    for result in results:
+        assert result.ops_per_second > 0
+        assert 0 < result.p50_ms <= result.p99_ms
+        assert result.peak_memory_bytes >= 0
+
+    report = json.loads(json.dumps(benchmark_report(results, config)))
+    assert report["config"]["book_size"] == 20
+    grid = next(r for r in report["results"] if r["name"] == "fx_forward_scenario_grid")
+    assert grid["ops_per_call"] == 100
+
+
+def test_benchmarks_can_be_filtered() -> None:
+    config = BenchConfig(book_size=5, repeat=1, warmup=0)
+
+    assert [r.name for r in run_benchmarks(config, only=["curve_dfs"])] == ["curve_dfs"]
+    with pytest.raises(ValueError, match="unknown benchmark"):
+        run_benchmarks(config, only=["nope"])
+    with pytest.raises(ValueError, match="book_size"):
+        BenchConfig(book_size=0)
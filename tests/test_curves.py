@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from fm_toolkit.curves import ShiftedCurve, ZeroCurve
+
+
+def _sample_curve() -> ZeroCurve:
+    return ZeroCurve.from_tenors(
+        tenors=["1M", "3M", "6M", "1Y", "2Y", "5Y"],
+        zero_rates=[0.021, 0.022, 0.024, 0.025, 0.027, 0.03],
+    )
+
+
+def test_vectorized_curve_matches_scalar_path() -> None:
+    curve = _sample_curve()
+    ts = np.array([0.01, 1.0 / 12.0, 0.2, 0.5, 0.75, 1.0, 3.3, 5.0, 12.0])
+
+    rates = curve.zero_rate(ts)
+    dfs = curve.df(ts)
+
+    assert isinstance(rates, np.ndarray)
+    assert rates.tolist() == [curve.zero_rate(float(t)) for t in ts]
+    np.testing.assert_allclose(
+        dfs, [curve.df(float(t)) for t in ts], rtol=1e-15, atol=0.0
+    )
+    np.testing.assert_array_equal(curve.zero_rates_at(list(ts)), rates)
+    np.testing.assert_array_equal(curve.dfs(ts), dfs)
+
+
+def test_vectorized_curve_rejects_non_positive_times() -> None:
+    curve = _sample_curve()
+
+    with pytest.raises(ValueError):
+        curve.dfs([0.5, 0.0])
+
+
+def test_curve_is_immutable_and_hashable_by_content() -> None:
+    curve = _sample_curve()
+    rebuilt = ZeroCurve.from_arrays(curve.times, curve.zero_rates)
+
+    assert rebuilt == curve
+    assert hash(rebuilt) == hash(curve)
+    assert curve != curve.shifted(1.0)
+    with pytest.raises(ValueError):
+        curve.zero_rates[0] = 0.5
+    with pytest.raises(AttributeError):
+        curve.times = np.array([1.0])
+
+
+def test_curve_validation_messages() -> None:
+    with pytest.raises(ValueError, match="sorted"):
+        ZeroCurve(times=[2.0, 1.0], zero_rates=[0.01, 0.02])
+    with pytest.raises(ValueError, match="unique"):
+        ZeroCurve(times=[1.0, 1.0], zero_rates=[0.01, 0.02])
+
+
+def test_shifted_view_matches_rebuilt_curve() -> None:
+    curve = _sample_curve()
+    ts = np.array([0.05, 0.3, 0.9, 1.7, 4.0, 8.0])
+
+    parallel = curve.shifted(25.0)
+    rebuilt = ZeroCurve(times=curve.times, zero_rates=curve.zero_rates + 0.0025)
+
+    assert isinstance(parallel, ShiftedCurve)
+    assert parallel.base is curve
+    np.testing.assert_allclose(parallel.dfs(ts), rebuilt.dfs(ts), rtol=1e-14)
+    assert parallel.df(1.7) == pytest.approx(curve.df(1.7) * np.exp(-0.0025 * 1.7))
+
+    bumps = np.array([0.0, 5.0, -10.0, 0.0, 20.0, 0.0])
+    pillar = curve.shifted(bumps)
+    rebuilt = ZeroCurve(times=curve.times, zero_rates=curve.zero_rates + bumps * 1e-4)
+
+    np.testing.assert_allclose(pillar.zero_rate(ts), rebuilt.zero_rate(ts), rtol=1e-14)
+    assert pillar.zero_rate(0.9) == pytest.approx(rebuilt.zero_rate(0.9), rel=1e-14)
+
+
+def test_stacked_shifts_stay_on_the_base_curve() -> None:
+    curve = _sample_curve()
+    bumps = np.linspace(1.0, 6.0, curve.times.size)
+
+    stacked = curve.shifted(10.0).shifted(bumps).shifted(-4.0)
+
+    assert stacked.base is curve
+    assert stacked.parallel_shift == pytest.approx(6e-4)
+    np.testing.assert_allclose(stacked.pillar_shifts, bumps * 1e-4)
+    np.testing.assert_allclose(
+        stacked.materialize().zero_rates, curve.zero_rates + 6e-4 + bumps * 1e-4
+    )
+    with pytest.raises(ValueError):
+        curve.shifted([1.0, 2.0])
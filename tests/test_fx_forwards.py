@@ -1,7 +1,14 @@
+import numpy as np
 import pytest
 
 from fm_toolkit.curves import ZeroCurve, parse_tenor
-from fm_toolkit.fx_forwards import forward_rate, price_fx_forward
+from fm_toolkit.fx_forwards import (
+    FxMarket,
+    forward_rate,
+    price_fx_forward,
+    price_fx_forwards,
+    price_fx_forwards_by_pair,
+)
 
 
 def test_fx_forward_pv_is_zero_at_fair_strike() -> None:
@@ -110,3 +117,70 @@ def test_parse_tenor_common_cases() -> None:
     assert parse_tenor("1M") == pytest.approx(1.0 / 12.0)
     assert parse_tenor("6M") == pytest.approx(0.5)
     assert parse_tenor("1Y") == pytest.approx(1.0)
+
+
+def test_batch_fx_pricer_matches_scalar_pricer() -> None:
+    domestic_curve = ZeroCurve.from_tenors(
+        tenors=["1M", "3M", "6M", "1Y", "2Y"],
+        zero_rates=[0.024, 0.025, 0.026, 0.027, 0.028],
+    )
+    foreign_curve = ZeroCurve.from_tenors(
+        tenors=["1M", "3M", "6M", "1Y", "2Y"],
+        zero_rates=[0.015, 0.016, 0.017, 0.018, 0.019],
+    )
+    notionals = np.array([1_000_000.0, 250_000.0, 5_000_000.0])
+    strikes = np.array([1.09, 1.12, 1.15])
+    maturities = np.array([0.1, 0.75, 3.0])
+
+    fair, pv = price_fx_forwards(
+        notionals,
+        strikes,
+        1.10,
+        maturity_years=maturities,
+        domestic_curve=domestic_curve,
+        foreign_curve=foreign_curve,
+    )
+
+    for i in range(3):
+        kwargs = dict(
+            spot=1.10,
+            maturity_years=maturities[i],
+            domestic_curve=domestic_curve,
+            foreign_curve=foreign_curve,
+        )
+        assert fair[i] == pytest.approx(forward_rate(**kwargs), rel=1e-14)
+        assert pv[i] == pytest.approx(
+            price_fx_forward(notional_base=notionals[i], strike=strikes[i], **kwargs),
+            rel=1e-12,
+        )
+
+    with pytest.raises(ValueError, match="strike"):
+        price_fx_forwards(notionals, [1.1, 0.0, 1.1], 1.10, 0.03, 0.01, maturities)
+
+
+def test_batch_fx_pricer_by_pair_keeps_input_order() -> None:
+    markets = {
+        "EUR/USD": FxMarket(1.10, ZeroCurve.flat(0.03), ZeroCurve.flat(0.015)),
+        "USD/JPY": FxMarket(150.0, ZeroCurve.flat(0.001), ZeroCurve.flat(0.04)),
+    }
+    pairs = ["USD/JPY", "EUR/USD", "USD/JPY"]
+    strikes = [148.0, 1.12, 152.0]
+
+    fair, pv = price_fx_forwards_by_pair(
+        pairs, [1e6, 2e6, 3e6], strikes, [1.0, 0.5, 2.0], markets=markets
+    )
+
+    for i, pair in enumerate(pairs):
+        market = markets[pair]
+        assert pv[i] == pytest.approx(
+            price_fx_forward(
+                notional_base=[1e6, 2e6, 3e6][i],
+                strike=strikes[i],
+                spot=market.spot,
+                maturity_years=[1.0, 0.5, 2.0][i],
+                domestic_curve=market.domestic_curve,
+                foreign_curve=market.foreign_curve,
+            ),
+            rel=1e-12,
+        )
+    assert fair[2] < fair[0] < 150.0
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from fm_toolkit.curves import ZeroCurve
+from fm_toolkit.fx_forwards import price_fx_forward
+from fm_toolkit.greeks import fx_forward_greeks
+from fm_toolkit.risk import fx_forward_spot_delta
+
+DOMESTIC = ZeroCurve.from_tenors(
+    tenors=["1M", "3M", "6M", "1Y", "2Y"],
+    zero_rates=[0.024, 0.025, 0.026, 0.027, 0.028],
+)
+FOREIGN = ZeroCurve.from_tenors(
+    tenors=["3M", "1Y", "5Y"], zero_rates=[0.015, 0.017, 0.02]
+)
+
+
+def _pv(spot: float, maturity: float, domestic=DOMESTIC, foreign=FOREIGN) -> float:
+    return price_fx_forward(
+        notional_base=2_000_000,
+        strike=1.12,
+        spot=spot,
+        maturity_years=maturity,
+        domestic_curve=domestic,
+        foreign_curve=foreign,
+    )
+
+
+def test_fx_forward_greeks_match_finite_differences() -> None:
+    maturities = np.array([0.3, 0.75, 1.6])
+    greeks = fx_forward_greeks(
+        2_000_000,
+        1.12,
+        1.10,
+        maturity_years=maturities,
+        domestic_curve=DOMESTIC,
+        foreign_curve=FOREIGN,
+    )
+
+    h = 1e-4
+    for i, maturity in enumerate(maturities):
+        assert greeks.pv[i] == pytest.approx(_pv(1.10, maturity), rel=1e-12)
+        fd_delta = (_pv(1.10 + h, maturity) - _pv(1.10 - h, maturity)) / (2 * h)
+        assert greeks.spot_delta[i] == pytest.approx(fd_delta, rel=1e-7)
+
+        fd_theta = (_pv(1.10, maturity - 1e-6) - _pv(1.10, maturity + 1e-6)) / 2e-6
+        assert greeks.theta[i] == pytest.approx(fd_theta, rel=1e-5)
+
+        for j in range(DOMESTIC.times.size):
+            bumps = np.zeros(DOMESTIC.times.size)
+            bumps[j] = 0.01
+            fd = (
+                _pv(1.10, maturity, domestic=DOMESTIC.shifted(bumps))
+                - _pv(1.10, maturity, domestic=DOMESTIC.shifted(-bumps))
+            ) / 0.02
+            assert greeks.domestic_rho[i, j] == pytest.approx(fd, rel=1e-6, abs=1e-9)
+        for j in range(FOREIGN.times.size):
+            bumps = np.zeros(FOREIGN.times.size)
+            bumps[j] = 0.01
+            fd = (
+                _pv(1.10, maturity, foreign=FOREIGN.shifted(bumps))
+                - _pv(1.10, maturity, foreign=FOREIGN.shifted(-bumps))
+            ) / 0.02
+            assert greeks.foreign_rho[i, j] == pytest.approx(fd, rel=1e-6, abs=1e-9)
+
+
+def test_spot_delta_supports_flat_rates_and_curves() -> None:
+    flat = fx_forward_spot_delta(1_000_000, 1.12, 1.10, 0.03, 0.015, 1.0)
+    curves = fx_forward_spot_delta(
+        1_000_000,
+        1.12,
+        1.10,
+        maturity_years=1.0,
+        domestic_curve=ZeroCurve.flat(0.03),
+        foreign_curve=ZeroCurve.flat(0.015),
+    )
+
+    assert flat == pytest.approx(1_000_000 * np.exp(-0.015))
+    assert curves == pytest.approx(flat)
@@ -0,0 +1,58 @@
+import ast
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import fm_toolkit
+
+_SRC = str(Path(fm_toolkit.__file__).resolve().parents[1])
+
+
+def _loaded_after(statement: str) -> set[str]:
+    code = (
+        "import sys\n"
+        f"{statement}\n"
+        "print(','.join(m for m in ('numpy', 'pandas', 'requests', 'dotenv', "
+        "'asyncio') if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": _SRC},
+    ).stdout.strip()
+    return set(filter(None, output.split(",")))
+
+
+def test_package_import_is_lazy() -> None:
+    assert _loaded_after("import fm_toolkit") == set()
+    assert _loaded_after("from fm_toolkit import parse_pair") == set()
+    assert _loaded_after("from fm_toolkit import forward_rate") == {"numpy"}
+    assert "pandas" not in _loaded_after(
+        "from fm_toolkit.report import build_demo_report"
+    )
+
+
+def test_lazy_exports_resolve() -> None:
+    assert set(fm_toolkit.__all__) <= set(dir(fm_toolkit))
+    for name in fm_toolkit.__all__:
+        assert getattr(fm_toolkit, name) is not None
+
+
+def test_type_checking_imports_match_exports() -> None:
+    tree = ast.parse(Path(fm_toolkit.__file__).read_text())
+    guard = next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.If) and ast.unparse(node.test) == "TYPE_CHECKING"
+    )
+    imported = {
+        alias.name: node.module
+        for node in guard.body
+        if isinstance(node, ast.ImportFrom)
+        for alias in node.names
+    }
+
+    assert imported == fm_toolkit._EXPORTS
@@ -1,12 +1,70 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+from urllib.parse import parse_qs, urlparse
+
 import pytest
 
 from fm_toolkit.marketdata import (
+    CachedSpotProvider,
     FrankfurterProvider,
+    HedgedSpotProvider,
     SpotProvider,
+    SpotSnapshot,
+    TokenBucket,
     TwelveDataProvider,
+    build_session,
+    get_live_spots,
     parse_pair,
+    spot_priority,
 )
 
+_STUB_RATES = {"EUR": {"USD": 1.1, "GBP": 0.85}, "USD": {"JPY": 150.0}}
+_SLOW_BASES = {"AUD"}
+
+
+class _StubFrankfurterHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        query = parse_qs(urlparse(self.path).query)
+        base = query["base"][0]
+        symbols = query["symbols"][0].split(",")
+        if base in _SLOW_BASES:
+            time.sleep(1.0)
+        rates = {
+            symbol: _STUB_RATES[base][symbol]
+            for symbol in symbols
+            if symbol in _STUB_RATES.get(base, {})
+        }
+        body = json.dumps({"date": "2026-02-15", "rates": rates}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return None
+
+
+@pytest.fixture
+def stub_frankfurter_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubFrankfurterHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/v1/latest"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class _FakeSession:
+    def __init__(self, get) -> None:
+        self.get = get
+
 
 def test_parse_pair_common_cases() -> None:
     assert parse_pair("EUR/USD") == ("EUR", "USD")
@@ -20,7 +78,7 @@ def test_parse_pair_common_cases() -> None:
         parse_pair("")
 
 
-def test_frankfurter_provider_mocked_response(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_frankfurter_provider_mocked_response() -> None:
     captured: dict[str, object] = {}
 
     class MockResponse:
@@ -38,9 +96,7 @@ def test_frankfurter_provider_mocked_response(monkeypatch: pytest.MonkeyPatch) -
         captured["timeout"] = timeout
         return MockResponse()
 
-    monkeypatch.setattr("fm_toolkit.marketdata.requests.get", fake_get)
-
-    provider = FrankfurterProvider(timeout=(1.0, 2.0))
+    provider = FrankfurterProvider(timeout=(1.0, 2.0), session=_FakeSession(fake_get))
     spot, ts, source = provider.get_spot("EUR", "USD")
 
     assert captured["url"] == "https://api.frankfurter.dev/v1/latest"
@@ -51,9 +107,7 @@ def test_frankfurter_provider_mocked_response(monkeypatch: pytest.MonkeyPatch) -
     assert source == "Frankfurter"
 
 
-def test_frankfurter_provider_inverts_when_inverse_exists(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
+def test_frankfurter_provider_inverts_when_inverse_exists() -> None:
     calls: list[dict[str, str]] = []
 
     class MockResponse:
@@ -76,9 +130,7 @@ def test_frankfurter_provider_inverts_when_inverse_exists(
             return MockResponse({"date": "2026-02-15", "rates": {"EUR": 0.8}})
         raise AssertionError(f"unexpected params: {params}")
 
-    monkeypatch.setattr("fm_toolkit.marketdata.requests.get", fake_get)
-
-    provider = FrankfurterProvider()
+    provider = FrankfurterProvider(session=_FakeSession(fake_get))
     spot, ts, source = provider.get_spot("EUR", "USD")
 
     assert calls == [
@@ -107,9 +159,7 @@ def test_twelvedata_falls_back_when_key_missing() -> None:
     assert source == "MockFallback (fallback)"
 
 
-def test_twelvedata_inverts_when_direct_pair_missing(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
+def test_twelvedata_inverts_when_direct_pair_missing() -> None:
     class MockResponse:
         def __init__(self, payload: dict[str, object]) -> None:
             self.payload = payload
@@ -129,11 +179,458 @@ def test_twelvedata_inverts_when_direct_pair_missing(
             return MockResponse({"rate": "0.8000", "timestamp": 1739606400})
         raise AssertionError(f"unexpected params: {params}")
 
-    monkeypatch.setattr("fm_toolkit.marketdata.requests.get", fake_get)
-
-    provider = TwelveDataProvider(api_key="test-key")
+    provider = TwelveDataProvider(api_key="test-key", session=_FakeSession(fake_get))
     spot, ts, source = provider.get_spot("EUR", "USD")
 
     assert spot == pytest.approx(1.25)
     assert source == "Twelve Data (inverted)"
     assert ts.endswith("+00:00")
+
+
+def test_build_session_pools_and_retries() -> None:
+    session = build_session(pool_size=4, retries=2)
+    adapter = session.get_adapter("https://api.frankfurter.dev/v1/latest")
+
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 2
+    assert adapter.max_retries.connect == 2
+    assert adapter.max_retries.read == 0
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+def test_twelvedata_shares_session_with_default_fallback() -> None:
+    session = build_session()
+    provider = TwelveDataProvider(api_key="test-key", session=session)
+
+    assert provider.session is session
+    assert provider.fallback_provider.session is session
+
+
+def test_get_live_spots_against_stub_server(stub_frankfurter_url: str) -> None:
+    provider = FrankfurterProvider(
+        endpoint=stub_frankfurter_url, session=build_session(retries=0)
+    )
+
+    results = get_live_spots(
+        ["EUR/USD", "JPY/USD", "EUR/GBP", "AUD/USD", "CHF/SEK"],
+        provider=provider,
+        fallback_provider=_MockFallbackProvider(),
+        max_workers=3,
+        timeout=0.3,
+    )
+
+    assert results["EUR/USD"] == (pytest.approx(1.1), "2026-02-15", "Frankfurter")
+    assert results["JPY/USD"][0] == pytest.approx(1.0 / 150.0)
+    assert results["JPY/USD"][2] == "Frankfurter (inverted)"
+    assert results["EUR/GBP"][0] == pytest.approx(0.85)
+    assert results["AUD/USD"][2] == "MockFallback (fallback)"
+    assert results["CHF/SEK"][2] == "MockFallback (fallback)"
+
+
+def test_get_live_spots_reports_per_pair_errors(stub_frankfurter_url: str) -> None:
+    provider = FrankfurterProvider(
+        endpoint=stub_frankfurter_url, session=build_session(retries=0)
+    )
+
+    results = get_live_spots(
+        ["EUR/USD", "AUD/USD", "EURUSD"], provider=provider, timeout=0.3
+    )
+
+    assert results["EUR/USD"][0] == pytest.approx(1.1)
+    assert isinstance(results["AUD/USD"], TimeoutError)
+    assert isinstance(results["EURUSD"], ValueError)
+
+
+def test_get_live_spots_falls_back_when_primary_hangs_on_every_worker() -> None:
+    # More pairs than workers, all hanging past the timeout: the abandoned
+    # calls must not starve the fallback or the pairs still waiting to start.
+    results = get_live_spots(
+        ["EUR/USD", "GBP/USD", "USD/JPY", "AUD/USD"],
+        provider=_SleepyProvider(2.0, 1.1, "Hung"),
+        fallback_provider=_SleepyProvider(0.0, 1.2, "Fast"),
+        max_workers=2,
+        timeout=0.2,
+    )
+
+    assert {result[2] for result in results.values()} == {"Fast (fallback)"}
+
+
+def test_get_live_spots_bounds_calls_left_running_after_timeout() -> None:
+    hung = _SleepyProvider(1.0, 1.1, "Hung")
+
+    results = get_live_spots(
+        [f"EUR/{quote}" for quote in ("USD", "GBP", "JPY", "CHF", "AUD", "CAD")],
+        provider=hung,
+        fallback_provider=_SleepyProvider(0.0, 1.2, "Fast"),
+        max_workers=2,
+        timeout=0.1,
+    )
+
+    assert {result[2] for result in results.values()} == {"Fast (fallback)"}
+    assert hung.calls == 2
+
+
+def test_spot_snapshot_derives_direct_inverse_and_cross() -> None:
+    snapshot = SpotSnapshot(
+        base="EUR", rates={"USD": 1.1, "GBP": 0.85}, timestamp="2026-02-15"
+    )
+
+    assert snapshot.get_spot("EUR", "USD") == (
+        pytest.approx(1.1),
+        "2026-02-15",
+        "Frankfurter",
+    )
+    assert snapshot.get_spot("USD", "EUR")[0] == pytest.approx(1.0 / 1.1)
+    assert snapshot.get_spot("USD", "EUR")[2] == "Frankfurter (inverted)"
+    assert snapshot.get_spot("GBP", "USD")[0] == pytest.approx(1.1 / 0.85)
+    assert snapshot.get_spot("GBP", "USD")[2] == "Frankfurter (cross via EUR)"
+
+    currencies, matrix = snapshot.cross_rates()
+    assert currencies == ["EUR", "USD", "GBP"]
+    assert matrix[2, 1] == pytest.approx(1.1 / 0.85)
+    assert matrix.diagonal() == pytest.approx([1.0, 1.0, 1.0])
+
+    with pytest.raises(RuntimeError):
+        snapshot.get_spot("EUR", "JPY")
+
+
+def test_frankfurter_get_spots_uses_one_request() -> None:
+    calls: list[dict[str, str]] = []
+
+    class MockResponse:
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self) -> dict[str, object]:
+            return {"date": "2026-02-15", "rates": {"USD": 1.1, "GBP": 0.85}}
+
+    def fake_get(
+        url: str, params: dict[str, str], timeout: tuple[float, float]
+    ) -> MockResponse:
+        calls.append(params)
+        return MockResponse()
+
+    provider = FrankfurterProvider(session=_FakeSession(fake_get))
+    results = provider.get_spots(["EUR/USD", "USD/EUR", "GBP/USD", "CHF/USD", "X"])
+
+    assert calls == [{"base": "EUR", "symbols": "CHF,GBP,USD"}]
+    assert results["EUR/USD"][0] == pytest.approx(1.1)
+    assert results["USD/EUR"][2] == "Frankfurter (inverted)"
+    assert results["GBP/USD"][0] == pytest.approx(1.1 / 0.85)
+    assert isinstance(results["CHF/USD"], RuntimeError)
+    assert isinstance(results["X"], ValueError)
+
+
+class _CountingProvider(SpotProvider):
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls = 0
+        self.delay = delay
+        self.fetched = threading.Event()
+        self._lock = threading.Lock()
+
+    def get_spot(self, base: str, quote: str) -> tuple[float, str, str]:
+        with self._lock:
+            self.calls += 1
+            calls = self.calls
+        time.sleep(self.delay)
+        self.fetched.set()
+        return 1.0 + calls / 100, f"t{calls}", "Counting"
+
+
+def test_cached_provider_ttl_and_stale_while_revalidate() -> None:
+    now = [0.0]
+    upstream = _CountingProvider()
+    provider = CachedSpotProvider(
+        upstream, ttl=60.0, stale_ttl=60.0, clock=lambda: now[0]
+    )
+
+    assert provider.get_spot("EUR", "USD")[1] == "t1"
+    now[0] = 30.0
+    assert provider.get_spot("eur", "usd")[1] == "t1"
+    assert upstream.calls == 1
+
+    now[0] = 90.0
+    upstream.fetched.clear()
+    assert provider.get_spot("EUR", "USD")[1] == "t1"
+    assert upstream.fetched.wait(1.0)
+    deadline = time.monotonic() + 1.0
+    while provider.get_spot("EUR", "USD")[1] != "t2":
+        assert time.monotonic() < deadline
+
+    now[0] = 500.0
+    assert provider.get_spot("EUR", "USD")[1] == "t3"
+
+    stats = provider.stats()
+    assert stats.misses == 2
+    assert stats.stale_hits >= 1
+    assert stats.refreshes == 3
+    assert stats.errors == 0
+
+
+def test_cached_provider_collapses_concurrent_misses() -> None:
+    upstream = _CountingProvider(delay=0.2)
+    provider = CachedSpotProvider(upstream)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: provider.get_spot("EUR", "USD"), range(8)))
+
+    assert upstream.calls == 1
+    assert all(result == results[0] for result in results)
+    assert provider.stats().coalesced == 7
+
+
+def test_cached_provider_does_not_cache_errors() -> None:
+    class FailingProvider(SpotProvider):
+        def get_spot(self, base: str, quote: str) -> tuple[float, str, str]:
+            raise RuntimeError("upstream down")
+
+    provider = CachedSpotProvider(FailingProvider())
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="upstream down"):
+            provider.get_spot("EUR", "USD")
+
+    assert provider.stats().errors == 2
+
+
+class _SleepyProvider(SpotProvider):
+    def __init__(self, delay: float, spot: float, source: str) -> None:
+        self.delay = delay
+        self.spot = spot
+        self.source = source
+        self.calls = 0
+
+    def get_spot(self, base: str, quote: str) -> tuple[float, str, str]:
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.spot <= 0:
+            raise RuntimeError(f"{self.source} failed")
+        return self.spot, "2026-02-15", self.source
+
+
+def test_hedged_provider_skips_hedge_when_primary_is_fast() -> None:
+    fallback = _SleepyProvider(0.0, 1.2, "Slowish")
+    provider = HedgedSpotProvider(
+        _SleepyProvider(0.0, 1.1, "Fast"), fallback, hedge_delay=0.5
+    )
+
+    assert provider.get_spot("EUR", "USD") == (1.1, "2026-02-15", "Fast")
+    assert fallback.calls == 0
+
+
+def test_hedged_provider_fallback_wins_against_slow_primary() -> None:
+    provider = HedgedSpotProvider(
+        _SleepyProvider(1.0, 1.1, "Slow"),
+        _SleepyProvider(0.0, 1.2, "Quick"),
+        hedge_delay=0.05,
+    )
+
+    start = time.perf_counter()
+    spot, _, source = provider.get_spot("EUR", "USD")
+
+    assert time.perf_counter() - start < 0.5
+    assert spot == 1.2
+    assert source == "Quick (hedged)"
+    provider.close()
+
+
+def test_hedged_provider_hedges_do_not_queue_behind_stalled_primaries() -> None:
+    provider = HedgedSpotProvider(
+        _SleepyProvider(1.5, 1.1, "Slow"),
+        _SleepyProvider(0.0, 1.2, "Quick"),
+        hedge_delay=0.05,
+        max_workers=4,
+    )
+
+    def timed_call(_: int) -> tuple[float, str]:
+        start = time.perf_counter()
+        source = provider.get_spot("EUR", "USD")[2]
+        return time.perf_counter() - start, source
+
+    with ThreadPoolExecutor(max_workers=8) as callers:
+        outcomes = list(callers.map(timed_call, range(8)))
+
+    assert {source for _, source in outcomes} == {"Quick (hedged)"}
+    assert max(elapsed for elapsed, _ in outcomes) < 1.0
+    provider.close()
+
+
+def test_hedged_provider_uses_fallback_on_failure_and_reports_both_errors() -> None:
+    provider = HedgedSpotProvider(
+        _SleepyProvider(0.0, -1.0, "Primary"),
+        _SleepyProvider(0.0, 1.2, "Backup"),
+        hedge_delay=5.0,
+    )
+    assert provider.get_spot("EUR", "USD")[2] == "Backup (hedged)"
+
+    failing = HedgedSpotProvider(
+        _SleepyProvider(0.0, -1.0, "Primary"),
+        _SleepyProvider(0.0, -1.0, "Backup"),
+        hedge_delay=0.0,
+    )
+    with pytest.raises(RuntimeError, match="All providers failed for EUR/USD"):
+        failing.get_spot("EUR", "USD")
+
+
+def test_token_bucket_refills_over_time() -> None:
+    now = [0.0]
+    bucket = TokenBucket(capacity=2, refill_per_second=0.5, clock=lambda: now[0])
+
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    now[0] = 1.0
+    assert not bucket.try_acquire()
+    now[0] = 2.0
+    assert bucket.try_acquire()
+    now[0] = 100.0
+    assert bucket.available == pytest.approx(2.0)
+
+
+def test_token_bucket_timeout_uses_the_injected_clock() -> None:
+    ticks = iter(range(0, 10_000, 10))
+    bucket = TokenBucket(capacity=1, refill_per_second=1e-3, clock=lambda: next(ticks))
+    assert bucket.try_acquire()
+
+    # Each clock read jumps 10s, so the 5s timeout lapses on the bucket's
+    # clock without any real waiting.
+    start = time.perf_counter()
+    assert not bucket.acquire(timeout=5.0)
+    assert time.perf_counter() - start < 1.0
+
+
+def test_token_bucket_serves_higher_priority_waiters_first() -> None:
+    bucket = TokenBucket(capacity=1, refill_per_second=20.0)
+    assert bucket.try_acquire()
+    order: list[str] = []
+
+    def take(name: str, priority: int) -> None:
+        assert bucket.acquire(timeout=2.0, priority=priority)
+        order.append(name)
+
+    low = threading.Thread(target=take, args=("low", 0))
+    high = threading.Thread(target=take, args=("high", 10))
+    low.start()
+    time.sleep(0.01)
+    high.start()
+    low.join()
+    high.join()
+
+    assert order == ["high", "low"]
+
+
+def test_twelvedata_spills_to_fallback_when_rate_limited() -> None:
+    calls: list[str] = []
+
+    class MockResponse:
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self) -> dict[str, object]:
+            return {"status": "error", "message": "pair not available"}
+
+    def fake_get(
+        url: str, params: dict[str, str], timeout: tuple[float, float]
+    ) -> MockResponse:
+        calls.append(params["symbol"])
+        return MockResponse()
+
+    provider = TwelveDataProvider(
+        api_key="test-key",
+        session=_FakeSession(fake_get),
+        fallback_provider=_MockFallbackProvider(),
+        rate_limiter=TokenBucket(capacity=1, refill_per_second=1e-6),
+    )
+
+    assert provider.get_spot("EUR", "USD")[2] == "MockFallback (fallback)"
+    assert provider.get_spot("GBP", "USD")[2] == "MockFallback (fallback)"
+    assert calls == ["EUR/USD"]
+
+
+def test_spot_priority_puts_background_lookups_behind_interactive_ones() -> None:
+    calls: list[str] = []
+
+    class MockResponse:
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self) -> dict[str, object]:
+            return {"rate": 1.1, "timestamp": 0}
+
+    def fake_get(
+        url: str, params: dict[str, str], timeout: tuple[float, float]
+    ) -> MockResponse:
+        calls.append(params["symbol"])
+        return MockResponse()
+
+    bucket = TokenBucket(capacity=1, refill_per_second=20.0)
+    provider = TwelveDataProvider(
+        api_key="test-key",
+        session=_FakeSession(fake_get),
+        fallback_provider=_MockFallbackProvider(),
+        rate_limiter=bucket,
+        rate_limit_wait=2.0,
+    )
+    assert bucket.try_acquire()
+
+    def background() -> None:
+        with spot_priority(-1):
+            provider.get_spot("GBP", "USD")
+
+    refresh = threading.Thread(target=background)
+    refresh.start()
+    time.sleep(0.01)
+    assert provider.get_spot("EUR", "USD")[2] == "Twelve Data"
+    refresh.join()
+
+    assert calls == ["EUR/USD", "GBP/USD"]
+
+
+def test_cached_provider_refreshes_at_refresh_priority() -> None:
+    from fm_toolkit.marketdata import _call_priority
+
+    seen: list[int | None] = []
+
+    class RecordingProvider(SpotProvider):
+        def get_spot(self, base: str, quote: str) -> tuple[float, str, str]:
+            seen.append(_call_priority.get())
+            return 1.1, "2026-02-15", "Test"
+
+    now = [0.0]
+    provider = CachedSpotProvider(
+        RecordingProvider(), ttl=1.0, clock=lambda: now[0], refresh_priority=-5
+    )
+    provider.get_spot("EUR", "USD")
+    now[0] = 2.0
+    provider.get_spot("EUR", "USD")
+    for _ in range(200):
+        if len(seen) == 2:
+            break
+        time.sleep(0.005)
+
+    assert seen == [None, -5]
+
+
+def test_twelvedata_coalesces_concurrent_requests_for_a_pair() -> None:
+    calls: list[str] = []
+
+    class MockResponse:
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self) -> dict[str, object]:
+            return {"rate": "1.1", "timestamp": 1739606400}
+
+    def fake_get(
+        url: str, params: dict[str, str], timeout: tuple[float, float]
+    ) -> MockResponse:
+        calls.append(params["symbol"])
+        time.sleep(0.2)
+        return MockResponse()
+
+    provider = TwelveDataProvider(api_key="test-key", session=_FakeSession(fake_get))
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        results = list(pool.map(lambda _: provider.get_spot("EUR", "USD"), range(6)))
+
+    assert calls == ["EUR/USD"]
+    assert {result[0] for result in results} == {1.1}
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from fm_toolkit.curves import ZeroCurve
+from fm_toolkit.portfolio import Portfolio
+from fm_toolkit.swaps import VanillaSwap, swap_pv
+
+
+def test_portfolio_groups_fx_forwards_by_pair() -> None:
+    book = Portfolio()
+    book.add_fx_forwards(
+        ["a", "b", "c", "d"],
+        ["EUR/USD", "USD/JPY", "EUR/USD", "USD/JPY"],
+        [1e6, 2e6, 3e6, 4e6],
+        [1.10, 150.0, 1.12, 148.0],
+        [0.5, 1.0, 2.0, 0.25],
+    )
+    book.add_fx_forward("e", "GBP/USD", 5e5, 1.27, 1.0)
+
+    slices = book.fx_forward_slices()
+
+    assert len(book) == 5
+    assert sorted(slices) == ["EUR/USD", "GBP/USD", "USD/JPY"]
+    assert slices["EUR/USD"].trade_ids == ["a", "c"]
+    np.testing.assert_array_equal(slices["USD/JPY"].strike, [150.0, 148.0])
+    assert book.fx_forward_slices() is slices
+
+
+def test_portfolio_remove_keeps_columns_consistent() -> None:
+    book = Portfolio(dtype=np.float32)
+    ids = list(range(3000))
+    book.add_fx_forwards(
+        ids,
+        ["EUR/USD"] * len(ids),
+        np.arange(1, 3001, dtype=float),
+        np.full(len(ids), 1.1),
+        np.full(len(ids), 1.0),
+    )
+
+    book.remove(0)
+    book.remove(1500)
+
+    eur_usd = book.fx_forward_slices()["EUR/USD"]
+    assert 0 not in book and 1500 not in book
+    assert len(eur_usd.trade_ids) == 2998
+    notional_by_id = dict(zip(eur_usd.trade_ids, eur_usd.notional_base))
+    assert notional_by_id[2999] == pytest.approx(3000.0)
+    assert notional_by_id[1501] == pytest.approx(1502.0)
+    assert eur_usd.notional_base.dtype == np.float32
+    with pytest.raises(KeyError):
+        book.remove(0)
+
+
+def test_portfolio_swaps_round_trip_and_reject_duplicate_ids() -> None:
+    book = Portfolio()
+    swap = VanillaSwap(10_000_000, 0.03, 5, payments_per_year=2, pay_fixed=False)
+    book.add_swap("s1", swap, curve="USD-SOFR")
+    book.add_fx_forward("f1", "EUR/USD", 1e6, 1.1, 1.0)
+
+    assert book.swap_slices()["USD-SOFR"].to_swaps() == [swap]
+    with pytest.raises(ValueError):
+        book.add_fx_forward("s1", "EUR/USD", 1e6, 1.1, 1.0)
+    with pytest.raises(ValueError):
+        book.add_swap("f1", swap)
+
+
+def test_float32_portfolio_keeps_swap_maturities_exact() -> None:
+    curve = ZeroCurve.flat(0.03)
+    swap = VanillaSwap(10_000_000, 0.03, 7 / 12, payments_per_year=12)
+    book = Portfolio(dtype=np.float32)
+    book.add_swap("s1", swap)
+
+    (restored,) = book.swap_slices()["default"].to_swaps()
+    assert restored.maturity_years == swap.maturity_years
+    # Notional and fixed rate are float32, so allow their rounding only.
+    assert swap_pv(restored, curve) == pytest.approx(swap_pv(swap, curve), abs=0.1)
+
+
+def test_add_fx_forwards_rejects_mismatched_pairs() -> None:
+    book = Portfolio()
+
+    with pytest.raises(ValueError, match="pairs"):
+        book.add_fx_forwards(["a", "b"], ["EUR/USD"], [1e6, 2e6], [1.1, 1.1], [1, 1])
+    assert book.fx_forward_count == 0
+    assert book._pairs.labels == []
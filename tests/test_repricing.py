@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from fm_toolkit.curves import ZeroCurve
+from fm_toolkit.fx_forwards import FxMarket, price_fx_forwards
+from fm_toolkit.portfolio import Portfolio
+from fm_toolkit.repricing import FxSpotRepricer
+
+
+def _book() -> Portfolio:
+    book = Portfolio()
+    book.add_fx_forwards(
+        ["a", "b", "c"],
+        ["EUR/USD", "USD/JPY", "EUR/USD"],
+        [1e6, 2e6, 3e6],
+        [1.10, 150.0, 1.12],
+        [0.5, 1.0, 2.0],
+    )
+    return book
+
+
+def test_spot_ticks_match_full_reprice() -> None:
+    usd = ZeroCurve.from_tenors(["3M", "1Y", "2Y"], [0.045, 0.043, 0.04])
+    eur = ZeroCurve.from_tenors(["3M", "1Y", "2Y"], [0.03, 0.029, 0.028])
+    jpy = ZeroCurve.flat(0.002)
+    repricer = FxSpotRepricer(_book())
+    repricer.update_markets(
+        {
+            "EUR/USD": FxMarket(1.10, usd, eur),
+            "USD/JPY": FxMarket(150.0, jpy, usd),
+        }
+    )
+
+    eur_usd_pv = repricer.on_spot("EUR/USD", 1.0875)
+
+    _, expected = price_fx_forwards(
+        [1e6, 3e6],
+        [1.10, 1.12],
+        1.0875,
+        maturity_years=[0.5, 2.0],
+        domestic_curve=usd,
+        foreign_curve=eur,
+    )
+    np.testing.assert_allclose(repricer.trade_pvs("EUR/USD"), expected, rtol=1e-12)
+    assert eur_usd_pv == pytest.approx(expected.sum(), rel=1e-12)
+    assert repricer.book_pv() == pytest.approx(
+        eur_usd_pv + repricer.pair_pv("USD/JPY"), rel=1e-12
+    )
+
+
+def test_curve_update_only_recomputes_changed_leg() -> None:
+    usd = ZeroCurve.flat(0.04)
+    eur = ZeroCurve.flat(0.03)
+    repricer = FxSpotRepricer(_book())
+    repricer.update_curves("EUR/USD", domestic_curve=usd, foreign_curve=eur)
+    repricer.on_spot("EUR/USD", 1.1)
+    spot_coeff = repricer._pairs["EUR/USD"].spot_coeff
+
+    repricer.update_curves("EUR/USD", domestic_curve=usd.shifted(10.0))
+
+    assert repricer._pairs["EUR/USD"].spot_coeff is spot_coeff
+    assert "USD/JPY" not in repricer.pair_pvs()
+    with pytest.raises(ValueError):
+        repricer.update_curves("USD/JPY", domestic_curve=usd)
@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+
+from fm_toolkit.curves import ZeroCurve
+from fm_toolkit.fx_forwards import price_fx_forward
+from fm_toolkit.risk import (
+    fx_forward_key_rate_dv01s,
+    swap_key_rate_dv01s,
+    swap_risk,
+)
+from fm_toolkit.swaps import VanillaSwap, swap_pv, swap_pv01
+
+
+def _unit_bump(curve: ZeroCurve, pillar: int, bump_bp: float = 1.0) -> np.ndarray:
+    bumps = np.zeros(curve.times.size)
+    bumps[pillar] = bump_bp
+    return bumps
+
+
+def test_swap_key_rate_dv01s_match_pillar_bump_and_reprice() -> None:
+    curve = ZeroCurve(
+        times=[1, 2, 3, 5, 10], zero_rates=[0.02, 0.022, 0.024, 0.026, 0.028]
+    )
+    swaps = [
+        VanillaSwap(10_000_000, 0.03, 5, payments_per_year=2, pay_fixed=True),
+        VanillaSwap(5_000_000, 0.021, 2.5, payments_per_year=4, pay_fixed=False),
+        VanillaSwap(1_000_000, 0.027, 12, payments_per_year=1, pay_fixed=True),
+    ]
+
+    matrix = swap_key_rate_dv01s(swaps, curve)
+
+    assert matrix.shape == (3, 5)
+    for i, swap in enumerate(swaps):
+        base_pv = swap_pv(swap, curve)
+        for j in range(curve.times.size):
+            bumped = curve.shifted(_unit_bump(curve, j))
+            expected = swap_pv(swap, bumped) - base_pv
+            assert matrix[i, j] == pytest.approx(expected, rel=1e-9, abs=1e-9)
+        assert matrix[i].sum() == pytest.approx(swap_pv01(swap, curve), rel=1e-3)
+
+
+def test_swap_risk_matches_bump_and_reprice() -> None:
+    curve = ZeroCurve(
+        times=[0.5, 1, 2, 5, 10, 30],
+        zero_rates=[0.02, 0.021, 0.025, 0.03, 0.032, 0.035],
+    )
+    swaps = [
+        VanillaSwap(10_000_000, 0.03, 5, payments_per_year=2, pay_fixed=True),
+        VanillaSwap(5_000_000, 0.021, 2.5, payments_per_year=4, pay_fixed=False),
+        VanillaSwap(1_000_000, 0.027, 40, payments_per_year=12, pay_fixed=True),
+    ]
+
+    risk = swap_risk(swaps, curve, bump_bp=1.0)
+    assert risk.key_rate_dv01s == pytest.approx(
+        swap_key_rate_dv01s(swaps, curve), rel=1e-12
+    )
+    for i, swap in enumerate(swaps):
+        base_pv = swap_pv(swap, curve)
+        parallel = swap_pv(swap, curve.shifted(1.0)) - base_pv
+
+        assert risk.pv01[i] == pytest.approx(parallel, rel=1e-9)
+        assert swap_pv01(swap, curve) == pytest.approx(parallel, rel=1e-9)
+        assert swap_pv01(swap, curve, bump_bp=-25.0) == pytest.approx(
+            swap_pv(swap, curve.shifted(-25.0)) - base_pv, rel=1e-9
+        )
+
+    empty = swap_risk([], curve)
+    assert empty.pv01.shape == (0,)
+    assert empty.key_rate_dv01s.shape == (0, 6)
+
+
+def test_fx_forward_key_rate_dv01s_match_pillar_bump_and_reprice() -> None:
+    domestic_curve = ZeroCurve.from_tenors(
+        tenors=["1M", "3M", "6M", "1Y", "2Y"],
+        zero_rates=[0.024, 0.025, 0.026, 0.027, 0.028],
+    )
+    foreign_curve = ZeroCurve.from_tenors(
+        tenors=["3M", "1Y", "5Y"], zero_rates=[0.015, 0.017, 0.02]
+    )
+    notionals = np.array([1_000_000.0, 2_500_000.0])
+    strikes = np.array([1.11, 1.13])
+    maturities = np.array([0.75, 3.0])
+    spot = 1.10
+
+    domestic, foreign = fx_forward_key_rate_dv01s(
+        notionals,
+        strikes,
+        spot,
+        maturities,
+        domestic_curve=domestic_curve,
+        foreign_curve=foreign_curve,
+    )
+
+    assert domestic.shape == (2, 5)
+    assert foreign.shape == (2, 3)
+    for i in range(2):
+        args = dict(
+            notional_base=notionals[i],
+            strike=strikes[i],
+            spot=spot,
+            maturity_years=maturities[i],
+        )
+        base_pv = price_fx_forward(
+            **args, domestic_curve=domestic_curve, foreign_curve=foreign_curve
+        )
+        for j in range(domestic_curve.times.size):
+            bumped = domestic_curve.shifted(_unit_bump(domestic_curve, j))
+            expected = (
+                price_fx_forward(
+                    **args, domestic_curve=bumped, foreign_curve=foreign_curve
+                )
+                - base_pv
+            )
+            assert domestic[i, j] == pytest.approx(expected, rel=1e-8, abs=1e-8)
+        for j in range(foreign_curve.times.size):
+            bumped = foreign_curve.shifted(_unit_bump(foreign_curve, j))
+            expected = (
+                price_fx_forward(
+                    **args, domestic_curve=domestic_curve, foreign_curve=bumped
+                )
+                - base_pv
+            )
+            assert foreign[i, j] == pytest.approx(expected, rel=1e-8, abs=1e-8)
@@ -1,8 +1,9 @@
+import numpy as np
 import pytest
 
 from fm_toolkit.curves import ZeroCurve
-from fm_toolkit.fx_forwards import forward_rate
-from fm_toolkit.scenarios import fx_forward_scenarios
+from fm_toolkit.fx_forwards import forward_rate, price_fx_forward
+from fm_toolkit.scenarios import fx_forward_scenario_grid, fx_forward_scenarios
 
 
 def test_fx_forward_scenarios_table_shape_and_names() -> None:
@@ -82,3 +83,69 @@ def test_fx_forward_scenarios_spot_pnl_direction() -> None:
     assert spot_up_pnl > 0.0
     assert spot_down_pnl < 0.0
     assert abs(spot_up_pnl) == pytest.approx(abs(spot_down_pnl), rel=1e-4)
+
+
+def test_fx_forward_scenario_grid_matches_full_reprice() -> None:
+    domestic_curve = ZeroCurve.from_tenors(
+        tenors=["1M", "3M", "6M", "1Y", "2Y"],
+        zero_rates=[0.024, 0.025, 0.026, 0.027, 0.028],
+    )
+    foreign_curve = ZeroCurve.from_tenors(
+        tenors=["1M", "3M", "6M", "1Y", "2Y"],
+        zero_rates=[0.015, 0.016, 0.017, 0.018, 0.019],
+    )
+    notionals = np.array([1_000_000.0, 3_000_000.0])
+    strikes = np.array([1.11, 1.13])
+    maturities = np.array([0.5, 1.5])
+
+    df = fx_forward_scenario_grid(
+        notional_base=notionals,
+        strike=strikes,
+        spot=1.10,
+        maturity_years=maturities,
+        domestic_curve=domestic_curve,
+        foreign_curve=foreign_curve,
+        spot_shocks_pct=np.linspace(-2.0, 2.0, 50),
+        domestic_bumps_bps=np.linspace(-50.0, 50.0, 50),
+        foreign_bumps_bps=np.linspace(-50.0, 50.0, 50),
+    )
+
+    assert len(df) == 50**3
+    row = df.iloc[12_345]
+    expected = sum(
+        price_fx_forward(
+            notional_base=notionals[i],
+            strike=strikes[i],
+            spot=1.10 * (1.0 + row["Spot shock (pct)"] / 100.0),
+            maturity_years=maturities[i],
+            domestic_curve=domestic_curve.shifted(row["Domestic curve shock (bps)"]),
+            foreign_curve=foreign_curve.shifted(row["Foreign curve shock (bps)"]),
+        )
+        for i in range(2)
+    )
+    base = sum(
+        price_fx_forward(
+            notional_base=notionals[i],
+            strike=strikes[i],
+            spot=1.10,
+            maturity_years=maturities[i],
+            domestic_curve=domestic_curve,
+            foreign_curve=foreign_curve,
+        )
+        for i in range(2)
+    )
+    assert row["PV (domestic)"] == pytest.approx(expected, rel=1e-10)
+    assert row["PnL vs base"] == pytest.approx(expected - base, rel=1e-8)
+
+    with pytest.raises(ValueError):
+        fx_forward_scenario_grid(
+            notional_base=notionals,
+            strike=strikes,
+            spot=1.10,
+            maturity_years=maturities,
+            domestic_curve=domestic_curve,
+            foreign_curve=foreign_curve,
+            spot_shocks_pct=[1.0, 2.0],
+            domestic_bumps_bps=[0.0],
+            cartesian=False,
+        )
@@ -0,0 +1,75 @@
+import dataclasses
+from datetime import date
+
+import pytest
+
+from fm_toolkit.curves import ZeroCurve
+from fm_toolkit.schedules import adjust, build_schedule, period_times, year_fraction
+from fm_toolkit.swaps import VanillaSwap, scheduled_swap_pv, swap_pv
+
+
+def test_day_counts_and_rolls() -> None:
+    start, end = date(2024, 1, 31), date(2024, 7, 31)
+
+    assert year_fraction(start, end, "ACT/360") == pytest.approx(182 / 360)
+    assert year_fraction(start, end, "ACT/365F") == pytest.approx(182 / 365)
+    assert year_fraction(start, end, "30/360") == pytest.approx(0.5)
+    assert year_fraction(date(2024, 2, 28), date(2024, 3, 31), "30/360") == (
+        pytest.approx(33 / 360)
+    )
+
+    saturday = date(2024, 8, 31)
+    assert adjust(saturday, "following") == date(2024, 9, 2)
+    assert adjust(saturday, "modified_following") == date(2024, 8, 30)
+    assert adjust(saturday, "preceding") == date(2024, 8, 30)
+    assert adjust(saturday, "unadjusted") == saturday
+    with pytest.raises(ValueError, match="day_count"):
+        year_fraction(start, end, "ACT/ACT")
+
+
+def test_build_schedule_dates_and_memoization() -> None:
+    schedule = build_schedule("2024-01-31", "2025-01-31", 4, day_count="30/360")
+
+    assert schedule.payment_dates == (
+        date(2024, 4, 30),
+        date(2024, 7, 31),
+        date(2024, 10, 31),
+        date(2025, 1, 31),
+    )
+    assert schedule.accruals.sum() == pytest.approx(1.0)
+    assert not schedule.times.flags.writeable
+    assert build_schedule(
+        date(2024, 1, 31), date(2025, 1, 31), 4, day_count="30/360"
+    ) is (schedule)
+
+    stub = build_schedule("2024-01-15", "2024-09-01", 2, roll="unadjusted")
+    assert stub.payment_dates == (date(2024, 7, 15), date(2024, 9, 1))
+
+    rebuilt = dataclasses.replace(schedule)
+    assert rebuilt is not schedule
+    assert rebuilt == schedule
+    assert len({schedule, rebuilt, stub}) == 2
+    assert schedule != stub
+
+    with pytest.raises(ValueError, match="payments_per_year"):
+        build_schedule("2024-01-15", "2025-01-15", 5)
+    with pytest.raises(ValueError, match="payments_per_year"):
+        build_schedule("2024-01-15", "2025-01-15", 2.0)
+    with pytest.raises(ValueError, match="after"):
+        build_schedule("2024-01-15", "2024-01-15")
+
+
+def test_scheduled_swap_pv_matches_year_fraction_swap() -> None:
+    curve = ZeroCurve(
+        times=[1, 2, 3, 5, 10], zero_rates=[0.02, 0.022, 0.024, 0.026, 0.028]
+    )
+    schedule = build_schedule(
+        "2025-01-01", "2030-01-01", 2, roll="unadjusted", day_count="ACT/365F"
+    )
+    swap = VanillaSwap(10_000_000, 0.03, 5, payments_per_year=2)
+
+    # Calendar half-years are within a few days of 0.5, so the PVs agree to
+    # within 1bp of notional.
+    dated = scheduled_swap_pv(10_000_000, 0.03, schedule, curve)
+    assert dated == pytest.approx(swap_pv(swap, curve), abs=100)
+    assert period_times(5, 2) is period_times(5.0, 2)
@@ -0,0 +1,187 @@
+import json
+import threading
+from http.client import HTTPConnection
+from typing import Iterator
+
+import pytest
+
+from fm_toolkit.curves import ZeroCurve
+from fm_toolkit.fx_forwards import price_fx_forward
+from fm_toolkit.marketdata import SpotProvider
+from fm_toolkit.server import PricingService, make_server
+from fm_toolkit.swaps import VanillaSwap, swap_pv, swap_pv01
+
+
+class _CountingSpotProvider(SpotProvider):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def get_spot(self, base: str, quote: str) -> tuple[float, str, str]:
+        self.calls += 1
+        return 1.1, "2026-02-15", "Test"
+
+
+@pytest.fixture
+def pricing_server() -> Iterator[tuple[HTTPConnection, _CountingSpotProvider]]:
+    spots = _CountingSpotProvider()
+    server = make_server(port=0, service=PricingService(spot_provider=spots))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    connection = HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+    try:
+        yield connection, spots
+    finally:
+        connection.close()
+        server.shutdown()
+        server.server_close()
+
+
+def _call(
+    connection: HTTPConnection, method: str, path: str, payload: object = None
+) -> tuple[int, dict]:
+    body = None if payload is None else json.dumps(payload)
+    connection.request(method, path, body=body)
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def test_server_prices_fx_forwards_single_and_batch(pricing_server) -> None:
+    connection, spots = pricing_server
+    trade = {"notional_base": 1e6, "strike": 1.12, "maturity_years": 1.0}
+    rates = {"domestic_rate": 0.03, "foreign_rate": 0.015}
+
+    status, single = _call(
+        connection, "POST", "/fx-forward", {**trade, **rates, "spot": 1.1}
+    )
+    assert status == 200
+    assert single["pv"] == pytest.approx(
+        price_fx_forward(1e6, 1.12, 1.1, 0.03, 0.015, 1.0)
+    )
+
+    batch = {"pair": "EUR/USD", **rates, "trades": [trade, {**trade, "strike": 1.0}]}
+    for _ in range(2):
+        status, result = _call(connection, "POST", "/fx-forward", batch)
+    assert status == 200
+    assert [r["pv"] for r in result["results"]] == pytest.approx(
+        [
+            price_fx_forward(1e6, 1.12, 1.1, 0.03, 0.015, 1.0),
+            price_fx_forward(1e6, 1.0, 1.1, 0.03, 0.015, 1.0),
+        ]
+    )
+    assert spots.calls == 1
+
+
+def test_server_swaps_curves_and_errors(pricing_server) -> None:
+    connection, _ = pricing_server
+    status, _ = _call(
+        connection, "PUT", "/curves/usd", {"times": [1, 5], "zero_rates": [0.03, 0.04]}
+    )
+    assert status == 200
+
+    swap = {"notional": 1e7, "fixed_rate": 0.035, "maturity_years": 5}
+    status, result = _call(connection, "POST", "/swap", {**swap, "curve": "usd"})
+    curve = ZeroCurve(times=[1, 5], zero_rates=[0.03, 0.04])
+    expected = VanillaSwap(notional=1e7, fixed_rate=0.035, maturity_years=5)
+    assert status == 200
+    assert result["pv"] == pytest.approx(swap_pv(expected, curve))
+    assert result["pv01"] == pytest.approx(swap_pv01(expected, curve))
+
+    status, health = _call(connection, "GET", "/health")
+    assert health["curves"] == ["default", "usd"]
+    assert health["requests_served"] == 2
+
+    assert _call(connection, "POST", "/swap", {**swap, "curve": "nope"})[0] == 400
+    assert _call(connection, "POST", "/fx-forward", {"spot": 1.1})[0] == 400
+    assert _call(connection, "GET", "/missing")[0] == 404
+
+
+def test_server_scenarios(pricing_server) -> None:
+    connection, _ = pricing_server
+    status, result = _call(
+        connection,
+        "POST",
+        "/scenarios",
+        {
+            "notional_base": 1e6,
+            "strike": 1.12,
+            "maturity_years": 1.0,
+            "spot": 1.1,
+            "domestic_curve": "default",
+            "foreign_curve": "default",
+            "spot_shocks_pct": [-1, 0, 1],
+        },
+    )
+
+    assert status == 200
+    assert len(result["rows"]) == 3
+    pnl = result["columns"].index("PnL vs base")
+    assert result["rows"][1][pnl] == pytest.approx(0.0)
+
+
+def test_server_error_responses_do_not_corrupt_keep_alive(pricing_server) -> None:
+    connection, _ = pricing_server
+
+    status, _ = _call(connection, "POST", "/nope", {"spot": 1.1, "pad": "x" * 512})
+    assert status == 404
+    status, health = _call(connection, "GET", "/health")
+    assert status == 200
+    assert health["status"] == "ok"
+
+
+def test_server_replies_500_on_unexpected_errors() -> None:
+    class _BrokenService(PricingService):
+        def curves(self) -> dict:
+            raise LookupError("boom")
+
+    server = make_server(port=0, service=_BrokenService())
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    connection = HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+    try:
+        status, result = _call(connection, "GET", "/curves")
+        assert status == 500
+        assert "boom" in result["error"]
+        assert _call(connection, "GET", "/health")[0] == 200
+    finally:
+        connection.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_server_rejects_non_boolean_flags_and_non_finite_inputs(pricing_server) -> None:
+    connection, _ = pricing_server
+    swap = {"notional": 1e7, "fixed_rate": 0.035, "maturity_years": 5}
+
+    status, result = _call(connection, "POST", "/swap", {**swap, "pay_fixed": "false"})
+    assert status == 400
+    assert "pay_fixed" in result["error"]
+    trade = {"notional_base": 1e6, "strike": 1.12, "maturity_years": 1.0}
+    status, _ = _call(
+        connection,
+        "POST",
+        "/scenarios",
+        {
+            **trade,
+            "spot": 1.1,
+            "domestic_rate": 0.03,
+            "foreign_rate": 0.01,
+            "cartesian": 0,
+        },
+    )
+    assert status == 400
+
+    status, result = _call(
+        connection,
+        "POST",
+        "/fx-forward",
+        {**trade, "spot": 1.1, "domestic_rate": "nan", "foreign_rate": 0.01},
+    )
+    assert status == 400
+    assert "domestic_rate must be finite" in result["error"]
+
+    connection.request(
+        "POST", "/fx-forward", body=b"", headers={"Content-Length": "-1"}
+    )
+    response = connection.getresponse()
+    assert response.status == 400
+    assert "Content-Length" in json.loads(response.read())["error"]
@@ -1,5 +1,16 @@
+import numpy as np
+import pytest
+
 from fm_toolkit.curves import ZeroCurve
-from fm_toolkit.swaps import VanillaSwap, par_swap_rate, swap_pv, swap_pv01
+from fm_toolkit.portfolio import Portfolio
+from fm_toolkit.swaps import (
+    VanillaSwap,
+    par_rate_surface,
+    par_swap_rate,
+    price_swaps,
+    swap_pv,
+    swap_pv01,
+)
 
 
 def test_par_swap_rate_gives_near_zero_pv() -> None:
@@ -49,3 +60,87 @@ def test_swap_pv01_sign_by_direction() -> None:
 
     assert payer_pv01 > 0
     assert receiver_pv01 < 0
+
+
+def test_price_swaps_matches_scalar_pricing() -> None:
+    curve = ZeroCurve(
+        times=[0.5, 1, 2, 5, 10, 30],
+        zero_rates=[0.02, 0.021, 0.025, 0.03, 0.032, 0.035],
+    )
+    rng = np.random.default_rng(3)
+    swaps = [
+        VanillaSwap(
+            notional=float(rng.uniform(1e6, 1e8)),
+            fixed_rate=float(rng.uniform(0.0, 0.05)),
+            maturity_years=float(rng.integers(1, 31)),
+            payments_per_year=int(rng.choice([1, 2, 4, 12])),
+            pay_fixed=bool(rng.random() < 0.5),
+        )
+        for _ in range(60)
+    ]
+    book = Portfolio()
+    book.add_swaps(list(range(len(swaps))), swaps)
+    trades = book.swap_slices()["default"]
+
+    values = price_swaps(
+        trades.notional,
+        trades.fixed_rate,
+        trades.maturity_years,
+        trades.payments_per_year,
+        trades.pay_fixed,
+        curve=curve,
+    )
+
+    assert values.pv == pytest.approx([swap_pv(s, curve) for s in swaps], abs=1e-6)
+    assert values.pv01 == pytest.approx(
+        [swap_pv01(s, curve) for s in swaps], rel=1e-12, abs=1e-9
+    )
+    assert values.par_rate == pytest.approx(
+        [par_swap_rate(curve, s.maturity_years, s.payments_per_year) for s in swaps]
+    )
+
+
+def test_price_swaps_validates_inputs() -> None:
+    curve = ZeroCurve.flat(0.03)
+
+    with pytest.raises(ValueError, match="integer"):
+        price_swaps(1e6, 0.03, 1.3, 2, curve=curve)
+    with pytest.raises(ValueError, match="notional"):
+        price_swaps([1e6, -1.0], 0.03, 5.0, curve=curve)
+
+
+def test_par_rate_surface_matches_par_swap_rate_and_is_cached() -> None:
+    curve = ZeroCurve(
+        times=[0.5, 1, 2, 5, 10, 30],
+        zero_rates=[0.02, 0.021, 0.025, 0.03, 0.032, 0.035],
+    )
+    surface = par_rate_surface(curve, max_years=50)
+
+    assert surface.frequencies == (1, 2, 4, 12)
+    assert surface.rates[12].shape == (600,)
+    for maturity, frequency in [(1, 1), (2.5, 2), (7.25, 4), (50, 12), (0.25, 4)]:
+        assert surface.quote(maturity, frequency) == pytest.approx(
+            par_swap_rate(curve, maturity, frequency), rel=1e-12
+        )
+
+    same_curve = ZeroCurve(times=curve.times, zero_rates=curve.zero_rates)
+    assert par_rate_surface(same_curve, max_years=50) is surface
+    with pytest.raises(TypeError):
+        surface.rates[1] = surface.rates[2]  # type: ignore[index]
+    with pytest.raises(ValueError):
+        surface.rates[1][0] = 0.0
+
+    with pytest.raises(ValueError, match="integer"):
+        surface.quote(1.3, 2)
+    with pytest.raises(ValueError, match="within"):
+        surface.quote(51, 1)
+    with pytest.raises(ValueError, match="not on surface"):
+        surface.quote(5, 3)
+
+    with pytest.raises(ValueError, match="max_years must be a positive integer"):
+        par_rate_surface(curve, max_years=2.7)  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="payments_per_year"):
+        par_rate_surface(curve, frequencies=(1, 2.5))  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="payments_per_year"):
+        par_rate_surface(curve, frequencies=(True,))
+    assert par_rate_surface(curve, max_years=np.int64(10)).max_years == 10
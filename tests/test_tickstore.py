@@ -0,0 +1,160 @@
+import math
+
+import numpy as np
+import pytest
+
+from fm_toolkit.marketdata import SpotProvider
+from fm_toolkit.tickstore import (
+    TICK_DTYPE,
+    RecordingSpotProvider,
+    ReplaySpotProvider,
+    TickStore,
+    to_ns,
+)
+
+
+def test_to_ns_accepts_strings_datetimes_and_ints() -> None:
+    assert to_ns("1970-01-01T00:00:01Z") == 1_000_000_000
+    assert to_ns("1970-01-01T00:00:01.5z") == 1_500_000_000
+    assert to_ns("2026-02-15") == to_ns("2026-02-15T00:00:00+00:00")
+    assert to_ns(42) == 42
+
+
+def test_tick_store_round_trip_and_range_reads(tmp_path) -> None:
+    store = TickStore(tmp_path)
+    ts = np.arange(1_000, dtype=np.int64) * 1_000
+    store.append_many("EUR/USD", ts, 1.1 + ts * 1e-9, ["Twelve Data"] * ts.size)
+    store.append("GBP/USD", 1.27, "2026-02-15T10:00:00Z", "Frankfurter")
+    store.append("eur/usd", 1.2, 1_000_000, "Frankfurter")
+
+    reopened = TickStore(tmp_path)
+    assert reopened.pairs() == ["EUR/USD", "GBP/USD"]
+    assert len(reopened) == 1_002
+    assert reopened.sources == ["Twelve Data", "Frankfurter"]
+
+    window = reopened.read("EUR/USD", start=10_000, end=20_000)
+    assert isinstance(window.base, np.memmap)
+    assert window.dtype == TICK_DTYPE
+    assert window["ts_ns"].tolist() == list(range(10_000, 20_000, 1_000))
+    assert window["spot"][0] == pytest.approx(1.1 + 1e-5)
+
+    tail = reopened.read("EUR/USD", start=999_000)
+    assert tail["spot"].tolist() == pytest.approx([1.1 + 999e-6, 1.2])
+    assert reopened.sources[tail["source"][-1]] == "Frankfurter"
+    assert reopened.read("USD/JPY").size == 0
+
+
+def test_tick_store_rejects_out_of_order_ticks(tmp_path) -> None:
+    store = TickStore(tmp_path)
+    store.append("EUR/USD", 1.1, 2_000, "Test")
+
+    with pytest.raises(ValueError, match="non-decreasing"):
+        TickStore(tmp_path).append("EUR/USD", 1.1, 1_000, "Test")
+    with pytest.raises(ValueError, match="positive"):
+        store.append("EUR/USD", 0.0, 3_000, "Test")
+
+
+def test_tick_stores_sharing_a_root_agree_on_source_codes(tmp_path) -> None:
+    first, second = TickStore(tmp_path), TickStore(tmp_path)
+    first.append("EUR/USD", 1.1, 1_000, "Twelve Data")
+    second.append("GBP/USD", 1.27, 1_000, "Frankfurter")
+    second.append("EUR/USD", 1.2, 2_000, "Twelve Data")
+    first.append("GBP/USD", 1.28, 2_000, "Frankfurter")
+
+    reopened = TickStore(tmp_path)
+    labels = reopened.sources
+    assert labels == ["Twelve Data", "Frankfurter"]
+    assert [labels[code] for code in reopened.read("EUR/USD")["source"]] == [
+        "Twelve Data",
+        "Twelve Data",
+    ]
+    assert [labels[code] for code in reopened.read("GBP/USD")["source"]] == [
+        "Frankfurter",
+        "Frankfurter",
+    ]
+    assert first.sources == labels
+
+
+def test_tick_stores_sharing_a_root_keep_each_pair_in_order(tmp_path) -> None:
+    first, second = TickStore(tmp_path), TickStore(tmp_path)
+    first.append("EUR/USD", 1.1, 100, "Test")
+    second.append("EUR/USD", 1.2, 300, "Test")
+
+    with pytest.raises(ValueError, match="non-decreasing"):
+        first.append("EUR/USD", 1.3, 200, "Test")
+    first.append("EUR/USD", 1.4, 400, "Test")
+
+    assert first.last_timestamp("EUR/USD") == 400
+    assert TickStore(tmp_path).read("EUR/USD")["ts_ns"].tolist() == [100, 300, 400]
+    assert first.read("EUR/USD", 150, 350)["spot"].tolist() == [1.2]
+
+
+def test_recording_provider_appends_each_fetch(tmp_path) -> None:
+    class StaticProvider(SpotProvider):
+        def get_spot(self, base: str, quote: str) -> tuple[float, str, str]:
+            return 1.1, "2026-02-15", "Static"
+
+    store = TickStore(tmp_path)
+    provider = RecordingSpotProvider(StaticProvider(), store)
+    for _ in range(3):
+        assert provider.get_spot("EUR", "USD") == (1.1, "2026-02-15", "Static")
+
+    ticks = store.read("EUR/USD")
+    assert ticks.size == 3
+    assert np.all(np.diff(ticks["ts_ns"]) >= 0)
+
+
+def test_replay_provider_follows_the_clock(tmp_path) -> None:
+    store = TickStore(tmp_path)
+    second = 1_000_000_000
+    store.append_many("EUR/USD", [0, 10 * second], [1.10, 1.20], ["TD", "TD"])
+    store.append_many("USD/JPY", [5 * second], [150.0], ["FF"])
+
+    now = [0.0]
+    provider = ReplaySpotProvider.from_store(store, speed=2.0, clock=lambda: now[0])
+
+    assert provider.get_spot("EUR", "USD") == (
+        1.10,
+        "1970-01-01T00:00:00+00:00",
+        "Replay (TD)",
+    )
+    with pytest.raises(RuntimeError, match="No replayed tick"):
+        provider.get_spot("USD", "JPY")
+
+    now[0] = 2.5
+    assert provider.get_spot("JPY", "USD")[0] == pytest.approx(1 / 150.0)
+    assert provider.get_spot("JPY", "USD")[2] == "Replay (FF) (inverted)"
+    assert provider.get_spot("EUR", "USD")[0] == 1.10
+    assert not provider.finished
+
+    now[0] = 5.0
+    assert provider.get_spot("EUR", "USD")[0] == 1.20
+    assert provider.finished
+
+
+def test_replay_provider_streams_csv(tmp_path) -> None:
+    path = tmp_path / "ticks.csv"
+    path.write_text(
+        "pair,spot,timestamp,source\n"
+        "EUR/USD,1.1,2026-02-15T10:00:00Z,Twelve Data\n"
+        "GBP/USD,1.27,2026-02-15T10:00:01Z,Twelve Data\n"
+        "EUR/USD,1.2,2026-02-15T10:00:02Z,Frankfurter\n"
+    )
+
+    # A frozen clock gives zero elapsed time, which must not become inf * 0.
+    provider = ReplaySpotProvider.from_csv(path, speed=math.inf, clock=lambda: 0.0)
+
+    assert provider.get_spot("EUR", "USD") == (
+        1.2,
+        "2026-02-15T10:00:02+00:00",
+        "Replay (Frankfurter)",
+    )
+    assert provider.get_spot("GBP", "USD")[0] == 1.27
+
+    path.write_text(
+        "pair,spot,timestamp,source\n"
+        "EUR/USD,1.1,2026-02-15T10:00:02Z,X\n"
+        "EUR/USD,1.2,2026-02-15T10:00:01Z,X\n"
+    )
+    with pytest.raises(ValueError, match="timestamp order"):
+        ReplaySpotProvider.from_csv(path, speed=math.inf).get_spot("EUR", "USD")